@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Tweet Extraction Benchmark: per-element WebDriver calls vs bulk execute_script
+
+Loads saved X list pages (fixtures/x/*.html) in headless Chrome and times one
+harvest sweep both ways - find_elements + parse_tweet per article against a
+single X_EXTRACT_TWEETS_JS call - counting WebDriver round trips and checking
+that both produce identical tweets. A third row times a sweep once every
+article is tagged as harvested (the steady state between scrolls that load
+nothing new).
+
+Fixtures are captured from the logged-in scraper Chrome (started by
+TwitterListScraper.setup_driver, debugging port 9222) after scrolling a list;
+scripts are stripped so the page stays static offline. Without fixtures a
+synthetic page mirroring X's article markup is used.
+
+Usage:
+    python bench_extraction.py
+    python bench_extraction.py --repeat 20 --synthetic 200
+    python bench_extraction.py --save crypto_list     # capture the current page from Chrome on :9222
+"""
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+
+from x_scraper import TwitterListScraper
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "x"
+
+
+# ==================== Fixtures ====================
+
+def save_fixture(name: str, debugger_address: str = "127.0.0.1:9222") -> Path:
+    """Save the page open in the scraper Chrome as a static fixture."""
+    options = Options()
+    options.add_experimental_option("debuggerAddress", debugger_address)
+    driver = webdriver.Chrome(options=options)
+    html = driver.execute_script("return document.documentElement.outerHTML")
+    count = driver.execute_script("return document.querySelectorAll('article[role=\"article\"]').length")
+
+    # Static copy: no scripts, relative links resolve against x.com like the live page
+    html = re.sub(r'<script\b[^>]*>.*?</script>', '', html, flags=re.S | re.I)
+    html = re.sub(r'<head([^>]*)>', r'<head\1><base href="https://x.com/">', html, count=1, flags=re.I)
+
+    FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+    path = FIXTURE_DIR / f"{name}.html"
+    path.write_text(html, encoding='utf-8')
+    print(f"Saved {count} articles to {path}")
+    return path
+
+
+def synthetic_page(n: int) -> str:
+    """List page with n articles in X's markup (quotes, pinned badge, K/M counts, links)."""
+    articles = []
+    for i in range(n):
+        tweet_id = 1850000000000000000 + i
+        author = f"trader{i % 37}"
+        pinned = '<div data-testid="socialContext">Pinned</div>' if i == 0 else ''
+        quote = ''
+        if i % 5 == 0:
+            # Quoted tweet without its own <time>: the outer tweet must win
+            quote = (f'<div data-testid="tweet"><a href="/quoted{i}" role="link">@quoted{i}</a>'
+                     f'<div data-testid="tweetText">quoted text {i}</div></div>')
+        articles.append(f"""
+<article role="article"><div data-testid="tweet">
+  {pinned}
+  <a href="/{author}" role="link">{author}</a>
+  <a href="/{author}/status/{tweet_id}"><time datetime="2025-11-13T{i % 24:02d}:{i % 60:02d}:00.000Z">{i}m</time></a>
+  <div data-testid="tweetText">$BTC setup #{i} breaking out, details
+    <a href="https://t.co/abc{i}">https://t.co/abc{i}</a> <a href="https://x.com/{author}">@{author}</a></div>
+  {quote}
+  <div data-testid="reply" aria-label="{i * 3} Replies. Reply"></div>
+  <div data-testid="retweet" aria-label="{i}.{i % 10}K reposts. Repost"></div>
+  <div data-testid="like">{i % 4}.5M</div>
+</div></article>""")
+    return ('<html><head><base href="https://x.com/"><meta charset="utf-8"></head><body>'
+            + ''.join(articles) + '</body></html>')
+
+
+def load_fixtures(synthetic: int) -> List[Tuple[str, str]]:
+    """(name, file URL) for every saved fixture, or one synthetic page."""
+    paths = sorted(FIXTURE_DIR.glob("*.html")) if FIXTURE_DIR.exists() else []
+    if not paths:
+        path = Path(tempfile.gettempdir()) / f"x_synthetic_{synthetic}.html"
+        path.write_text(synthetic_page(synthetic), encoding='utf-8')
+        print(f"No saved fixtures in {FIXTURE_DIR}; using a synthetic page with {synthetic} articles")
+        paths = [path]
+    return [(path.stem, path.resolve().as_uri()) for path in paths]
+
+
+# ==================== Benchmark ====================
+
+def count_commands(driver: webdriver.Chrome) -> Dict[str, int]:
+    """Count every WebDriver command (one HTTP round trip each) sent through driver."""
+    counter = {'commands': 0}
+    send = driver.execute
+
+    def counted(driver_command, params=None):
+        counter['commands'] += 1
+        return send(driver_command, params)
+
+    driver.execute = counted
+    return counter
+
+
+def per_element_sweep(scraper: TwitterListScraper) -> List[Dict]:
+    articles = scraper.driver.find_elements(By.CSS_SELECTOR, 'article[role="article"]')
+    return [t for t in (scraper.parse_tweet(article) for article in articles) if t]
+
+
+def bulk_sweep(scraper: TwitterListScraper) -> List[Dict]:
+    return [t for t in scraper.extract_tweets_bulk(mark=False) if t]
+
+
+def harvested_sweep(scraper: TwitterListScraper) -> List[Dict]:
+    return [t for t in scraper.extract_tweets_bulk() if t]
+
+
+def run(repeat: int, synthetic: int) -> None:
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    driver = webdriver.Chrome(options=options)
+    counter = count_commands(driver)
+
+    scraper = TwitterListScraper(profile_path=None, list_url=None, list_name="_benchmark")
+    scraper.driver = driver
+
+    print(f"\n{'fixture':<24}{'articles':>9}{'mode':>14}{'ms/sweep':>11}{'calls/sweep':>13}{'tweets/s':>11}")
+    print('-' * 82)
+    try:
+        for name, url in load_fixtures(synthetic):
+            driver.get(url)
+            articles = driver.execute_script("return document.querySelectorAll('article[role=\"article\"]').length")
+
+            results = {}
+            for mode, sweep in (('per-element', per_element_sweep), ('bulk', bulk_sweep),
+                                ('bulk, no new', harvested_sweep)):
+                tweets = sweep(scraper)    # warm-up (tags every article for 'bulk, no new')
+                counter['commands'] = 0
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    tweets = sweep(scraper)
+                elapsed = (time.perf_counter() - start) / repeat
+                results[mode] = (tweets, elapsed, counter['commands'] / repeat)
+                rate = len(tweets) / elapsed if elapsed else 0.0
+                print(f"{name[:23]:<24}{articles:>9}{mode:>14}{elapsed * 1000:>11.1f}"
+                      f"{counter['commands'] / repeat:>13.0f}{rate:>11.0f}")
+
+            slow, fast = results['per-element'], results['bulk']
+            match = slow[0] == fast[0]
+            print(f"{'':<24}{'':>9}{'speedup':>14}{slow[1] / fast[1]:>10.1f}x"
+                  f"{'':>13}  outputs {'match' if match else 'DIFFER'}")
+            if not match:
+                for a, b in zip(slow[0], fast[0]):
+                    if a != b:
+                        diff = {k: (a.get(k), b.get(k)) for k in a if a.get(k) != b.get(k)}
+                        print(f"    first mismatch {a.get('tweet_id')}: {diff}")
+                        break
+                if len(slow[0]) != len(fast[0]):
+                    print(f"    tweet counts differ: {len(slow[0])} vs {len(fast[0])}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help='Timed sweeps per mode and fixture')
+    parser.add_argument('--synthetic', type=int, default=100, help='Articles in the synthetic page (no saved fixtures)')
+    parser.add_argument('--save', metavar='NAME', help='Capture the page open in Chrome on :9222 as fixtures/x/NAME.html')
+    args = parser.parse_args()
+
+    if args.save:
+        save_fixture(args.save)
+    else:
+        run(args.repeat, args.synthetic)
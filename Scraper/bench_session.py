@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Browser Startup Benchmark: Chrome per list vs one reused ChromeSession
+
+Measures what each list pays before it can start scrolling:
+
+- cold:   launch Chrome + attach Selenium + load x.com, open the list, close
+          (the old run_x_scraper flow, once per list)
+- reused: one session started once, every list just navigates
+- crash:  kill the session's Chrome and time ensure() relaunching it
+
+Uses the scraper's Chrome profile, so lists load logged in. Close other Chrome
+windows using Scraper_Profile first (the profile can only be open once).
+
+Usage:
+    python bench_session.py
+    python bench_session.py --lists 8 --port 9230
+    python bench_session.py --url about:blank       # startup cost without X page loads
+"""
+
+import argparse
+import time
+from typing import List
+
+from selenium.webdriver.support.ui import WebDriverWait
+
+from x_scraper import ChromeSession, X_BOOKMARKS_URL, X_CHROME_PROFILE_PATH, X_LISTS
+
+
+def open_list(session: ChromeSession, url: str) -> float:
+    """Navigate the session to a list and wait for the document; returns seconds"""
+    started = time.perf_counter()
+    driver = session.ensure()
+    driver.get(url)
+    WebDriverWait(driver, 30).until(lambda d: d.execute_script("return document.readyState") == "complete")
+    return time.perf_counter() - started
+
+
+def bench_cold(urls: List[str], profile: str, port: int) -> List[float]:
+    """Seconds until each list is loaded when every list starts its own Chrome"""
+    per_list = []
+    for url in urls:
+        session = ChromeSession(profile, debug_port=port)
+        started = time.perf_counter()
+        try:
+            session.start()
+            open_list(session, url)
+            per_list.append(time.perf_counter() - started)
+        finally:
+            session.close()
+    return per_list
+
+
+def bench_reused(urls: List[str], profile: str, port: int) -> List[float]:
+    """Seconds until each list is loaded with one shared session (first list pays the start)"""
+    per_list = []
+    session = ChromeSession(profile, debug_port=port)
+    try:
+        for url in urls:
+            started = time.perf_counter()
+            open_list(session, url)
+            per_list.append(time.perf_counter() - started)
+    finally:
+        session.close()
+    return per_list
+
+
+def bench_crash(url: str, profile: str, port: int) -> float:
+    """Seconds from a killed browser to the list loaded again"""
+    session = ChromeSession(profile, debug_port=port)
+    try:
+        open_list(session, url)
+        if session.chrome_process is None:
+            raise SystemExit(f"Port {port} is served by a Chrome this benchmark did not start; pick another --port")
+        session.chrome_process.kill()
+        session.chrome_process.wait(timeout=10)
+        return open_list(session, url)
+    finally:
+        session.close()
+
+
+def report(name: str, per_list: List[float]) -> None:
+    total = sum(per_list)
+    print(f"{name:<10}{len(per_list):>7}{total:>10.1f}{total / len(per_list):>11.2f}"
+          f"{per_list[0]:>10.2f}{(sum(per_list[1:]) / (len(per_list) - 1)) if len(per_list) > 1 else 0:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lists', type=int, default=len(X_LISTS) + 1, help='Lists opened per mode (cycles through X_LISTS + bookmarks)')
+    parser.add_argument('--url', help='Open this URL instead of the X lists')
+    parser.add_argument('--profile', default=X_CHROME_PROFILE_PATH, help='Chrome user data directory holding Scraper_Profile')
+    parser.add_argument('--port', type=int, default=9230, help='Debugging port (kept off the scraper slots)')
+    args = parser.parse_args()
+
+    targets = [url for _, url in X_LISTS] + [X_BOOKMARKS_URL]
+    urls = [args.url or targets[i % len(targets)] for i in range(args.lists)]
+
+    cold = bench_cold(urls, args.profile, args.port)
+    reused = bench_reused(urls, args.profile, args.port)
+    crash = bench_crash(urls[0], args.profile, args.port)
+
+    print(f"\n{'mode':<10}{'lists':>7}{'total s':>10}{'s/list':>11}{'first':>10}{'rest':>10}")
+    print('-' * 58)
+    report('cold', cold)
+    report('reused', reused)
+    print(f"\nStartup saved per list: {(sum(cold) - sum(reused)) / len(urls):.2f}s "
+          f"({sum(cold) / sum(reused):.1f}x less time to reach the lists)")
+    print(f"Crash recovery (kill Chrome -> list loaded): {crash:.2f}s")
@@ -3,10 +3,18 @@ import re
 import sys
 import time
 import json
+import html
+import base64
+import shutil
+import socket
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from queue import Queue
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -15,6 +23,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.common.exceptions import WebDriverException
 
 # Fix Windows console encoding
 if sys.platform == 'win32':
@@ -51,6 +60,68 @@ X_CUTOFF_HOURS = 24            # used if X_CUTOFF_MODE == "last_24h"
 X_MAX_NO_NEW = 10              # consecutive no-new sweeps before stopping (was 30 - 66% faster)
 X_WAIT_TIMEOUT = 2             # seconds to wait for DOM growth after scroll (was 4 - 50% faster)
 
+# Extraction mode
+X_BULK_EXTRACT = True          # parse all visible tweets in one execute_script call per sweep (False = per-element WebDriver calls)
+X_HARVESTED_ATTR = "data-x-harvested"  # set on article nodes once parsed; later sweeps skip them
+X_CAPTURE_MODE = "graphql"     # "graphql" = read tweets from X's timeline API responses (CDP), "dom" = parse rendered articles
+X_GRAPHQL_GRACE_SWEEPS = 3     # sweeps without any captured timeline response before falling back to DOM parsing
+
+# Parallel scraping (lists + bookmarks)
+X_PARALLEL_LISTS = 4           # browsers scraping at once (1 = one list after another)
+X_DEBUG_PORT = 9222            # slot N uses port X_DEBUG_PORT + N
+
+# Browser sessions: each slot starts Chrome once and navigates between the lists it runs
+X_CHROME_PATH = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
+X_SESSION_RESTARTS = 2         # browser crashes tolerated per list (relaunch + resume)
+X_KEEP_BROWSER = False         # leave the debugging Chrome(s) running after the run; the next run attaches instead of cold-starting
+
+# Walks the articles in the page and returns the raw fields parse_tweet reads, one
+# entry per article (null if it has no time/status link). Selectors mirror the
+# per-element path so both produce identical tweets; counts and ids are normalized
+# in Python (TwitterListScraper.build_tweet) so there is one parser for both.
+# arguments[0]: attribute marking harvested articles - articles carrying it are
+# skipped and parsed ones get it, so each sweep only reads newly inserted nodes.
+# Articles that are still loading (no time/link yet) stay unmarked and are retried.
+# Pass null to parse every article without marking.
+X_EXTRACT_TWEETS_JS = r"""
+const harvested = arguments[0];
+const label = (root, testid) => {
+    const el = root.querySelector('div[data-testid="' + testid + '"]');
+    return el ? (el.getAttribute('aria-label') || el.innerText || '') : '';
+};
+const selector = 'article[role="article"]' + (harvested ? ':not([' + harvested + '])' : '');
+return Array.from(document.querySelectorAll(selector), article => {
+    try {
+        const candidates = article.querySelectorAll('div[data-testid="tweet"]');
+        let target = candidates.length ? candidates[candidates.length - 1] : article;
+        for (let i = candidates.length - 1; i >= 0; i--) {
+            if (candidates[i].querySelector('time')) { target = candidates[i]; break; }
+        }
+        const time = target.querySelector('time');
+        const link = target.querySelector('a[href*="/status/"]');
+        const author = target.querySelector('a[href^="/"][role="link"]');
+        if (!time || !link || !author) return null;
+        const text = target.querySelector('[data-testid="tweetText"]');
+        const raw = {
+            created_at: time.getAttribute('datetime'),
+            status_href: link.href,
+            author_href: author.getAttribute('href'),
+            text: text ? text.innerText : '',
+            reply_label: label(target, 'reply'),
+            retweet_label: label(target, 'retweet'),
+            like_label: label(target, 'like'),
+            urls: Array.from(target.querySelectorAll('[data-testid="tweetText"] a[href^="http"]'), a => a.href),
+            is_pinned: Array.from(target.querySelectorAll('div[data-testid="socialContext"]'))
+                .some(badge => (badge.innerText || '').includes('Pinned'))
+        };
+        if (harvested) article.setAttribute(harvested, '1');
+        return raw;
+    } catch (e) {
+        return null;
+    }
+});
+"""
+
 # ========================================================================
 # UTILITIES
 # ========================================================================
@@ -129,6 +200,8 @@ def archive_old_x_files(output_folder):
             f.replace(archive_folder / f.name)
 
 
+_status_lock = threading.Lock()  # lists finishing in parallel share the status file
+
 def record_scraper_status(scraper_name: str, items_found: int, error_message: str = None):
     """
     Record scraper execution status for verification.
@@ -139,50 +212,399 @@ def record_scraper_status(scraper_name: str, items_found: int, error_message: st
         items_found: Number of items found (0 is valid, means no new content)
         error_message: If scraper failed, error description
     """
-    try:
-        status_dir = Path('../Research/.cache')
-        status_dir.mkdir(parents=True, exist_ok=True)
+    with _status_lock:
+        try:
+            status_dir = Path('../Research/.cache')
+            status_dir.mkdir(parents=True, exist_ok=True)
 
-        today = datetime.now().strftime('%Y-%m-%d')
-        status_file = status_dir / f'scraper_status_{today}.json'
+            today = datetime.now().strftime('%Y-%m-%d')
+            status_file = status_dir / f'scraper_status_{today}.json'
 
-        # Load existing status or create new
-        if status_file.exists():
-            try:
-                status_data = json.loads(status_file.read_text(encoding='utf-8'))
-            except:
+            # Load existing status or create new
+            if status_file.exists():
+                try:
+                    status_data = json.loads(status_file.read_text(encoding='utf-8'))
+                except:
+                    status_data = {}
+            else:
                 status_data = {}
-        else:
-            status_data = {}
-
-        # Record this scraper's status
-        status_data[scraper_name] = {
-            'ran': error_message is None,
-            'items_found': items_found if error_message is None else 0,
-            'error': error_message,
-            'timestamp': datetime.now().isoformat(),
-            'message': 'No new content found' if (error_message is None and items_found == 0) else (error_message or 'Scraper completed successfully')
-        }
 
-        # Write back
-        status_file.write_text(json.dumps(status_data, indent=2), encoding='utf-8')
-    except Exception as e:
-        # Silent failure - never break the scraper because status write failed
+            # Record this scraper's status
+            status_data[scraper_name] = {
+                'ran': error_message is None,
+                'items_found': items_found if error_message is None else 0,
+                'error': error_message,
+                'timestamp': datetime.now().isoformat(),
+                'message': 'No new content found' if (error_message is None and items_found == 0) else (error_message or 'Scraper completed successfully')
+            }
+
+            # Write back
+            status_file.write_text(json.dumps(status_data, indent=2), encoding='utf-8')
+        except Exception as e:
+            # Silent failure - never break the scraper because status write failed
+            pass
+
+def kill_all_chrome():
+    """Kill every Chrome process (frees the profiles and debugging ports before a run)"""
+    try:
+        subprocess.run(['taskkill', '/F', '/IM', 'chrome.exe'],
+                      capture_output=True, timeout=5)
+        time.sleep(2)
+    except Exception:
         pass
 
+def slot_profile_name(slot):
+    """Profile directory for a browser slot: slot 0 uses Scraper_Profile, others a clone of it"""
+    return "Scraper_Profile" if slot == 0 else f"Scraper_Profile_{slot}"
+
+def prepare_slot_profiles(profile_path, slots, refresh=True):
+    """
+    Clone Scraper_Profile (logged-in cookies) for browser slots 1..slots-1
+    Refreshed every run while no Chrome is running (Cookies is locked otherwise);
+    caches are skipped to keep the copy small. refresh=False only creates
+    missing clones (kept browsers may still be running on the others)
+    """
+    base_user_data = Path(profile_path)
+    scraper_profile = base_user_data / "Scraper_Profile"
+    try:
+        if not scraper_profile.exists() and (base_user_data / "Default").exists():
+            shutil.copytree(base_user_data / "Default", scraper_profile)
+    except Exception:
+        pass
+
+    skip = shutil.ignore_patterns('Cache', 'Code Cache', 'GPUCache', 'Service Worker',
+                                  'GrShaderCache', 'ShaderCache', 'Singleton*', '*.lock', 'lockfile')
+    for slot in range(1, slots):
+        clone = base_user_data / slot_profile_name(slot)
+        if clone.exists() and not refresh:
+            continue
+        try:
+            shutil.copytree(scraper_profile, clone, ignore=skip, dirs_exist_ok=True)
+        except Exception as e:
+            print(f"    ⚠ Could not refresh {clone.name}: {e}")
+
+# ========================================================================
+# GRAPHQL TIMELINE PARSING
+# ========================================================================
+
+# Timeline responses the list and bookmarks pages load (initial page + one per scroll)
+X_GRAPHQL_TIMELINE_RE = re.compile(r'/i/api/graphql/[^/]+/(ListLatestTweetsTimeline|Bookmarks)\b')
+X_LIST_ID_RE = re.compile(r'/i/lists/(\d+)')
+
+def graphql_timeline_matches(response_url, page_url):
+    """
+    True if a timeline response belongs to the page being scraped
+    ListLatestTweetsTimeline must carry the page's list id in its `variables`
+    query parameter; Bookmarks responses only count on a page that is not a list.
+    A shared session can still receive responses for the previous list.
+    """
+    match = X_GRAPHQL_TIMELINE_RE.search(response_url or '')
+    if not match:
+        return False
+    page_list = X_LIST_ID_RE.search(page_url or '')
+    if match.group(1) == 'Bookmarks':
+        return page_list is None
+    if page_list is None:
+        return False
+    try:
+        variables = json.loads(parse_qs(urlparse(response_url).query).get('variables', ['{}'])[0])
+    except ValueError:
+        return False
+    return str(variables.get('listId')) == page_list.group(1)
+
+def graphql_created_at(value):
+    """Convert 'Wed Nov 13 10:20:00 +0000 2025' to the <time datetime> format the DOM path stores."""
+    try:
+        dt = datetime.strptime(value, '%a %b %d %H:%M:%S %z %Y')
+    except (TypeError, ValueError):
+        return None
+    return dt.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+def graphql_tweet(result, is_pinned=False):
+    """
+    Convert a tweet_results.result object into a post record
+    Returns None for tombstones, withheld and malformed tweets
+    """
+    if not result:
+        return None
+    if result.get('__typename') == 'TweetWithVisibilityResults':
+        result = result.get('tweet') or {}
+    legacy = result.get('legacy')
+    if not legacy:
+        return None
+
+    # Reposts: like the DOM path, store the original tweet
+    original = (legacy.get('retweeted_status_result') or {}).get('result')
+    if original:
+        return graphql_tweet(original, is_pinned)
+
+    user = ((result.get('core') or {}).get('user_results') or {}).get('result') or {}
+    author = (user.get('core') or {}).get('screen_name') or (user.get('legacy') or {}).get('screen_name')
+    tweet_id = legacy.get('id_str') or result.get('rest_id')
+    if not tweet_id or not author:
+        return None
+
+    # Long posts carry their full text in note_tweet; full_text is truncated
+    note = ((result.get('note_tweet') or {}).get('note_tweet_results') or {}).get('result') or {}
+    text = html.unescape(note.get('text') or legacy.get('full_text') or '')
+    urls = {u.get('expanded_url') for u in (legacy.get('entities') or {}).get('urls', [])}
+
+    return {
+        'tweet_id': tweet_id,
+        'author': author,
+        'permalink': f'https://x.com/{author}/status/{tweet_id}',
+        'created_at': graphql_created_at(legacy.get('created_at')),
+        'text': text.strip(),
+        'reply_count': int(legacy.get('reply_count') or 0),
+        'retweet_count': int(legacy.get('retweet_count') or 0),
+        'like_count': int(legacy.get('favorite_count') or 0),
+        'urls': sorted(u for u in urls if u and 'x.com' not in u),
+        'is_pinned': is_pinned
+    }
+
+def _find_instructions(node):
+    """Locate the timeline instructions list (data.list.tweets_timeline / data.bookmark_timeline_v2 / ...)."""
+    if isinstance(node, dict):
+        if isinstance(node.get('instructions'), list):
+            return node['instructions']
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return []
+    for child in children:
+        found = _find_instructions(child)
+        if found:
+            return found
+    return []
+
+def parse_graphql_timeline(payload):
+    """
+    Extract post records from a ListLatestTweetsTimeline / Bookmarks response
+    Returns tweets in display order; promoted tweets and cursors are skipped
+    """
+    tweets = []
+    for instruction in _find_instructions(payload):
+        kind = instruction.get('type')
+        if kind == 'TimelinePinEntry':
+            entries, pinned = [instruction.get('entry')], True
+        elif kind == 'TimelineAddEntries':
+            entries, pinned = instruction.get('entries') or [], False
+        else:
+            continue
+
+        for entry in entries:
+            content = (entry or {}).get('content') or {}
+            # Single tweets carry itemContent; conversation modules carry items[]
+            items = [content.get('itemContent')] + [
+                (module_item.get('item') or {}).get('itemContent') for module_item in content.get('items') or []
+            ]
+            for item in items:
+                if not item or item.get('itemType') != 'TimelineTweet' or 'promotedMetadata' in item:
+                    continue
+                tweet = graphql_tweet((item.get('tweet_results') or {}).get('result'), pinned)
+                if tweet:
+                    tweets.append(tweet)
+    return tweets
+
+# ========================================================================
+# BROWSER SESSION
+# ========================================================================
+
+class ChromeSession:
+    """
+    One remote-debugging Chrome + attached driver, reused across lists
+
+    Lists navigate in the same tab instead of paying Chrome cold start, profile
+    load and cookie restore each time. ensure() hands out a live driver and
+    relaunches Chrome if it crashed or the session died. If a Chrome is already
+    listening on the port (kept from an earlier run), start() attaches to it.
+    """
+
+    def __init__(self, profile_path, debug_port=9222, profile_name="Scraper_Profile", capture_mode="graphql"):
+        self.profile_path = profile_path
+        self.debug_host = "127.0.0.1"
+        self.debug_port = debug_port
+        self.profile_name = profile_name
+        self.capture_mode = capture_mode
+        self.driver = None
+        self.chrome_process = None  # browser launched by this session (None when attached)
+        self.stats = {'launches': 0, 'attaches': 0, 'reuses': 0, 'restarts': 0, 'startup_seconds': 0.0}
+
+    def port_open(self):
+        """Whether something is listening on the debugging port"""
+        try:
+            with socket.create_connection((self.debug_host, self.debug_port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def start(self):
+        """Launch (or attach to) Chrome and connect Selenium; returns the driver"""
+        started = time.time()
+        print(f'Opening Chrome with {self.profile_name}...')
+        print("    Setting up Chrome...", end=" ", flush=True)
+
+        if self.port_open():
+            self.stats['attaches'] += 1
+        else:
+            self._launch()
+            self.stats['launches'] += 1
+
+        # Connect Selenium to the running Chrome instance
+        options = Options()
+        options.add_experimental_option("debuggerAddress", f"{self.debug_host}:{self.debug_port}")
+        if self.capture_mode == "graphql":
+            # Network events in driver.get_log('performance') - needed for GraphQL capture
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+        try:
+            self.driver = webdriver.Chrome(options=options)
+        except Exception as e:
+            print(f"✗\n    Failed to connect Selenium: {e}")
+            raise
+
+        # Verify we can navigate
+        try:
+            self.driver.get("https://x.com")
+
+            # Wait for page to actually load
+            WebDriverWait(self.driver, 10).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+
+            current_url = self.driver.current_url
+            if "login" in current_url.lower() or "i/flow/login" in current_url:
+                print("✗\n    ⚠ Not logged in - showing login page")
+            else:
+                print("✓")
+        except Exception as e:
+            print(f"✗\n    Navigation error: {e}")
+
+        self.stats['startup_seconds'] += time.time() - started
+        return self.driver
+
+    def _launch(self):
+        """Start Chrome with the profile and remote debugging, wait for the port"""
+        base_user_data = Path(self.profile_path)
+        default_profile = base_user_data / "Default"
+        scraper_profile = base_user_data / self.profile_name
+
+        # Prepare Scraper_Profile (copy from Default if needed)
+        try:
+            if not scraper_profile.exists() and default_profile.exists():
+                shutil.copytree(default_profile, scraper_profile)
+        except Exception:
+            pass
+
+        # Launch Chrome with Scraper_Profile and remote debugging
+        # (output discarded: an unread pipe stalls a long-lived browser once it fills)
+        try:
+            self.chrome_process = subprocess.Popen([
+                X_CHROME_PATH,
+                f'--user-data-dir={scraper_profile}',
+                f'--remote-debugging-port={self.debug_port}'
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except Exception as e:
+            print(f"✗\n    Error: {e}")
+            raise
+
+        # Wait for debugging port to be ready (with retries)
+        for attempt in range(15):
+            if self.port_open():
+                return
+            time.sleep(1)
+
+        print("✗")
+        raise RuntimeError(f"Debugging port {self.debug_port} never became ready after 15 seconds")
+
+    def alive(self):
+        """Whether the driver still talks to a live browser tab"""
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_window_handle
+            return True
+        except Exception:
+            return False
+
+    def ensure(self):
+        """Live driver for the next list - reuses the browser, restarts it after a crash"""
+        if self.driver is None:
+            return self.start()
+        if self.alive():
+            self.stats['reuses'] += 1
+            return self.driver
+        print("    ⚠ Browser session lost - restarting Chrome")
+        return self.restart()
+
+    def restart(self):
+        """Kill whatever is left of the browser and start a fresh one"""
+        self.stats['restarts'] += 1
+        self.close()
+        return self.start()
+
+    def close(self, keep_browser=False):
+        """
+        Detach Selenium and (unless keep_browser) shut the browser down - never fails
+
+        Args:
+            keep_browser: Leave Chrome running on its debugging port for the next run
+        """
+        try:
+            if self.driver and not keep_browser:
+                # Attached sessions (debuggerAddress) leave the browser running after quit()
+                try:
+                    self.driver.execute_cdp_cmd('Browser.close', {})
+                except Exception:
+                    pass
+            if self.driver:
+                try:
+                    self.driver.quit()
+                except Exception as e:
+                    print(f"    ⚠ Error closing driver: {e}")
+            self.driver = None
+
+            if not keep_browser and self.chrome_process and self.chrome_process.poll() is None:
+                if sys.platform == 'win32':
+                    subprocess.run(['taskkill', '/F', '/T', '/PID', str(self.chrome_process.pid)],
+                                 capture_output=True, timeout=5)
+                else:
+                    self.chrome_process.kill()
+                print("    ✓ Force closed Chrome")
+            if not keep_browser:
+                self.chrome_process = None
+                # Let the port close so the next start() launches instead of attaching to a dying browser
+                for _ in range(10):
+                    if not self.port_open():
+                        break
+                    time.sleep(0.5)
+        except Exception as e:
+            print(f"    Error during cleanup: {e}")
+
 # ========================================================================
 # SCRAPER
 # ========================================================================
 
 class TwitterListScraper:
-    def __init__(self, profile_path, list_url, list_name, scroll_interval=0.9, max_posts=0, max_duration=0, existing_posts=None, existing_ids=None):
+    def __init__(self, profile_path, list_url, list_name, scroll_interval=0.9, max_posts=0, max_duration=0, existing_posts=None, existing_ids=None, bulk_extract=True, capture_mode="graphql"):
         self.profile_path = profile_path
         self.list_url = list_url
         self.list_name = list_name
         self.scroll_interval = scroll_interval
         self.max_posts = max_posts
         self.max_duration = max_duration
+        self.bulk_extract = bulk_extract
+        self.capture_mode = capture_mode
         self.driver = None
+        self.session = None
+        self.owns_session = False   # True when setup_driver started the browser for this list only
+
+        # GraphQL capture state (see enable_network_capture)
+        self.graphql_capture = False
+        self.graphql_pending = set()   # timeline request ids still loading
+        self.graphql_responses = 0
+        self.graphql_sweeps = 0
 
         self.seen_ids = set()  # seen in this run
         self.existing_ids = existing_ids if existing_ids else set()
@@ -271,94 +693,41 @@ class TwitterListScraper:
             pass
         return False
 
-    def setup_driver(self):
-        """Set up Chrome with Scraper_Profile + Selenium debugger connection."""
-        import shutil
-        from pathlib import Path
-        import socket
-
-        print('Opening Chrome with Scraper_Profile...')
-
-        # Define paths
-        chrome_path = r"C:\Program Files\Google\Chrome\Application\chrome.exe"
-        base_user_data = Path(self.profile_path)
-        default_profile = base_user_data / "Default"
-        scraper_profile = base_user_data / "Scraper_Profile"
-        debug_host = "127.0.0.1"
-        debug_port = 9222
-
-        # Kill any existing Chrome processes first
-        print("    Setting up Chrome...", end=" ", flush=True)
-        try:
-            subprocess.run(['taskkill', '/F', '/IM', 'chrome.exe'],
-                          capture_output=True, timeout=5)
-            time.sleep(2)
-        except Exception:
-            pass
-
-        # Prepare Scraper_Profile (copy from Default if needed)
-        try:
-            if not scraper_profile.exists() and default_profile.exists():
-                shutil.copytree(default_profile, scraper_profile)
-        except Exception:
-            pass
-
-        # Launch Chrome with Scraper_Profile and remote debugging
-        try:
-            subprocess.Popen([
-                chrome_path,
-                f'--user-data-dir={scraper_profile}',
-                f'--remote-debugging-port={debug_port}'
-            ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        except Exception as e:
-            print(f"✗\n    Error: {e}")
-            raise
-
-        # Wait for debugging port to be ready (with retries)
-        port_ready = False
-        for attempt in range(15):
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex((debug_host, debug_port))
-                sock.close()
-                if result == 0:
-                    port_ready = True
-                    break
-            except Exception:
-                pass
-            time.sleep(1)
-
-        if not port_ready:
-            print("✗")
-            raise RuntimeError(f"Debugging port {debug_port} never became ready after 15 seconds")
-
-        # Connect Selenium to the running Chrome instance
-        options = Options()
-        options.add_experimental_option("debuggerAddress", f"{debug_host}:{debug_port}")
+    def setup_driver(self, debug_port=9222, profile_name="Scraper_Profile", kill_existing=True):
+        """
+        Start a browser for this list only (closed by save_json_and_close).
 
-        try:
-            self.driver = webdriver.Chrome(options=options)
-        except Exception as e:
-            print(f"✗\n    Failed to connect Selenium: {e}")
-            raise
+        Runs that scrape several lists share a ChromeSession via use_session instead.
 
-        # Verify we can navigate
-        try:
-            self.driver.get("https://x.com")
+        Args:
+            debug_port: Remote debugging port
+            profile_name: Profile directory under profile_path
+            kill_existing: Kill all Chrome first
+        """
+        if kill_existing:
+            kill_all_chrome()
+        self.session = ChromeSession(self.profile_path, debug_port=debug_port,
+                                     profile_name=profile_name, capture_mode=self.capture_mode)
+        self.owns_session = True
+        self.driver = self.session.start()
+
+    def reset_stop_counters(self):
+        """Clear the caught-up / cutoff stop state so a resumed scrape starts scrolling afresh"""
+        self.consecutive_existing = 0
+        self.consecutive_old = 0
+        self.cutoff_reached = False
+        self.cutoff_logged = False
 
-            # Wait for page to actually load
-            WebDriverWait(self.driver, 10).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
+    def use_session(self, session):
+        """
+        Scrape with a shared browser session (left open for the next list).
 
-            current_url = self.driver.current_url
-            if "login" in current_url.lower() or "i/flow/login" in current_url:
-                print("✗\n    ⚠ Not logged in - showing login page")
-            else:
-                print("✓")
-        except Exception as e:
-            print(f"✗\n    Navigation error: {e}")
+        Args:
+            session: ChromeSession - restarted here if its browser died
+        """
+        self.session = session
+        self.owns_session = False
+        self.driver = session.ensure()
 
     def extract_primary_tweet(self, article):
         """Prefer the deepest tweet node that has a <time> (original content)."""
@@ -374,106 +743,239 @@ class TwitterListScraper:
         except Exception:
             return article
 
+    @staticmethod
+    def parse_count(text: str) -> int:
+        """Parse a count label ('1,234', '5.2K', '3 Replies'), supporting K/M/B suffixes."""
+        if not text:
+            return 0
+        t = text.replace(',', '').strip().lower()
+        m = re.search(r'(\d+(?:\.\d+)?)([kmb])?', t)
+        if not m:
+            return 0
+        num = float(m.group(1))
+        suf = m.group(2)
+        mult = 1
+        if suf == 'k':
+            mult = 1000
+        elif suf == 'm':
+            mult = 1000000
+        elif suf == 'b':
+            mult = 1000000000
+        return int(num * mult)
+
     def extract_count_from_button(self, article, testid):
-        """Extract count from button (reply, retweet, like), supporting K/M/B suffixes."""
-        def parse_count(text: str) -> int:
-            if not text:
-                return 0
-            t = text.replace(',', '').strip().lower()
-            m = re.search(r'(\d+(?:\.\d+)?)([kmb])?', t)
-            if not m:
-                return 0
-            num = float(m.group(1))
-            suf = m.group(2)
-            mult = 1
-            if suf == 'k':
-                mult = 1000
-            elif suf == 'm':
-                mult = 1000000
-            elif suf == 'b':
-                mult = 1000000000
-            return int(num * mult)
+        """Extract count label from button (reply, retweet, like)."""
         try:
             el = article.find_element(By.CSS_SELECTOR, f'div[data-testid="{testid}"]')
-            label = el.get_attribute('aria-label') or el.text or ''
-            return parse_count(label)
+            return el.get_attribute('aria-label') or el.text or ''
         except Exception:
-            return 0
+            return ''
 
     def extract_urls(self, article):
-        urls = set()
         try:
-            for a in article.find_elements(By.CSS_SELECTOR, '[data-testid="tweetText"] a[href^="http"]'):
-                href = a.get_attribute('href') or ''
-                if href and 'x.com' not in href:
-                    urls.add(href)
+            return [a.get_attribute('href') for a in
+                    article.find_elements(By.CSS_SELECTOR, '[data-testid="tweetText"] a[href^="http"]')]
         except Exception:
-            pass
-        return sorted(urls)
+            return []
+
+    @classmethod
+    def build_tweet(cls, raw: Dict) -> Optional[Dict]:
+        """
+        Normalize raw fields into a post record (shared by bulk and per-element extraction).
+
+        Args:
+            raw: created_at, status_href, author_href, text, reply/retweet/like_label, urls, is_pinned
+
+        Returns:
+            Post dict, or None if the status link has no tweet id
+        """
+        m = re.search(r'/status/(\d+)', raw.get('status_href') or '')
+        tweet_id = m.group(1) if m else None
+        if not tweet_id:
+            return None
+
+        # href may be relative ("/user") or resolved ("https://x.com/user")
+        author = urlparse(raw.get('author_href') or '').path.strip('/').split('/')[0]
+        urls = {href for href in raw.get('urls') or [] if href and 'x.com' not in href}
+
+        return {
+            'tweet_id': tweet_id,
+            'author': author,
+            'permalink': f'https://x.com/{author}/status/{tweet_id}',
+            'created_at': raw.get('created_at'),
+            'text': (raw.get('text') or '').strip(),
+            'reply_count': cls.parse_count(raw.get('reply_label')),
+            'retweet_count': cls.parse_count(raw.get('retweet_label')),
+            'like_count': cls.parse_count(raw.get('like_label')),
+            'urls': sorted(urls),
+            'is_pinned': bool(raw.get('is_pinned'))
+        }
 
     def parse_tweet(self, article):
+        """Parse one article with per-element WebDriver calls (fallback for bulk extraction)."""
         try:
             target_article = self.extract_primary_tweet(article)
             time_el = target_article.find_element(By.CSS_SELECTOR, 'time')
-            created_at = time_el.get_attribute('datetime')
-
-            # tweet id from anchor href
             link = target_article.find_element(By.CSS_SELECTOR, 'a[href*="/status/"]')
-            href = link.get_attribute('href')
-            m = re.search(r'/status/(\d+)', href or '')
-            tweet_id = m.group(1) if m else None
-            if not tweet_id:
-                return None
-
-            # author
             author_el = target_article.find_element(By.CSS_SELECTOR, 'a[href^="/"][role="link"]')
-            author_href = author_el.get_attribute('href') or ''
-            author = author_href.strip('/').split('/')[0]
 
-            # text
             try:
-                text_el = target_article.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]')
-                text = text_el.text.strip()
+                text = target_article.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]').text
             except Exception:
                 text = ''
 
-            reply_count = self.extract_count_from_button(target_article, 'reply')
-            retweet_count = self.extract_count_from_button(target_article, 'retweet')
-            like_count = self.extract_count_from_button(target_article, 'like')
-            urls = self.extract_urls(target_article)
-            is_pinned = self.is_pinned_tweet(target_article)
-
-            return {
-                'tweet_id': tweet_id,
-                'author': author,
-                'permalink': f'https://x.com/{author}/status/{tweet_id}',
-                'created_at': created_at,
+            return self.build_tweet({
+                'created_at': time_el.get_attribute('datetime'),
+                'status_href': link.get_attribute('href'),
+                'author_href': author_el.get_attribute('href'),
                 'text': text,
-                'reply_count': reply_count,
-                'retweet_count': retweet_count,
-                'like_count': like_count,
-                'urls': urls,
-                'is_pinned': is_pinned
-            }
+                'reply_label': self.extract_count_from_button(target_article, 'reply'),
+                'retweet_label': self.extract_count_from_button(target_article, 'retweet'),
+                'like_label': self.extract_count_from_button(target_article, 'like'),
+                'urls': self.extract_urls(target_article),
+                'is_pinned': self.is_pinned_tweet(target_article)
+            })
         except Exception:
             return None
 
-    def harvest_once(self):
-        """Harvest tweets currently visible on the page"""
-        articles = self.driver.find_elements(By.CSS_SELECTOR, 'article[role="article"]')
-        added = 0
-        skipped_existing = 0
-        skipped_old = 0
+    def extract_tweets_bulk(self, mark=True):
+        """
+        Parse articles in a single execute_script round trip.
+
+        Args:
+            mark: Only parse articles not harvested by an earlier sweep, and mark the
+                  ones parsed now (False = parse every article, leave the DOM alone)
+        """
+        raw_tweets = self.driver.execute_script(X_EXTRACT_TWEETS_JS, X_HARVESTED_ATTR if mark else None) or []
+        return [self.build_tweet(raw) for raw in raw_tweets if raw]
 
+    def extract_tweets_per_element(self):
+        """Parse unharvested articles with per-element WebDriver calls, then mark them."""
+        articles = self.driver.find_elements(
+            By.CSS_SELECTOR, f'article[role="article"]:not([{X_HARVESTED_ATTR}])'
+        )
+        tweets = []
+        parsed = []
         for article in articles:
             tweet_data = self.parse_tweet(article)
-            if not tweet_data:
+            if tweet_data:
+                tweets.append(tweet_data)
+                parsed.append(article)
+        if parsed:
+            try:
+                self.driver.execute_script(
+                    "for (const a of arguments[1]) a.setAttribute(arguments[0], '1');",
+                    X_HARVESTED_ATTR, parsed
+                )
+            except Exception:
+                pass  # unmarked articles are re-parsed next sweep and dropped by seen_ids
+        return tweets
+
+    def enable_network_capture(self):
+        """
+        Start capturing X's timeline GraphQL responses over CDP.
+
+        Call before opening the list so the first page of results is captured.
+        Returns False (DOM parsing is used) if performance logging or CDP is unavailable.
+        """
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.get_log('performance')  # discard events from earlier pages
+            self.graphql_pending = set()
+            self.graphql_responses = 0
+            self.graphql_sweeps = 0
+            self.graphql_capture = True
+        except Exception as e:
+            print(f"    ⚠ GraphQL capture unavailable ({str(e)[:80]}), parsing the DOM")
+            self.graphql_capture = False
+        return self.graphql_capture
+
+    def drain_graphql_responses(self):
+        """Yield the JSON bodies of this list's timeline responses that finished loading since the last call."""
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
                 continue
+            method = message.get('method')
+            params = message.get('params') or {}
+            request_id = params.get('requestId')
+
+            if method == 'Network.responseReceived':
+                if graphql_timeline_matches((params.get('response') or {}).get('url', ''), self.list_url):
+                    self.graphql_pending.add(request_id)
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed') and request_id in self.graphql_pending:
+                self.graphql_pending.discard(request_id)
+                if method == 'Network.loadingFailed':
+                    continue
+                # Body is only available once loading finished
+                try:
+                    body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                    text = body.get('body') or ''
+                    if body.get('base64Encoded'):
+                        text = base64.b64decode(text).decode('utf-8')
+                    payload = json.loads(text)
+                except Exception:
+                    continue  # evicted from the network buffer or not JSON
+                yield payload
+
+    def extract_tweets_graphql(self):
+        """Parse the timeline pages loaded since the previous sweep (no DOM access)."""
+        tweets = []
+        for payload in self.drain_graphql_responses():
+            self.graphql_responses += 1
+            tweets.extend(parse_graphql_timeline(payload))
+        return tweets
+
+    def extract_visible_tweets(self):
+        """
+        Parse the tweets loaded since the previous sweep.
+
+        GraphQL mode reads them from the timeline responses each scroll triggers.
+        If capture fails, or no timeline response shows up within
+        X_GRAPHQL_GRACE_SWEEPS sweeps (endpoint renamed, not logged in), the rest of
+        the run parses the DOM instead.
+
+        In DOM mode, parsed articles are tagged with X_HARVESTED_ATTR, so per-sweep
+        work follows the amount of new content rather than the number of articles
+        loaded. Bulk mode costs one WebDriver call per sweep; if the script fails
+        (page not ready, CSP), this sweep and the rest of the run use per-element
+        parsing.
+        """
+        if self.graphql_capture:
+            try:
+                tweets = self.extract_tweets_graphql()
+                self.graphql_sweeps += 1
+                if self.graphql_responses or self.graphql_sweeps < int(globals().get('X_GRAPHQL_GRACE_SWEEPS', 3)):
+                    return tweets
+                print(f"      ⚠ No timeline responses captured after {self.graphql_sweeps} sweeps, parsing the DOM")
+            except Exception as e:
+                print(f"      ⚠ GraphQL capture failed ({str(e)[:80]}), parsing the DOM")
+            self.graphql_capture = False
+
+        if self.bulk_extract:
+            try:
+                return [t for t in self.extract_tweets_bulk() if t]
+            except Exception as e:
+                print(f"      ⚠ Bulk extraction failed ({str(e)[:80]}), using per-element parsing")
+                self.bulk_extract = False
 
+        return self.extract_tweets_per_element()
+
+    def harvest_once(self):
+        """Harvest tweets loaded since the previous sweep"""
+        added = 0
+        skipped_existing = 0
+        skipped_old = 0
+
+        for tweet_data in self.extract_visible_tweets():
             tweet_id = tweet_data['tweet_id']
             is_pinned = tweet_data.get('is_pinned', False)
 
-            if tweet_id in self.seen_ids or tweet_id in self.existing_ids:
+            if tweet_id in self.seen_ids:
+                continue  # collected earlier this run (e.g. shown again after a resume)
+
+            if tweet_id in self.existing_ids:
                 self.consecutive_existing += 1
                 skipped_existing += 1
                 if self.consecutive_existing >= self.max_consecutive_existing:
@@ -549,6 +1051,9 @@ class TwitterListScraper:
 
     def scrape(self):
         """Main scraping loop with time-based safety exit"""
+        if self.capture_mode == "graphql":
+            self.enable_network_capture()
+
         print(f"    Opening {self.list_url}")
         self.driver.get(self.list_url)
 
@@ -559,6 +1064,7 @@ class TwitterListScraper:
         time.sleep(2)  # Additional wait for dynamic content
 
         print("    Starting to collect posts...")
+        print(f"    Capture: {'GraphQL timeline responses' if self.graphql_capture else 'DOM'}")
         if self.cutoff_datetime:
             print(f"    Cutoff target: stop at posts before {self.cutoff_datetime.isoformat()} ({self.cutoff_reason})")
         if self.max_duration > 0:
@@ -614,172 +1120,173 @@ class TwitterListScraper:
 
             self.wait_for_more_content()
 
-    def save_json_and_close(self, output_folder):
-        import shutil
+    def close_browser(self):
+        """Close the browser if this scraper started it; shared sessions stay open - never fails."""
+        if self.session is not None and self.owns_session:
+            print("    Closing browser...")
+            self.session.close()
+            print("    ✓ Browser closed")
+            time.sleep(1)
 
+    def save_json_and_close(self, output_folder):
         try:
             self.save_json(output_folder)
         finally:
-            try:
-                print("    Closing browser...")
-                # Force close with timeout
-                try:
-                    self.driver.quit()
-                    print("    ✓ Browser closed")
-                except Exception as e:
-                    print(f"    ⚠ Error closing driver: {e}")
-                    # Force kill if quit() hangs
-                    subprocess.run(['taskkill', '/IM', 'chrome.exe', '/F'],
-                                 capture_output=True, timeout=5)
-                    print("    ✓ Force closed Chrome")
-
-                time.sleep(1)
+            self.close_browser()
 
-                # Clean up temporary directory
-                if hasattr(self, 'temp_dir') and self.temp_dir and Path(self.temp_dir).exists():
-                    try:
-                        shutil.rmtree(self.temp_dir)
-                        print("    Temp profile cleaned up")
-                    except Exception:
-                        pass
-            except Exception as e:
-                print(f"    Error during cleanup: {e}")
+            # Clean up temporary directory
+            if hasattr(self, 'temp_dir') and self.temp_dir and Path(self.temp_dir).exists():
+                try:
+                    shutil.rmtree(self.temp_dir)
+                    print("    Temp profile cleaned up")
+                except Exception:
+                    pass
 
 # ========================================================================
 # RUNNER
 # ========================================================================
 
-def run_x_scraper():
-    print("""
-============================================================
-X (TWITTER) SCRAPER - LISTS & BOOKMARKS
-============================================================
-
-Will scrape 3 Twitter/X lists + bookmarks...
-""")
-    total_posts = 0
-    list_stats = {}
-    bookmarks_stats = {}
-    for idx, (list_name, list_url) in enumerate(X_LISTS, start=1):
-        print(f"""
-============================================================
-[{idx}/{len(X_LISTS)}] Scraping X List: {list_name}
-============================================================
-""")
-        output_folder = X_ROOT / list_name
-        try:
-            existing_posts, existing_ids = load_existing_x_data(output_folder)
-            scraper = TwitterListScraper(
-                profile_path=X_CHROME_PROFILE_PATH,
-                list_url=list_url,
-                list_name=list_name,
-                scroll_interval=X_SCROLL_INTERVAL,
-                max_posts=X_MAX_POSTS,
-                max_duration=X_MAX_DURATION,
-                existing_posts=existing_posts,
-                existing_ids=existing_ids
-            )
-            scraper.setup_driver()
-            scraper.scrape()
-            scraper.save_json_and_close(output_folder)
-
-            posts_count = len(scraper.posts)
-            new_count = scraper.new_posts_count
-            list_stats[list_name] = posts_count
-            total_posts += posts_count
-            print(f"\n  [+] Completed: {list_name} ({posts_count} total posts, {new_count} new)")
-            # Record status for this list
-            record_scraper_status(f'X_{list_name}', new_count)
-        except Exception as e:
-            import traceback
-            print(f"\n  An error occurred while processing the list: {list_name}")
-            traceback.print_exc()
-            # Record failure status for this list
-            record_scraper_status(f'X_{list_name}', 0, str(e)[:100])
-            # Attempt to close any driver opened
-            try:
-                scraper.driver.quit()
-            except Exception:
-                pass
-
-    print("""
-============================================================
-All 3 X lists scraped successfully!
-============================================================
+def scrape_x_target(name, url, session):
+    """
+    Scrape one list (or bookmarks) in a shared browser session
 
-X posts saved to:
-  - output/X/Technicals
-  - output/X/Crypto
-  - output/X/Macro
+    A browser crash mid-list restarts the session and resumes the list; posts
+    already collected are kept, seen_ids drops the ones shown again and the
+    stop counters start over.
 
-""")
+    Args:
+        name: List name (output folder and status key X_<name>)
+        url: List or bookmarks URL
+        session: ChromeSession of the slot running this list
 
-    # ========================================================================
-    # NOW SCRAPE BOOKMARKS
-    # ========================================================================
-    print("""
-============================================================
-[4/4] Scraping X Bookmarks
-============================================================
-""")
+    Returns:
+        {"name", "posts", "new", "error", "seconds"} - errors are recorded, not raised
+    """
+    started = time.time()
+    result = {'name': name, 'posts': 0, 'new': 0, 'error': None, 'seconds': 0.0}
+    output_folder = X_ROOT / name
+    print(f"\n  [{name}] Starting (browser slot on port {session.debug_port})")
     try:
-        output_folder = X_ROOT / "Bookmarks"
         existing_posts, existing_ids = load_existing_x_data(output_folder)
         scraper = TwitterListScraper(
             profile_path=X_CHROME_PROFILE_PATH,
-            list_url=X_BOOKMARKS_URL,
-            list_name="Bookmarks",
+            list_url=url,
+            list_name=name,
             scroll_interval=X_SCROLL_INTERVAL,
             max_posts=X_MAX_POSTS,
             max_duration=X_MAX_DURATION,
             existing_posts=existing_posts,
-            existing_ids=existing_ids
+            existing_ids=existing_ids,
+            bulk_extract=X_BULK_EXTRACT,
+            capture_mode=X_CAPTURE_MODE
         )
-        scraper.setup_driver()
-        scraper.scrape()
-        scraper.save_json_and_close(output_folder)
-
-        bookmarks_count = len(scraper.posts)
-        new_count = scraper.new_posts_count
-        bookmarks_stats["Bookmarks"] = bookmarks_count
-        total_posts += bookmarks_count
-        print(f"\n  [+] Completed: Bookmarks ({bookmarks_count} total posts, {new_count} new)")
-        # Record status for bookmarks
-        record_scraper_status('X_Bookmarks', new_count)
+        for attempt in range(X_SESSION_RESTARTS + 1):
+            try:
+                scraper.use_session(session)
+                scraper.scrape()
+                break
+            except WebDriverException as e:
+                # Browser still up = a real error, not a crash
+                if attempt == X_SESSION_RESTARTS or session.alive():
+                    raise
+                print(f"    ⚠ Browser crashed during {name} ({str(e).splitlines()[0][:80]}); "
+                      f"resuming with {scraper.new_posts_count} new posts kept")
+                scraper.bulk_extract = X_BULK_EXTRACT  # the crash may have tripped the fallback
+                scraper.reset_stop_counters()  # the reloaded list starts from the top again
+        scraper.save_json(output_folder)
+
+        result['posts'] = len(scraper.posts)
+        result['new'] = scraper.new_posts_count
+        print(f"\n  [+] Completed: {name} ({result['posts']} total posts, {result['new']} new)")
+        record_scraper_status(f'X_{name}', result['new'])
     except Exception as e:
         import traceback
-        print(f"\n  An error occurred while processing bookmarks")
+        print(f"\n  An error occurred while processing: {name}")
         traceback.print_exc()
-        # Record failure status for bookmarks
-        record_scraper_status('X_Bookmarks', 0, str(e)[:100])
-        # Attempt to close any driver opened
+        result['error'] = str(e)[:100]
+        record_scraper_status(f'X_{name}', 0, result['error'])
+    result['seconds'] = time.time() - started
+    return result
+
+def run_x_scraper():
+    targets = list(X_LISTS) + [("Bookmarks", X_BOOKMARKS_URL)]
+    workers = max(1, min(int(X_PARALLEL_LISTS), len(targets)))
+    print(f"""
+============================================================
+X (TWITTER) SCRAPER - LISTS & BOOKMARKS
+============================================================
+
+Will scrape {len(X_LISTS)} Twitter/X lists + bookmarks ({workers} at a time)...
+""")
+
+    # One clean start for the whole pool, then a profile clone per extra browser
+    # (kept browsers from the previous run are attached to instead)
+    if not X_KEEP_BROWSER:
+        kill_all_chrome()
+    prepare_slot_profiles(X_CHROME_PROFILE_PATH, workers, refresh=not X_KEEP_BROWSER)
+
+    # One browser session per slot, started on first use and reused by every
+    # list the slot runs; each running list holds its slot until it finishes
+    sessions = [
+        ChromeSession(X_CHROME_PROFILE_PATH, debug_port=X_DEBUG_PORT + slot,
+                      profile_name=slot_profile_name(slot), capture_mode=X_CAPTURE_MODE)
+        for slot in range(workers)
+    ]
+    free_slots = Queue()
+    for slot in range(workers):
+        free_slots.put(slot)
+
+    def run_target(name, url):
+        slot = free_slots.get()
         try:
-            scraper.driver.quit()
-        except Exception:
-            pass
+            return scrape_x_target(name, url, sessions[slot])
+        finally:
+            free_slots.put(slot)
 
-    print("""
+    started = time.time()
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='x-list') as pool:
+            futures = [pool.submit(run_target, name, url) for name, url in targets]
+            for future in as_completed(futures):
+                result = future.result()
+                results[result['name']] = result
+    finally:
+        for session in sessions:
+            session.close(keep_browser=X_KEEP_BROWSER)
+    wall_time = time.time() - started
+
+    total_posts = sum(r['posts'] for r in results.values())
+    failed = [name for name, _ in targets if results[name]['error']]
+    summary = "\n".join(
+        f"  - Research/X/{name:<11} {results[name]['posts']:>5} posts ({results[name]['new']} new) "
+        f"in {results[name]['seconds']:.0f}s" + (f"  FAILED: {results[name]['error']}" if results[name]['error'] else "")
+        for name, _ in targets
+    )
+    browser = {key: sum(session.stats[key] for session in sessions) for key in sessions[0].stats}
+    print(f"""
 ============================================================
-All X lists + bookmarks scraped successfully!
+{'All X lists + bookmarks scraped successfully!' if not failed else f'X scraping finished with {len(failed)} failure(s)'}
 ============================================================
 
-X posts saved to:
-  - Research/X/Technicals
-  - Research/X/Crypto
-  - Research/X/Macro
-  - Research/X/Bookmarks
+{summary}
+
+Total: {total_posts} posts in {wall_time:.0f}s wall time ({sum(r['seconds'] for r in results.values()):.0f}s summed across lists)
+Browser: {browser['launches']} launched, {browser['attaches']} attached, {browser['reuses']} reused, {browser['restarts']} restarted - {browser['startup_seconds']:.1f}s startup
 
 [OK] X Scraping complete! Closing in 3 seconds...
 """)
 
     # Force close any remaining Chrome processes
     time.sleep(3)
-    try:
-        subprocess.run(['taskkill', '/IM', 'chrome.exe', '/F'],
-                      capture_output=True, timeout=5)
-        print("[✓] All Chrome processes terminated")
-    except Exception:
-        pass
+    if not X_KEEP_BROWSER:
+        try:
+            subprocess.run(['taskkill', '/IM', 'chrome.exe', '/F'],
+                          capture_output=True, timeout=5)
+            print("[✓] All Chrome processes terminated")
+        except Exception:
+            pass
+    return results
 
 
 if __name__ == "__main__":
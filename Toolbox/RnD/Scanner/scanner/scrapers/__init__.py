@@ -10,6 +10,7 @@ from .utils import (
     sanitize_filename,
     record_scraper_status,
     rate_limit_delay,
+    get_session,
     scrape_with_retry,
     clean_html_text
 )
@@ -18,6 +19,7 @@ __all__ = [
     'sanitize_filename',
     'record_scraper_status',
     'rate_limit_delay',
+    'get_session',
     'scrape_with_retry',
     'clean_html_text'
 ]
@@ -13,10 +13,13 @@ import sys
 import time
 import json
 import html
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
 # Fix Windows console encoding
@@ -54,6 +57,9 @@ RATE_LIMITS = {
     'sec_edgar': 0.1,  # SEC allows 10 req/sec
 }
 
+# Keep-alive connections kept per host (scrapers run one request at a time per site)
+SESSION_POOL_SIZE = 4
+
 # User agents
 USER_AGENTS = {
     'default': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -127,6 +133,40 @@ def record_scraper_status(scraper_name: str, items_found: int, error_message: st
 # NEW SCANNER-SPECIFIC UTILITIES
 # ========================================================================
 
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Shared keep-alive session for all scanner scrapers.
+
+    Reuses TCP/TLS connections across requests (one pool per host) and
+    retries connection failures with jittered backoff. HTTP status retries
+    stay in scrape_with_retry, which applies the longer 429 penalty.
+
+    Returns:
+        requests.Session
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            retry_kwargs = dict(total=2, connect=2, read=0, status=0, backoff_factor=0.5)
+            try:
+                retry = Retry(backoff_jitter=0.25, **retry_kwargs)
+            except TypeError:
+                retry = Retry(**retry_kwargs)  # urllib3 < 2.0 has no jitter option
+
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=SESSION_POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+            _session = session
+        return _session
+
+
 def rate_limit_delay(scraper_name: str, override: Optional[float] = None):
     """
     Enforce rate limiting between scraper requests.
@@ -170,7 +210,7 @@ def scrape_with_retry(
 
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = get_session().get(url, headers=headers, timeout=timeout)
 
             if response.status_code == 200:
                 return response
@@ -249,58 +249,62 @@ class Scout:
         print("-" * 70)
 
         try:
-            # Import API client
-            from scripts.trading.api_client import get_client, APIClientError
-
-            with get_client() as api:
-                # Health check
-                if not api.is_healthy():
-                    print("[ERROR] API server offline")
-                    return 'failed'
-
-                print("[OK] API server online")
-
-                # Get all data
-                sources_collected = []
-
-                # Market data
-                try:
-                    summary = api.get_summary()
-                    if summary.get('success'):
-                        counts = summary.get('counts', {})
-                        print(f"  ✅ Market data: {counts.get('etf', 0)} ETFs, {counts.get('maxPain', 0)} max pain records")
-                        sources_collected.append('market_data')
-                except Exception as e:
-                    print(f"  ⚠️  Market data: {e}")
-
-                # YouTube
-                try:
-                    youtube = api.get_youtube_latest(limit=50)
-                    if youtube.get('success'):
-                        video_count = len(youtube.get('data', []))
-                        print(f"  ✅ YouTube: {video_count} videos")
-                        sources_collected.append('youtube')
-                except Exception as e:
-                    print(f"  ⚠️  YouTube: {e}")
-
-                # RSS
-                try:
-                    rss = api.get_rss_latest(limit=50)
-                    if rss.get('success'):
-                        article_count = len(rss.get('data', []))
-                        print(f"  ✅ RSS News: {article_count} articles")
-                        sources_collected.append('rss')
-                except Exception as e:
-                    print(f"  ⚠️  RSS: {e}")
-
-                print(f"\n[OK] API collection complete - {len(sources_collected)}/3 sources")
-
-                if len(sources_collected) >= 2:
-                    return 'success'
-                elif len(sources_collected) >= 1:
-                    return 'partial'
-                else:
-                    return 'failed'
+            # Import async API client
+            from scripts.trading.async_api_client import run_async
+
+            # Health check and all sources concurrently (one round-trip)
+            snapshot = run_async(lambda api: api.gather_many({
+                'health': api.health_check(),
+                'summary': api.get_summary(),
+                'youtube': api.get_youtube_latest(limit=50),
+                'rss': api.get_rss_latest(limit=50),
+            }))
+
+            health = snapshot['health']
+            if isinstance(health, Exception) or health.get('status') != 'ok':
+                print("[ERROR] API server offline")
+                return 'failed'
+
+            print("[OK] API server online")
+
+            # Get all data
+            sources_collected = []
+
+            # Market data
+            summary = snapshot['summary']
+            if isinstance(summary, Exception):
+                print(f"  ⚠️  Market data: {summary}")
+            elif summary.get('success'):
+                counts = summary.get('counts', {})
+                print(f"  ✅ Market data: {counts.get('etf', 0)} ETFs, {counts.get('maxPain', 0)} max pain records")
+                sources_collected.append('market_data')
+
+            # YouTube
+            youtube = snapshot['youtube']
+            if isinstance(youtube, Exception):
+                print(f"  ⚠️  YouTube: {youtube}")
+            elif youtube.get('success'):
+                video_count = len(youtube.get('data', []))
+                print(f"  ✅ YouTube: {video_count} videos")
+                sources_collected.append('youtube')
+
+            # RSS
+            rss = snapshot['rss']
+            if isinstance(rss, Exception):
+                print(f"  ⚠️  RSS: {rss}")
+            elif rss.get('success'):
+                article_count = len(rss.get('data', []))
+                print(f"  ✅ RSS News: {article_count} articles")
+                sources_collected.append('rss')
+
+            print(f"\n[OK] API collection complete - {len(sources_collected)}/3 sources")
+
+            if len(sources_collected) >= 2:
+                return 'success'
+            elif len(sources_collected) >= 1:
+                return 'partial'
+            else:
+                return 'failed'
 
         except Exception as e:
             print(f"[ERROR] API collection failed: {e}")
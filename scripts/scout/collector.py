@@ -28,7 +28,12 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from config import config
-from scripts.trading.api_client import get_client, APIClientError
+from scripts.trading.api_client import get_client, APIClientError, scrape_age
+from scripts.trading.async_api_client import run_async
+from scripts.trading.feed_store import FeedStore
+
+# Rolling local copies of the API feeds (high-water mark + retained items)
+FEED_DIR = config.paths.cache_dir / "feeds"
 
 
 class CollectionResult:
@@ -63,36 +68,46 @@ def collect_api_data() -> CollectionResult:
     try:
         print(f"[{start_time.strftime('%H:%M:%S')}] Collecting API data...")
 
-        with get_client() as api:
-            # Health check first
-            if not api.is_healthy():
-                result.error = "API server offline"
-                return result
+        # Health, summary and status concurrently (one round-trip)
+        snapshot = run_async(lambda api: api.gather_many({
+            'health': api.health_check(),
+            'summary': api.get_summary(),
+            'status': api.get_status(),
+        }))
 
-            # Get all data in one call
-            summary = api.get_summary()
+        health = snapshot['health']
+        if isinstance(health, Exception) or health.get('status') != 'ok':
+            result.error = "API server offline"
+            return result
 
-            if not summary.get('success'):
-                result.error = f"API returned error: {summary.get('error', 'Unknown')}"
-                return result
+        summary = snapshot['summary']
+        if isinstance(summary, Exception):
+            raise summary
 
-            # Extract relevant data (API returns data nested under 'data' key)
-            data = summary.get('data', {})
-            counts = summary.get('counts', {})
+        if not summary.get('success'):
+            result.error = f"API returned error: {summary.get('error', 'Unknown')}"
+            return result
 
-            result.data = {
-                'timestamp': summary.get('timestamp'),
-                'etf_data': data.get('etf', []),
-                'vix_data': data.get('vix', {}),
-                'max_pain_data': data.get('maxPain', []),
-                'chat_messages': data.get('chat', []),
-                'counts': counts,
-                'data_age_minutes': api.get_data_age_minutes()
-            }
+        # Extract relevant data (API returns data nested under 'data' key)
+        data = summary.get('data', {})
+        counts = summary.get('counts', {})
 
-            result.success = True
-            print(f"  [OK] API data collected ({counts.get('etf', 0)} ETFs, "
-                  f"{counts.get('maxPain', 0)} max pain records)")
+        status = snapshot['status']
+        age = None if isinstance(status, Exception) else scrape_age(status)
+
+        result.data = {
+            'timestamp': summary.get('timestamp'),
+            'etf_data': data.get('etf', []),
+            'vix_data': data.get('vix', {}),
+            'max_pain_data': data.get('maxPain', []),
+            'chat_messages': data.get('chat', []),
+            'counts': counts,
+            'data_age_minutes': age.total_seconds() / 60 if age is not None else None
+        }
+
+        result.success = True
+        print(f"  [OK] API data collected ({counts.get('etf', 0)} ETFs, "
+              f"{counts.get('maxPain', 0)} max pain records)")
 
     except APIClientError as e:
         result.error = f"API client error: {e}"
@@ -198,26 +213,17 @@ def collect_video_data() -> CollectionResult:
                 result.error = "API server offline"
                 return result
 
-            # Get YouTube data from API
-            youtube_data = api.get_youtube_latest(limit=200)
+            # Pull only videos newer than the last run; the 7-day view is local
+            store = FeedStore('youtube', FEED_DIR / 'youtube.json',
+                              lambda limit: api.get_youtube_latest(limit=limit),
+                              retention=timedelta(days=7))
+            pull = store.pull()
 
-            if not youtube_data.get('success'):
-                result.error = f"API returned error: {youtube_data.get('error', 'Unknown')}"
+            if not pull['success']:
+                result.error = f"API returned error: {pull['error']}"
                 return result
 
-            # Extract videos
-            videos = youtube_data.get('data', [])
-
-            # Filter to last 7 days (API returns all, we only want recent)
-            cutoff = datetime.now() - timedelta(days=7)
-            recent_videos = []
-            for video in videos:
-                scraped_at = video.get('scraped_at')
-                if scraped_at:
-                    # Parse ISO timestamp
-                    video_time = datetime.fromisoformat(scraped_at.replace('Z', '+00:00'))
-                    if video_time.replace(tzinfo=None) > cutoff:
-                        recent_videos.append(video)
+            recent_videos = store.items(max_age=timedelta(days=7))
 
             # Count videos with summaries
             with_summaries = sum(1 for v in recent_videos if v.get('summary'))
@@ -225,13 +231,14 @@ def collect_video_data() -> CollectionResult:
             result.data = {
                 'videos': recent_videos,
                 'video_count': len(recent_videos),
-                'total_available': len(videos),
+                'new_videos': pull['new'],
+                'total_available': len(store),
                 'with_summaries': with_summaries,
                 'collection_date': datetime.now().strftime("%Y%m%d"),
                 'channels': list(set(v.get('channel_name', 'Unknown') for v in recent_videos))
             }
             result.success = True
-            print(f"  [OK] YouTube data collected ({len(recent_videos)} recent videos, {with_summaries} with Ollama summaries)")
+            print(f"  [OK] YouTube data collected ({len(recent_videos)} recent videos, {pull['new']} new, {with_summaries} with Ollama summaries)")
 
     except APIClientError as e:
         result.error = f"API error: {e}"
@@ -267,36 +274,28 @@ def collect_news_data() -> CollectionResult:
                 result.error = "API server offline"
                 return result
 
-            # Get RSS data from API
-            rss_data = api.get_rss_latest(limit=200)
+            # Pull only articles newer than the last run; the 24h view is local
+            store = FeedStore('rss', FEED_DIR / 'rss.json',
+                              lambda limit: api.get_rss_latest(limit=limit),
+                              retention=timedelta(days=1))
+            pull = store.pull()
 
-            if not rss_data.get('success'):
-                result.error = f"API returned error: {rss_data.get('error', 'Unknown')}"
+            if not pull['success']:
+                result.error = f"API returned error: {pull['error']}"
                 return result
 
-            # Extract articles
-            articles = rss_data.get('data', [])
-
-            # Filter to last 24 hours (API returns all, we only want recent)
-            cutoff = datetime.now() - timedelta(days=1)
-            recent_articles = []
-            for article in articles:
-                scraped_at = article.get('scraped_at')
-                if scraped_at:
-                    # Parse ISO timestamp
-                    article_time = datetime.fromisoformat(scraped_at.replace('Z', '+00:00'))
-                    if article_time.replace(tzinfo=None) > cutoff:
-                        recent_articles.append(article)
+            recent_articles = store.items(max_age=timedelta(days=1))
 
             result.data = {
                 'articles': recent_articles,
                 'article_count': len(recent_articles),
-                'total_available': len(articles),
+                'new_articles': pull['new'],
+                'total_available': len(store),
                 'collection_date': datetime.now().strftime("%Y%m%d"),
                 'providers': list(set(a.get('provider', 'Unknown') for a in recent_articles))
             }
             result.success = True
-            print(f"  [OK] RSS data collected ({len(recent_articles)} recent articles from {len(result.data['providers'])} providers)")
+            print(f"  [OK] RSS data collected ({len(recent_articles)} recent articles, {pull['new']} new, from {len(result.data['providers'])} providers)")
 
     except APIClientError as e:
         result.error = f"API error: {e}"
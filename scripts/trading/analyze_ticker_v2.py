@@ -68,7 +68,8 @@ class TickerAnalyzer:
         if HAS_REAL_DATA:
             self.cache = CacheManager()
             if api_key:
-                self.api_manager = APISourceManager(api_key)
+                # Interactive lane: user requests go ahead of background collection
+                self.api_manager = APISourceManager(api_key, priority='interactive')
                 logger.info("Real data integration initialized")
 
     def _load_config(self, config_path: str) -> Dict:
@@ -247,7 +248,8 @@ class TickerAnalyzer:
 
     def _fetch_live_data(self, ticker: str, context: Dict) -> None:
         """Fetch live data from API"""
-        quote = self.api_manager.get_quote(ticker)
+        # Hedged: a user is waiting, so tail latency matters more than quota
+        quote = self.api_manager.get_quote(ticker, hedge=True)
         if quote:
             context['current_price'] = quote.get('price', 100.0)
         else:
@@ -5,10 +5,17 @@ Wrapper for the ETF Data Scraper & API system running on remote server.
 Provides clean interface to all API endpoints with error handling and retries.
 """
 
+import copy
+import csv
+import gzip
+import io
+import json
+import os
 import requests
 import time
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Any, Tuple, Union
+from datetime import date, datetime, timedelta, timezone
+from email.message import Message
 import sys
 from pathlib import Path
 
@@ -16,8 +23,11 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "scout"))  # Add scout/ for config
+sys.path.insert(0, str(Path(__file__).parent))  # Add scripts/trading/ for response_cache
 
 from config import config
+from response_cache import ResponseCache, get_cache
+from singleflight import get_group
 
 
 class APIClientError(Exception):
@@ -25,6 +35,125 @@ class APIClientError(Exception):
     pass
 
 
+# Download chunk size for streaming exports
+CHUNK_SIZE = 64 * 1024
+
+# progress(bytes_done, total_bytes or None)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def _iter_json_records(chunks: Iterator[str]) -> Iterator[Tuple[Optional[str], Any]]:
+    """
+    Incrementally parse a JSON document, yielding the elements of its arrays
+
+    Objects and arrays outside arrays are descended into; each element of an
+    array that is not itself an array is decoded whole and yielded with the
+    key of the array that holds it. Only one element is held in memory.
+
+    Args:
+        chunks: Text chunks of the document
+
+    Yields:
+        (enclosing key or None, element)
+    """
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    eof = False
+    stack = []          # ('{' or '[', key holding this container)
+    key = None          # pending object key
+    expect_key = False
+
+    def more() -> bool:
+        nonlocal buf, pos, eof
+        if eof:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    while True:
+        # Skip whitespace and separators
+        while pos < len(buf) and buf[pos] in ' \t\r\n,:':
+            pos += 1
+        if pos >= len(buf):
+            if not more():
+                if stack:
+                    raise ValueError("Truncated JSON export")
+                return
+            continue
+
+        char = buf[pos]
+        if char in '}]':
+            stack.pop()
+            pos += 1
+            expect_key = bool(stack) and stack[-1][0] == '{'
+            continue
+
+        in_array = bool(stack) and stack[-1][0] == '['
+        if char == '[' or (char == '{' and not in_array):
+            stack.append((char, key if not in_array else stack[-1][1]))
+            pos += 1
+            key = None
+            expect_key = char == '{'
+            continue
+
+        # Decode a whole value (key, record or scalar), reading more input until
+        # it is complete - a value that is not followed by a delimiter may be
+        # cut short at the chunk edge (e.g. "-1500." of "-1500.25")
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+            complete = eof or (end < len(buf) and buf[end] in ' \t\r\n,:]}')
+        except ValueError:
+            complete = False
+        if not complete:
+            if more():
+                continue
+            value, end = decoder.raw_decode(buf, pos)
+        pos = end
+
+        if expect_key:
+            key = value
+            expect_key = False
+        elif in_array:
+            yield stack[-1][1], value
+        else:
+            # Scalar member of an object
+            key = None
+            expect_key = True
+
+
+def _declared_charset(response: requests.Response) -> Optional[str]:
+    """Charset the Content-Type header actually declares, or None"""
+    message = Message()
+    message['Content-Type'] = response.headers.get('Content-Type', '')
+    return message.get_content_charset()
+
+
+def scrape_age(status: Dict) -> Optional[timedelta]:
+    """
+    Age of the latest scrape reported by /api/status
+
+    Args:
+        status: get_status() response
+
+    Returns:
+        Age, or None if the status has no scrape timestamp
+    """
+    try:
+        scrape_time_str = status.get('lastScrape', {}).get('timestamp')
+        if not scrape_time_str:
+            return None
+        scrape_time = datetime.fromisoformat(scrape_time_str.replace('Z', '+00:00'))
+        return datetime.now(scrape_time.tzinfo) - scrape_time
+    except (AttributeError, ValueError):
+        return None
+
+
 class MarketDataAPI:
     """
     Client for Market Data API Server
@@ -39,13 +168,26 @@ class MarketDataAPI:
     - Data export and backups
     """
 
-    def __init__(self, base_url: Optional[str] = None, timeout: Optional[int] = None):
+    # Seconds a GET response is reused by every client in the process, per endpoint
+    CACHE_TTL = {
+        '/health': 10.0,
+        '/api/status': 30.0,
+        '/api/summary': 60.0,
+    }
+
+    # Shared TTL entries and in-flight requests (keyed by base URL, endpoint and params)
+    _shared_responses = get_group('market_data_api', memo_seconds=0.0)
+
+    def __init__(self, base_url: Optional[str] = None, timeout: Optional[int] = None,
+                 response_cache: Optional[ResponseCache] = None):
         """
         Initialize API client
 
         Args:
             base_url: API server URL (defaults to config)
             timeout: Request timeout in seconds (defaults to config)
+            response_cache: Cache for historical data (defaults to the shared
+                            cache in the research cache directory)
         """
         self.base_url = base_url or config.api.base_url
         self.timeout = timeout or config.api.timeout
@@ -58,13 +200,69 @@ class MarketDataAPI:
             'User-Agent': 'Investment-Research-Dashboard/1.0'
         })
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
+        # Sealed historical days and revalidation data for live requests
+        self.response_cache = response_cache or get_cache(
+            'market_data', db_path=str(config.paths.cache_dir / 'http_cache.db')
+        )
+
+    def _make_request(self, method: str, endpoint: str, cache_key: Optional[str] = None,
+                      bypass_cache: bool = False, **kwargs) -> Dict:
+        """
+        Make HTTP request, served from the shared TTL cache for CACHE_TTL endpoints
+
+        Concurrent requests for the same cached endpoint share one round-trip.
+
+        Args:
+            method: HTTP method (GET, POST)
+            endpoint: API endpoint path
+            cache_key: Revalidate against the cached response under this key
+                       (ETag / If-Modified-Since; a 304 returns the cached body)
+            bypass_cache: Fetch fresh even if a TTL entry exists (the fresh
+                          response replaces it)
+            **kwargs: Additional arguments for requests
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            APIClientError: If request fails after retries
+        """
+        ttl = self.CACHE_TTL.get(endpoint) if method == 'GET' else None
+        if not ttl:
+            return self._send_with_retry(method, endpoint, cache_key, **kwargs)
+
+        key = (self.base_url, endpoint, tuple(sorted((kwargs.get('params') or {}).items())))
+        if bypass_cache:
+            self._shared_responses.forget(key)
+        result, _ = self._shared_responses.do(
+            key,
+            lambda: self._send_with_retry(method, endpoint, cache_key, **kwargs),
+            memo_seconds=ttl
+        )
+        # Entries are shared between clients: hand out copies
+        return copy.deepcopy(result)
+
+    @classmethod
+    def invalidate(cls, endpoint: Optional[str] = None) -> int:
+        """
+        Drop shared TTL entries so the next call refetches
+
+        Args:
+            endpoint: Endpoint path (e.g. '/api/summary'); None drops all
+
+        Returns:
+            Number of entries dropped
+        """
+        return cls._shared_responses.clear(None if endpoint is None else lambda key: key[1] == endpoint)
+
+    def _send_with_retry(self, method: str, endpoint: str, cache_key: Optional[str] = None, **kwargs) -> Dict:
         """
         Make HTTP request with retry logic
 
         Args:
             method: HTTP method (GET, POST)
             endpoint: API endpoint path
+            cache_key: Response cache key for conditional requests
             **kwargs: Additional arguments for requests
 
         Returns:
@@ -75,6 +273,8 @@ class MarketDataAPI:
         """
         url = f"{self.base_url}{endpoint}"
         kwargs.setdefault('timeout', self.timeout)
+        if cache_key:
+            kwargs['headers'] = {**kwargs.get('headers', {}), **self.response_cache.conditional_headers(cache_key)}
 
         last_error = None
         for attempt in range(self.retry_attempts):
@@ -85,6 +285,8 @@ class MarketDataAPI:
                 response = self.session.request(method, url, **kwargs)
                 response.raise_for_status()
 
+                if cache_key:
+                    return self.response_cache.resolve(cache_key, response)
                 return response.json()
 
             except requests.exceptions.HTTPError as e:
@@ -113,19 +315,25 @@ class MarketDataAPI:
 
     # ==================== Health & Status ====================
 
-    def health_check(self) -> Dict:
+    def health_check(self, bypass_cache: bool = False) -> Dict:
         """
         Basic server health check
 
+        Args:
+            bypass_cache: Ignore the shared 10s cache entry
+
         Returns:
             {"status": "ok", "timestamp": "..."}
         """
-        return self._make_request('GET', '/health')
+        return self._make_request('GET', '/health', bypass_cache=bypass_cache)
 
-    def get_status(self) -> Dict:
+    def get_status(self, bypass_cache: bool = False) -> Dict:
         """
         Comprehensive system health with database metrics
 
+        Args:
+            bypass_cache: Ignore the shared 30s cache entry
+
         Returns:
             Full system status including:
             - Database connection and size
@@ -133,9 +341,9 @@ class MarketDataAPI:
             - Last scrape information
             - Health check results
         """
-        return self._make_request('GET', '/api/status')
+        return self._make_request('GET', '/api/status', bypass_cache=bypass_cache)
 
-    def get_summary(self) -> Dict:
+    def get_summary(self, bypass_cache: bool = False) -> Dict:
         """
         Get ALL latest data from ALL tables in one call
 
@@ -146,10 +354,13 @@ class MarketDataAPI:
         - Recent chat messages
         - System status
 
+        Args:
+            bypass_cache: Ignore the shared 60s cache entry
+
         Returns:
             Complete data snapshot with counts
         """
-        return self._make_request('GET', '/api/summary')
+        return self._make_request('GET', '/api/summary', bypass_cache=bypass_cache)
 
     def is_healthy(self) -> bool:
         """
@@ -202,25 +413,78 @@ class MarketDataAPI:
         return self.get_latest_symbol('VIX')
 
     def get_historical(self, symbol: str, start_date: Optional[str] = None,
-                       end_date: Optional[str] = None) -> Dict:
+                       end_date: Optional[str] = None, use_cache: bool = True) -> Dict:
         """
         Get historical data for a symbol
 
+        With a start date, finished days are served from the local response
+        cache and only uncached days plus the current day are requested (the
+        live part is revalidated with ETag / If-Modified-Since). Cached results
+        are sorted by timestamp.
+
         Args:
             symbol: Stock symbol (SPY, QQQ, VIX)
             start_date: Start date in YYYY-MM-DD format (optional)
             end_date: End date in YYYY-MM-DD format (optional)
+            use_cache: False to always fetch the full range from the server
 
         Returns:
             {"success": bool, "symbol": str, "count": int, "data": [...]}
         """
+        endpoint = f'/api/historical/{symbol.upper()}'
         params = {}
         if start_date:
             params['start'] = start_date
         if end_date:
             params['end'] = end_date
 
-        return self._make_request('GET', f'/api/historical/{symbol.upper()}', params=params)
+        if not use_cache:
+            return self._make_request('GET', endpoint, params=params)
+        if not start_date:
+            # Open-ended range: nothing is sealed, but the whole response can be revalidated
+            return self._make_request('GET', endpoint, params=params,
+                                      cache_key=self._historical_key(endpoint, params))
+
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date) if end_date else datetime.now(timezone.utc).date()
+        namespace = f"market_data|{endpoint}"
+        by_day, fetch_from = self.response_cache.plan_range(namespace, start, end)
+
+        if fetch_from is not None:
+            # Ask one day past the range so the last day is complete whether the
+            # server treats `end` as inclusive or exclusive
+            fetch_params = {'start': fetch_from.isoformat(), 'end': (end + timedelta(days=1)).isoformat()}
+            result = self._make_request('GET', endpoint, params=fetch_params,
+                                        cache_key=self._historical_key(endpoint, fetch_params))
+            if not result.get('success', False):
+                return result
+
+            fetched = {}
+            for record in result.get('data', []):
+                # Server dates are the UTC date prefix of the timestamp
+                day = date.fromisoformat(record['timestamp'][:10])
+                if fetch_from <= day <= end:
+                    fetched.setdefault(day, []).append(record)
+            self.response_cache.seal_days(namespace, fetch_from, end, fetched, empty=[])
+            by_day.update(fetched)
+
+        records = sorted(
+            (record for day in by_day.values() for record in day),
+            key=lambda record: record['timestamp']
+        )
+        return {
+            'success': True,
+            'symbol': symbol.upper(),
+            'count': len(records),
+            'filters': {'startDate': start_date, 'endDate': end_date},
+            'data': records
+        }
+
+    @staticmethod
+    def _historical_key(endpoint: str, params: Dict) -> str:
+        """Response cache key for a live historical request"""
+        query = '&'.join(f"{k}={v}" for k, v in sorted(params.items()))
+        return f"market_data|{endpoint}?{query}"
 
     # ==================== Max Pain Data ====================
 
@@ -432,6 +696,9 @@ class MarketDataAPI:
         """
         Export all data as JSON file
 
+        Buffers the whole export in memory; use export_json_to() or
+        iter_json_records() for large databases.
+
         Args:
             include_metadata: Include system metadata (default: True)
 
@@ -450,6 +717,9 @@ class MarketDataAPI:
         """
         Export specific table as CSV
 
+        Buffers the whole table in memory; use export_csv_to() or
+        iter_csv_rows() for large tables.
+
         Args:
             table_name: Table to export (etf_data, vix_data, max_pain_data, chat_messages, scrape_metadata)
 
@@ -464,6 +734,158 @@ class MarketDataAPI:
         response.raise_for_status()
         return response.content
 
+    def download_export(self, endpoint: str, params: Dict, dest: Union[str, Path, BinaryIO],
+                        progress: Optional[ProgressCallback] = None, resume: bool = False,
+                        compress: bool = False, chunk_size: int = CHUNK_SIZE) -> Dict:
+        """
+        Stream an export to a file without buffering it in memory
+
+        Path destinations are written to <dest>.part and renamed when complete.
+        With resume, an existing .part file is continued with an HTTP Range
+        request; if the server ignores the range the download restarts.
+
+        Args:
+            endpoint: Export endpoint path
+            params: Query parameters
+            dest: File path or writable binary file object
+            progress: Called after each chunk with (bytes written, total or None)
+            resume: Continue a previous partial download (path destinations only)
+            compress: gzip the file while writing
+            chunk_size: Bytes per read
+
+        Returns:
+            {"path": str or None, "bytes": int, "total": int or None, "resumed": bool}
+
+        Raises:
+            APIClientError: If the download fails (a resumable .part file is kept)
+        """
+        is_path = isinstance(dest, (str, Path))
+        if resume and (compress or not is_path):
+            raise ValueError("resume needs a file path destination without compress")
+
+        part = f"{dest}.part" if is_path else None
+        offset = os.path.getsize(part) if resume and os.path.exists(part) else 0
+
+        headers = {}
+        if resume:
+            # Offsets must refer to the stored bytes, not a compressed transfer
+            headers['Accept-Encoding'] = 'identity'
+            if offset:
+                headers['Range'] = f'bytes={offset}-'
+
+        url = f"{self.base_url}{endpoint}"
+        try:
+            with self.session.get(url, params=params, headers=headers, stream=True,
+                                  timeout=self.timeout) as response:
+                if response.status_code == 416 and offset:
+                    # Range starts at the end: the .part file is already complete
+                    os.replace(part, dest)
+                    return {'path': str(dest), 'bytes': 0, 'total': offset, 'resumed': True}
+                response.raise_for_status()
+
+                resumed = offset > 0 and response.status_code == 206
+                if not resumed:
+                    offset = 0
+                length = response.headers.get('Content-Length')
+                total = offset + int(length) if length and 'Content-Encoding' not in response.headers else None
+
+                if is_path:
+                    Path(part).parent.mkdir(parents=True, exist_ok=True)
+                    raw = open(part, 'ab' if resumed else 'wb')
+                else:
+                    raw = dest
+                out = gzip.GzipFile(fileobj=raw, mode='wb') if compress else raw
+
+                written = offset
+                try:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        out.write(chunk)
+                        written += len(chunk)
+                        if progress:
+                            progress(written, total)
+                finally:
+                    if compress:
+                        out.close()
+                    if is_path:
+                        raw.close()
+
+        except requests.exceptions.RequestException as e:
+            raise APIClientError(f"Export download failed after {offset} bytes: {e}") from e
+
+        if is_path:
+            os.replace(part, dest)
+        return {'path': str(dest) if is_path else None, 'bytes': written - offset,
+                'total': written, 'resumed': resumed}
+
+    def export_json_to(self, dest: Union[str, Path, BinaryIO], include_metadata: bool = True,
+                       **options) -> Dict:
+        """
+        Stream the JSON export to a file
+
+        Args:
+            dest: File path or writable binary file object
+            include_metadata: Include system metadata (default: True)
+            **options: download_export() options (progress, resume, compress, chunk_size)
+
+        Returns:
+            download_export() result
+        """
+        return self.download_export('/api/export/json', {'metadata': str(include_metadata).lower()},
+                                    dest, **options)
+
+    def export_csv_to(self, table_name: str, dest: Union[str, Path, BinaryIO], **options) -> Dict:
+        """
+        Stream a table's CSV export to a file
+
+        Args:
+            table_name: Table to export (etf_data, vix_data, max_pain_data, chat_messages, ...)
+            dest: File path or writable binary file object
+            **options: download_export() options (progress, resume, compress, chunk_size)
+
+        Returns:
+            download_export() result
+        """
+        return self.download_export('/api/export/csv', {'table': table_name}, dest, **options)
+
+    def iter_csv_rows(self, table_name: str) -> Iterator[Dict[str, str]]:
+        """
+        Stream a table's CSV export row by row
+
+        Args:
+            table_name: Table to export
+
+        Yields:
+            Row dicts keyed by column name
+        """
+        with self.session.get(f"{self.base_url}/api/export/csv", params={'table': table_name},
+                              stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Keep the stream readable at EOF so the text wrapper sees a clean end
+            response.raw.auto_close = False
+            # requests reports ISO-8859-1 for text/* without a charset; exports are UTF-8
+            text = io.TextIOWrapper(response.raw, encoding=_declared_charset(response) or 'utf-8', newline='')
+            yield from csv.DictReader(text)
+
+    def iter_json_records(self, include_metadata: bool = False) -> Iterator[Tuple[Optional[str], Any]]:
+        """
+        Stream the JSON export record by record
+
+        Args:
+            include_metadata: Include system metadata (default: False)
+
+        Yields:
+            (table / key of the enclosing array, record)
+        """
+        with self.session.get(f"{self.base_url}/api/export/json",
+                              params={'metadata': str(include_metadata).lower()},
+                              stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            # JSON without a charset would otherwise come back as bytes
+            response.encoding = response.encoding or 'utf-8'
+            chunks = response.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True)
+            yield from _iter_json_records(iter(chunks))
+
     def create_backup(self) -> Dict:
         """
         Create timestamped database backup on server
@@ -490,17 +912,8 @@ class MarketDataAPI:
             if not status.get('success'):
                 return False
 
-            last_scrape = status.get('lastScrape', {})
-            scrape_time_str = last_scrape.get('timestamp')
-
-            if not scrape_time_str:
-                return False
-
-            # Parse timestamp
-            scrape_time = datetime.fromisoformat(scrape_time_str.replace('Z', '+00:00'))
-            age = datetime.now(scrape_time.tzinfo) - scrape_time
-
-            return age < timedelta(hours=max_age_hours)
+            age = scrape_age(status)
+            return age is not None and age < timedelta(hours=max_age_hours)
 
         except Exception as e:
             print(f"Error checking data freshness: {e}")
@@ -514,18 +927,8 @@ class MarketDataAPI:
             Age in minutes, or None if unavailable
         """
         try:
-            status = self.get_status()
-            last_scrape = status.get('lastScrape', {})
-            scrape_time_str = last_scrape.get('timestamp')
-
-            if not scrape_time_str:
-                return None
-
-            scrape_time = datetime.fromisoformat(scrape_time_str.replace('Z', '+00:00'))
-            age = datetime.now(scrape_time.tzinfo) - scrape_time
-
-            return age.total_seconds() / 60
-
+            age = scrape_age(self.get_status())
+            return age.total_seconds() / 60 if age is not None else None
         except:
             return None
 
@@ -1,17 +1,29 @@
 """
 API Sources Module: Handles all data fetching from Finnhub and Yahoo Finance
-Primary: Finnhub API (60 calls/min rate limit)
+Primary: Finnhub API (60 calls/min rate limit, enforced by the shared limiter in rate_limiter.py)
 Fallback: Yahoo Finance web scraping
+Routing: per-provider circuit breakers and latency scores (provider_health.py)
 """
 
 import requests
 import json
 import logging
 from typing import Dict, Optional, List, Tuple
-from datetime import datetime, timedelta
+from datetime import datetime, time as dtime, timedelta, timezone, tzinfo
+import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from candle_store import CandleStore, to_epoch_seconds
+from http_session import get_session
+from market_calendar import EXCHANGE_TZ
+from provider_health import ProviderHealth, ProviderRouter
+from rate_limiter import BACKGROUND, RateLimiter, get_limiter
+from response_cache import ResponseCache, get_cache
+from singleflight import SingleFlight, get_group
 
 # Configure logging
 logging.basicConfig(
@@ -31,42 +43,94 @@ class FinnhubAPI:
     Free tier: 60 API calls per minute
     """
 
-    def __init__(self, api_key: str):
+    # Params left out of the singleflight key ('to' is always "now")
+    UNKEYED_PARAMS = ('to', 'token')
+
+    # Seconds a successful response is reused after completion, per endpoint
+    MEMO_SECONDS = {'quote': 1.0, 'stock/candle': 5.0}
+
+    # Resolutions whose bars fall within one day (weekly/monthly bars are always fetched live)
+    CACHED_RESOLUTIONS = ('1', '5', '15', '30', '60', 'D')
+    CANDLE_FIELDS = ('t', 'o', 'h', 'l', 'c', 'v')
+
+    def __init__(self, api_key: str, priority: str = BACKGROUND, limiter: Optional[RateLimiter] = None,
+                 session: Optional[requests.Session] = None, flights: Optional[SingleFlight] = None,
+                 response_cache: Optional[ResponseCache] = None):
         """
         Initialize Finnhub API client
 
         Args:
             api_key: Finnhub API key
+            priority: Rate limiter lane for this client's calls ('interactive' or 'background')
+            limiter: Rate limiter (default: the process-wide Finnhub limiter)
+            session: HTTP session (default: the shared keep-alive Finnhub session)
+            flights: Singleflight group for coalescing identical requests (None = no coalescing)
+            response_cache: Cache for sealed candle days (None = always fetch the full range)
         """
         self.api_key = api_key
         self.base_url = "https://finnhub.io/api/v1"
-        self.call_count = 0
-        self.call_reset_time = datetime.now()
         self.rate_limit = 60  # calls per minute
-        self.warning_threshold = 55  # warn at 55 calls
+        self.priority = priority
+
+        # Shared by every FinnhubAPI in the process (and across processes with RATE_LIMIT_DB)
+        self.limiter = limiter or get_limiter('finnhub', rate=self.rate_limit, per=60.0)
+        self._local = threading.local()
 
-    def _check_rate_limit(self) -> None:
-        """Check and enforce rate limiting"""
-        current_time = datetime.now()
+        # Pool sized for both collector loops plus hedged/interactive requests
+        self.session = session or get_session('finnhub', pool_size=16)
+        self.flights = flights
+        self.response_cache = response_cache
 
-        # Reset counter every minute
-        if (current_time - self.call_reset_time).seconds >= 60:
-            self.call_count = 0
-            self.call_reset_time = current_time
+    @property
+    def call_count(self) -> int:
+        """Calls made in the last minute"""
+        return self.limiter.calls_in_window()
 
-        # Warn if approaching limit
-        if self.call_count >= self.warning_threshold:
-            logger.warning(f"API calls at {self.call_count}/{self.rate_limit} - approaching rate limit")
+    def last_limiter_wait(self) -> float:
+        """Seconds the calling thread's last request waited for the rate limiter"""
+        return getattr(self._local, 'limiter_wait', 0.0)
 
-        # Enforce hard limit (queue if needed)
-        if self.call_count >= self.rate_limit:
-            wait_time = 60 - (current_time - self.call_reset_time).seconds
-            logger.warning(f"Rate limit hit. Waiting {wait_time}s before next call")
-            time.sleep(wait_time)
-            self.call_count = 0
-            self.call_reset_time = datetime.now()
+    def take_limiter_wait(self) -> float:
+        """Last limiter wait of the calling thread, cleared so a later call that skips the limiter reads 0"""
+        wait = self.last_limiter_wait()
+        self._local.limiter_wait = 0.0
+        return wait
 
     def _make_request(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """
+        Make API request, coalesced with identical in-flight requests
+
+        Callers that join another caller's request share its response (read-only)
+        and inherit its rate limiter wait, so one quota token serves all of them.
+        The request runs in the lane of the caller that started it.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+
+        Returns:
+            Response JSON or None on error
+        """
+        if self.flights is None:
+            return self._fetch(endpoint, params)
+
+        key = (
+            endpoint,
+            params.get('symbol'),
+            tuple(sorted((k, v) for k, v in params.items() if k not in self.UNKEYED_PARAMS))
+        )
+        (data, limiter_wait), shared = self.flights.do(
+            key,
+            lambda: (self._fetch(endpoint, params), self.last_limiter_wait()),
+            memo_seconds=self.MEMO_SECONDS.get(endpoint),
+            is_valid=lambda result: result[0] is not None
+        )
+        if shared:
+            self._local.limiter_wait = limiter_wait
+            logger.debug(f"Shared in-flight {endpoint} for {params.get('symbol', 'unknown')}")
+        return data
+
+    def _fetch(self, endpoint: str, params: Dict) -> Optional[Dict]:
         """
         Make API request with error handling
 
@@ -77,14 +141,13 @@ class FinnhubAPI:
         Returns:
             Response JSON or None on error
         """
-        self._check_rate_limit()
-        self.call_count += 1
+        self._local.limiter_wait = self.limiter.acquire(self.priority) or 0.0
 
         url = f"{self.base_url}/{endpoint}"
         params['token'] = self.api_key
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -146,7 +209,8 @@ class FinnhubAPI:
             logger.error(f"Error parsing quote data: {e}")
             return None
 
-    def get_candles(self, ticker: str, days: int = 100, resolution: str = 'D') -> Optional[pd.DataFrame]:
+    def get_candles(self, ticker: str, days: int = 100, resolution: str = 'D',
+                    from_timestamp: Optional[int] = None, refresh: bool = False) -> Optional[pd.DataFrame]:
         """
         Fetch OHLCV candle data (time series)
 
@@ -154,24 +218,38 @@ class FinnhubAPI:
             ticker: Stock ticker symbol
             days: Number of days of history
             resolution: 'D' for daily, '4' for 4-hour, '60' for 1-hour
+            from_timestamp: Fetch bars from this epoch time instead of `days` back
+                            (used for delta fetches)
+            refresh: Refetch cached sealed days too (and re-seal them) - for
+                     checking stored history against a restated feed
 
         Returns:
-            DataFrame with OHLCV data indexed by timestamp, or None on error
+            DataFrame with OHLCV data indexed by timestamp (empty if the range
+            has no bars), or None on error
         """
         if not ticker:
             logger.error("Invalid ticker for candles")
             return None
 
-        # Calculate from/to timestamps
+        # Calculate from/to timestamps (window start floored to the minute so
+        # concurrent requests for the same window coalesce)
         to_timestamp = int(datetime.now().timestamp())
-        from_timestamp = int((datetime.now() - timedelta(days=days)).timestamp())
+        if from_timestamp is None:
+            from_timestamp = int((datetime.now() - timedelta(days=days)).timestamp()) // 60 * 60
+
+        if self.response_cache is not None and resolution in self.CACHED_RESOLUTIONS:
+            data = self._fetch_candles_cached(ticker, resolution, from_timestamp, to_timestamp, refresh=refresh)
+        else:
+            data = self._make_request("stock/candle", {
+                "symbol": ticker,
+                "resolution": resolution,
+                "from": from_timestamp,
+                "to": to_timestamp
+            })
 
-        data = self._make_request("stock/candle", {
-            "symbol": ticker,
-            "resolution": resolution,
-            "from": from_timestamp,
-            "to": to_timestamp
-        })
+        if data is not None and data.get('s') == 'no_data':
+            logger.info(f"No candles in requested range for {ticker}")
+            return pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume'])
 
         if data is None or 'c' not in data:
             logger.error(f"No candle data returned for {ticker}")
@@ -198,6 +276,73 @@ class FinnhubAPI:
             logger.error(f"Error building candles DataFrame: {e}")
             return None
 
+    @staticmethod
+    def _candle_tz(resolution: str) -> tzinfo:
+        """Timezone that assigns bars to days (daily bars are stamped 00:00 UTC of the session)"""
+        return timezone.utc if resolution == 'D' else EXCHANGE_TZ
+
+    def _fetch_candles_cached(self, ticker: str, resolution: str, from_timestamp: int,
+                              to_timestamp: int, refresh: bool = False) -> Optional[Dict]:
+        """
+        Candle response assembled from cached sealed days plus one live request
+
+        Finished days never change, so they are stored per day and only the
+        days from the first uncached one through today are requested (for a
+        sliding window that is yesterday and today).
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+            from_timestamp: Range start (epoch seconds)
+            to_timestamp: Range end (epoch seconds)
+            refresh: Ignore cached days and fetch the whole range (re-sealing it)
+
+        Returns:
+            Finnhub-style candle dict ('s' is 'ok' or 'no_data'), or None on error
+        """
+        tz = self._candle_tz(resolution)
+        namespace = f"finnhub|stock/candle|{ticker}|{resolution}"
+        start = datetime.fromtimestamp(from_timestamp, tz).date()
+        end = datetime.fromtimestamp(to_timestamp, tz).date()
+
+        if refresh:
+            by_day, fetch_from = {}, start
+        else:
+            by_day, fetch_from = self.response_cache.plan_range(namespace, start, end)
+        if fetch_from is not None:
+            # Whole days only, so stored days are complete
+            data = self._make_request("stock/candle", {
+                "symbol": ticker,
+                "resolution": resolution,
+                "from": int(datetime.combine(fetch_from, dtime.min, tzinfo=tz).timestamp()),
+                "to": to_timestamp
+            })
+            if data is None or (data.get('s') != 'no_data' and 'c' not in data):
+                return None
+
+            fetched = {}
+            for i, timestamp in enumerate(data.get('t') or []):
+                day = fetched.setdefault(datetime.fromtimestamp(timestamp, tz).date(),
+                                         {field: [] for field in self.CANDLE_FIELDS})
+                for field in self.CANDLE_FIELDS:
+                    day[field].append(data[field][i])
+            self.response_cache.seal_days(namespace, fetch_from, end, fetched, empty={})
+            by_day.update(fetched)
+            logger.debug(f"Candles {ticker} {resolution}: {len(by_day) - len(fetched)} days cached, "
+                         f"fetched from {fetch_from}")
+
+        merged = {field: [] for field in self.CANDLE_FIELDS}
+        for day in sorted(by_day):
+            bars = by_day[day]
+            for i, timestamp in enumerate(bars.get('t', [])):
+                if from_timestamp <= timestamp <= to_timestamp:
+                    for field in self.CANDLE_FIELDS:
+                        merged[field].append(bars[field][i])
+
+        if not merged['t']:
+            return {'s': 'no_data'}
+        return {'s': 'ok', **merged}
+
     def get_vix(self) -> Optional[Dict]:
         """
         Fetch VIX (Volatility Index) data from Finnhub
@@ -300,10 +445,8 @@ class YahooFinanceScraper:
     def __init__(self):
         """Initialize scraper"""
         self.base_url = "https://finance.yahoo.com/quote"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        # Shared keep-alive session (browser User-Agent set by http_session)
+        self.session = get_session('yahoo', pool_size=8)
 
     def scrape_quote(self, ticker: str) -> Optional[Dict]:
         """
@@ -395,75 +538,302 @@ class YahooFinanceScraper:
 
 class APISourceManager:
     """
-    Manages API sources with fallback strategy
-    Primary: Finnhub
-    Fallback: Yahoo Finance scraper
+    Manages API sources with health-based routing
+    Providers: Finnhub, Yahoo Finance scraper
+    Each operation goes to the fastest provider whose circuit breaker is closed
+    (Finnhub unless it is degraded); open providers are probed in the background.
+    Identical concurrent Finnhub requests (same endpoint, symbol and params) are
+    coalesced into one call, across every manager in the process.
     """
 
-    def __init__(self, finnhub_key: str):
+    # Ticker used for background health probes
+    PROBE_TICKER = 'SPY'
+
+    # Stored closes differing from refetched ones by more than this (relative) mean
+    # the provider restated history (split/dividend adjustment)
+    RESTATEMENT_TOLERANCE = 1e-4
+    # Full-window refetch at least this often, so restatements outside the delta overlap are caught
+    FULL_REFRESH_SECONDS = 7 * 24 * 3600
+
+    # Yahoo is scraped (no API contract), so it must be twice as fast to be preferred
+    YAHOO_WEIGHT = 2.0
+
+    def __init__(self, finnhub_key: str, candle_store: Optional[CandleStore] = None,
+                 priority: str = BACKGROUND):
         """
         Initialize API manager
 
         Args:
             finnhub_key: Finnhub API key
+            candle_store: Local OHLCV store (default: CandleStore())
+            priority: Rate limiter lane ('interactive' for user requests, 'background' for collection)
         """
-        self.finnhub = FinnhubAPI(finnhub_key)
+        # Shared with the collector's / analyzer's managers in the same process
+        self.flights = get_group('finnhub')
+        self.finnhub = FinnhubAPI(finnhub_key, priority=priority, flights=self.flights,
+                                  response_cache=get_cache('finnhub'))
         self.yahoo = YahooFinanceScraper()
+        self.candle_store = candle_store or CandleStore()
+
+        wait_time = {'finnhub': self.finnhub.take_limiter_wait}
+        self.quote_router = ProviderRouter(
+            'quote',
+            [ProviderHealth('finnhub'), ProviderHealth('yahoo', weight=self.YAHOO_WEIGHT)],
+            probes={
+                'finnhub': lambda: self.finnhub.get_quote(self.PROBE_TICKER),
+                'yahoo': lambda: self.yahoo.scrape_quote(self.PROBE_TICKER),
+            },
+            wait_time=wait_time
+        )
+        self.candle_router = ProviderRouter(
+            'candles',
+            [ProviderHealth('finnhub'), ProviderHealth('yahoo', weight=self.YAHOO_WEIGHT)],
+            probes={
+                'finnhub': lambda: self.finnhub.get_candles(self.PROBE_TICKER, days=5),
+                'yahoo': lambda: self.yahoo.scrape_candles(self.PROBE_TICKER, days=5),
+            },
+            wait_time=wait_time,
+            probe_is_valid=lambda result: result is not None and not result.empty
+        )
+        # Runs hedged requests (created on first use)
+        self._hedge_pool = None
+        self._hedge_pool_lock = threading.Lock()
         logger.info("API Source Manager initialized")
 
-    def get_quote(self, ticker: str) -> Optional[Dict]:
+    def _get_hedge_pool(self) -> ThreadPoolExecutor:
+        """Worker pool for hedged requests"""
+        with self._hedge_pool_lock:
+            if self._hedge_pool is None:
+                self._hedge_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='hedge')
+            return self._hedge_pool
+
+    def get_quote(self, ticker: str, hedge: bool = False) -> Optional[Dict]:
         """
-        Fetch quote with fallback strategy
+        Fetch quote from the best available provider
+
+        A quote must carry change/changePercent to win the route; Yahoo's are
+        derived from the stored previous close (see _get_quote_yahoo).
 
         Args:
             ticker: Stock ticker symbol
+            hedge: If the primary provider is slower than its p90 latency, also
+                   ask the fallback and take the first valid answer (for
+                   interactive callers; costs extra requests)
 
         Returns:
             Quote data dict or None
         """
-        # Try Finnhub first
+        # A Yahoo quote without change/changePercent (no stored previous close)
+        # only counts as healthy; it is returned if no provider has a full quote
+        price_only = {}
+
+        def yahoo():
+            quote = self._get_quote_yahoo(ticker)
+            if quote is not None and quote['change'] is None:
+                price_only['quote'] = quote
+            return quote
+
+        calls = {
+            'finnhub': lambda: self._get_quote_finnhub(ticker),
+            'yahoo': yahoo,
+        }
+        complete = lambda quote: quote is not None and quote.get('change') is not None
+        if hedge:
+            provider, quote = self.quote_router.hedged_call(calls, self._get_hedge_pool(), is_usable=complete)
+        else:
+            provider, quote = self.quote_router.call(calls, is_usable=complete)
+        if quote is None and price_only:
+            logger.warning(f"Only a price-only Yahoo quote available for {ticker}")
+            quote = price_only['quote']
+        if quote is None:
+            logger.error(f"All sources failed for {ticker}")
+        return quote
+
+    def _get_quote_finnhub(self, ticker: str) -> Optional[Dict]:
+        """Finnhub quote tagged with its source"""
         quote = self.finnhub.get_quote(ticker)
         if quote is not None:
             quote['source'] = 'finnhub'
-            return quote
+        return quote
 
-        logger.warning(f"Finnhub failed for {ticker}, trying Yahoo scraper")
+    def _get_quote_yahoo(self, ticker: str) -> Optional[Dict]:
+        """
+        Yahoo quote with change/changePercent filled from the stored previous close
 
-        # Fallback to Yahoo
+        The scraped page only yields a price; change and changePercent stay None
+        when the candle store has no daily bar before today for the ticker.
+        """
         quote = self.yahoo.scrape_quote(ticker)
-        if quote is not None:
-            return quote
+        if quote is None:
+            return None
 
-        logger.error(f"All sources failed for {ticker}")
-        return None
+        previous_close = self._previous_close(ticker)
+        change = quote['price'] - previous_close if previous_close else None
+        quote['change'] = change
+        quote['changePercent'] = change / previous_close * 100 if previous_close else None
+        return quote
+
+    def _previous_close(self, ticker: str) -> Optional[float]:
+        """Close of the last stored daily bar before today (exchange time), or None"""
+        today = datetime.now(EXCHANGE_TZ).date()
+        # Daily bars are stamped at midnight UTC of their date
+        before_today = int(datetime(today.year, today.month, today.day, tzinfo=timezone.utc).timestamp()) - 1
+        try:
+            closes = self.candle_store.history(ticker, 'D').between(None, before_today)['close']
+            return float(closes[-1]) if len(closes) else None
+        except Exception as e:
+            logger.error(f"Error reading previous close for {ticker}: {e}")
+            return None
 
-    def get_candles(self, ticker: str, days: int = 100) -> Optional[pd.DataFrame]:
+    def get_candles(self, ticker: str, days: int = 100, resolution: str = 'D') -> Optional[pd.DataFrame]:
         """
-        Fetch candles with fallback strategy
+        Fetch candles from the best available provider
+
+        The Finnhub route reads the local candle store first and asks Finnhub
+        only for bars from the last closed stored bar onward (stored bars are
+        overwritten). A full-window fetch happens when the store does not cover
+        the requested range, weekly, and whenever refetched bars no longer match
+        the stored ones (the store is cleared first, so adjusted and unadjusted
+        bars never mix).
 
         Args:
             ticker: Stock ticker symbol
             days: Number of days of history
+            resolution: Candle resolution (default: 'D')
 
         Returns:
             DataFrame with OHLCV data or None
         """
-        # Try Finnhub first
-        candles = self.finnhub.get_candles(ticker, days=days)
-        if candles is not None and not candles.empty:
-            logger.info(f"Candles from Finnhub for {ticker}")
-            return candles
+        provider, candles = self.candle_router.call(
+            {
+                'finnhub': lambda: self._get_candles_finnhub(ticker, days, resolution),
+                'yahoo': lambda: self.yahoo.scrape_candles(ticker, days=days),
+            },
+            is_usable=lambda result: result is not None and not result.empty
+        )
+        if candles is None:
+            logger.error(f"All sources failed for candles {ticker}")
+            return None
 
-        logger.warning(f"Finnhub failed for candles {ticker}, trying Yahoo scraper")
+        logger.info(f"Candles from {provider} for {ticker}")
+        return candles
 
-        # Fallback to Yahoo
-        candles = self.yahoo.scrape_candles(ticker, days=days)
+    def _get_candles_finnhub(self, ticker: str, days: int, resolution: str) -> Optional[pd.DataFrame]:
+        """
+        Candles via the local store plus Finnhub (delta fetch, else full window)
+
+        Args:
+            ticker: Stock ticker symbol
+            days: Number of days of history
+            resolution: Candle resolution
+
+        Returns:
+            DataFrame (empty if Finnhub has no bars), or None on error
+        """
+        window_start = int((datetime.now() - timedelta(days=days)).timestamp())
+
+        # Delta fetch on top of stored history (unless a periodic full refresh is due)
+        full_fetch_at = self.candle_store.get_full_fetch_time(ticker, resolution)
+        refresh_due = full_fetch_at is None or time.time() - full_fetch_at >= self.FULL_REFRESH_SECONDS
+        if not refresh_due:
+            candles = self._get_candles_delta(ticker, resolution, window_start)
+            if candles is not None and not candles.empty:
+                logger.debug(f"Candles from store + Finnhub delta for {ticker}")
+                return candles
+
+        # Full window from Finnhub; cached sealed days are refetched on a periodic refresh
+        # or after the delta check cleared the store
+        refresh = refresh_due or self.candle_store.get_full_fetch_time(ticker, resolution) is None
+        candles = self.finnhub.get_candles(ticker, days=days, resolution=resolution, refresh=refresh)
         if candles is not None and not candles.empty:
-            logger.info(f"Candles from Yahoo for {ticker}")
-            return candles
+            if self._history_restated(ticker, resolution, candles):
+                self.candle_store.clear(ticker, resolution)
+            merged = self.candle_store.merge(ticker, resolution, candles, covered_from=window_start)
+            if merged is not None:
+                return self._slice_window(merged, window_start)
+        return candles
+
+    def _get_candles_delta(self, ticker: str, resolution: str, window_start: int) -> Optional[pd.DataFrame]:
+        """
+        Serve candles from the store plus a Finnhub fetch of only the newest bars
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+            window_start: Requested window start (epoch seconds)
+
+        Returns:
+            DataFrame for the requested window, or None if the store cannot serve it
+        """
+        covered_from = self.candle_store.get_coverage(ticker, resolution)
+        if covered_from is None or covered_from > window_start:
+            return None
+
+        stored = self.candle_store.load(ticker, resolution)
+        if stored is None or stored.empty:
+            return None
+
+        # Overlap one closed bar (the last one may still be forming) and bypass the
+        # sealed-day cache for it, so a restated feed shows up as a mismatch
+        stored_times = to_epoch_seconds(stored.index)
+        from_timestamp = stored_times[-2] if len(stored_times) > 1 else stored_times[-1]
+        delta = self.finnhub.get_candles(ticker, resolution=resolution, from_timestamp=from_timestamp,
+                                         refresh=len(stored_times) > 1)
+        if delta is None:
+            return None
+
+        if self._history_restated(ticker, resolution, delta, stored):
+            self.candle_store.clear(ticker, resolution)
+            return None
 
-        logger.error(f"All sources failed for candles {ticker}")
-        return None
+        logger.debug(f"Delta fetch for {ticker}: {len(delta)} bars")
+        merged = self.candle_store.merge(ticker, resolution, delta)
+        if merged is None:
+            return None
+        return self._slice_window(merged, window_start)
+
+    def _history_restated(self, ticker: str, resolution: str, fetched: pd.DataFrame,
+                          stored: Optional[pd.DataFrame] = None) -> bool:
+        """
+        Whether refetched closed bars disagree with the stored ones
+
+        The newest stored bar is ignored (it may have been stored while still forming).
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+            fetched: Freshly fetched candles
+            stored: Stored candles (default: load from the store)
+
+        Returns:
+            True if stored history no longer matches the feed
+        """
+        if fetched is None or fetched.empty:
+            return False
+        if stored is None:
+            stored = self.candle_store.load(ticker, resolution)
+        if stored is None or len(stored) < 2:
+            return False
+
+        closed = stored['close'].iloc[:-1]
+        common = closed.index.intersection(fetched.index)
+        if common.empty:
+            return False
+
+        old = closed.loc[common].to_numpy(dtype=float)
+        new = fetched['close'].loc[common].to_numpy(dtype=float)
+        drift = np.abs(new - old) / np.maximum(np.abs(old), 1e-12)
+        if np.any(drift > self.RESTATEMENT_TOLERANCE):
+            worst = int(np.argmax(drift))
+            logger.warning(f"{ticker} ({resolution}): stored history restated at {common[worst]} "
+                           f"({old[worst]} -> {new[worst]}), clearing store for a full refetch")
+            return True
+        return False
+
+    @staticmethod
+    def _slice_window(candles: pd.DataFrame, window_start: int) -> pd.DataFrame:
+        """Bars at or after window_start (epoch seconds)"""
+        return candles[candles.index >= pd.to_datetime(window_start, unit='s')]
 
     def get_vix(self) -> Optional[Dict]:
         """
@@ -479,12 +849,22 @@ class APISourceManager:
         Get current API usage status
 
         Returns:
-            Dict with call count and rate limit info
+            Dict with call count, rate limit info, limiter, coalescing and cache metrics
         """
+        limiter = self.finnhub.limiter
+        call_count = limiter.calls_in_window()
+        next_reset = datetime.now() + timedelta(seconds=limiter.seconds_until_window_reset())
         return {
-            'call_count': self.finnhub.call_count,
+            'call_count': call_count,
             'rate_limit': self.finnhub.rate_limit,
-            'next_reset': self.finnhub.call_reset_time.isoformat(),
-            'calls_remaining': self.finnhub.rate_limit - self.finnhub.call_count,
+            'next_reset': next_reset.isoformat(),
+            'calls_remaining': max(0, self.finnhub.rate_limit - call_count),
+            'rate_limiter': limiter.get_metrics(),
+            'singleflight': self.flights.get_stats(),
+            'response_cache': self.finnhub.response_cache.get_stats(),
+            'providers': {
+                'quote': self.quote_router.get_status(),
+                'candles': self.candle_router.get_status()
+            },
             'timestamp': datetime.now().isoformat()
         }
@@ -0,0 +1,378 @@
+"""
+Async Market Data API Client
+
+Asyncio sibling of MarketDataAPI with the same method surface, for fetching
+several endpoints concurrently (one round-trip instead of one per endpoint).
+- Pooled keep-alive connections (aiohttp if installed, otherwise a pooled
+  requests session driven from a worker thread pool)
+- Bounded concurrency: at most `max_concurrency` requests in flight
+- gather_many() runs named requests concurrently and returns every result,
+  with failures returned as exception values so one endpoint cannot sink a snapshot
+- run_async() for synchronous callers
+
+Usage:
+    snapshot = run_async(lambda api: api.gather_many({
+        'health': api.health_check(),
+        'summary': api.get_summary(),
+        'status': api.get_status(),
+    }))
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    from .api_client import APIClientError, MarketDataAPI, config, scrape_age
+except ImportError:
+    from api_client import APIClientError, MarketDataAPI, config, scrape_age
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+T = TypeVar('T')
+
+_RETRYABLE = (requests.exceptions.RequestException, asyncio.TimeoutError)
+if HAS_AIOHTTP:
+    _RETRYABLE += (aiohttp.ClientError,)
+
+
+class AsyncMarketDataAPI:
+    """
+    Async client for Market Data API Server
+
+    Same methods as MarketDataAPI, as coroutines. get_historical, the export
+    methods and the CACHE_TTL endpoints (health, status, summary) run the
+    synchronous client in a worker thread, so they share its response cache,
+    download handling and the process-wide TTL/singleflight entries.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, timeout: Optional[int] = None,
+                 max_concurrency: int = 8):
+        """
+        Initialize async API client
+
+        Args:
+            base_url: API server URL (defaults to config)
+            timeout: Request timeout in seconds (defaults to config)
+            max_concurrency: Max requests in flight (also the connection pool size)
+        """
+        self.base_url = base_url or config.api.base_url
+        self.timeout = timeout or config.api.timeout
+        self.retry_attempts = config.api.retry_attempts
+        self.retry_delay = config.api.retry_delay
+        self.max_concurrency = max_concurrency
+
+        self._semaphore = None
+        self._session = None        # aiohttp.ClientSession
+        self._executor = None       # fallback transport
+        self._blocking_session = None
+        self._sync_client = None
+
+    # ==================== Transport ====================
+
+    def _open(self) -> None:
+        """Create the connection pool (must run inside the event loop)"""
+        if self._semaphore is not None:
+            return
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        headers = {'User-Agent': 'Investment-Research-Dashboard/1.0'}
+
+        if HAS_AIOHTTP:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers=headers
+            )
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                thread_name_prefix='market-data-api')
+            self._blocking_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+            self._blocking_session.mount('http://', adapter)
+            self._blocking_session.mount('https://', adapter)
+            self._blocking_session.headers.update(headers)
+
+    def _blocking_request(self, method: str, url: str, params: Optional[Dict]) -> Dict:
+        """One request on the fallback transport (runs in the worker pool)"""
+        response = self._blocking_session.request(method, url, params=params, timeout=self.timeout)
+        if response.status_code == 404:
+            raise APIClientError(f"Resource not found: {url}")
+        response.raise_for_status()
+        return response.json()
+
+    async def _send(self, method: str, url: str, params: Optional[Dict]) -> Dict:
+        """One request on the active transport"""
+        if self._session is not None:
+            query = {k: str(v) for k, v in params.items()} if params else None
+            async with self._session.request(method, url, params=query) as response:
+                if response.status == 404:
+                    raise APIClientError(f"Resource not found: {url}")
+                response.raise_for_status()
+                return await response.json(content_type=None)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._blocking_request, method, url, params)
+
+    async def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """
+        Make HTTP request with retry logic
+
+        Args:
+            method: HTTP method (GET, POST)
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            APIClientError: If request fails after retries (404 is not retried)
+        """
+        self._open()
+        url = f"{self.base_url}{endpoint}"
+
+        last_error = None
+        async with self._semaphore:
+            for attempt in range(self.retry_attempts):
+                try:
+                    if config.debug_mode:
+                        print(f"API Request: {method} {url} (attempt {attempt + 1})")
+                    return await self._send(method, url, params)
+
+                except _RETRYABLE as e:
+                    last_error = e
+                    print(f"Request error (attempt {attempt + 1}/{self.retry_attempts}): {e}")
+
+                # Wait before retry (except on last attempt)
+                if attempt < self.retry_attempts - 1:
+                    await asyncio.sleep(self.retry_delay)
+
+        raise APIClientError(f"API request failed after {self.retry_attempts} attempts: {last_error}")
+
+    async def _run_sync(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a MarketDataAPI method in a worker thread"""
+        if self._sync_client is None:
+            self._sync_client = MarketDataAPI(base_url=self.base_url, timeout=self.timeout)
+        return await asyncio.to_thread(fn, self._sync_client, *args, **kwargs)
+
+    async def gather_many(self, calls: Dict[str, Awaitable[Any]]) -> Dict[str, Any]:
+        """
+        Run named requests concurrently
+
+        Args:
+            calls: Name -> coroutine (e.g. {'summary': api.get_summary()})
+
+        Returns:
+            Name -> result, or the exception the request raised
+        """
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        return dict(zip(calls.keys(), results))
+
+    # ==================== Health & Status ====================
+
+    async def health_check(self, bypass_cache: bool = False) -> Dict:
+        """Basic server health check (shared 10s cache entry)"""
+        return await self._run_sync(MarketDataAPI.health_check, bypass_cache)
+
+    async def get_status(self, bypass_cache: bool = False) -> Dict:
+        """Comprehensive system health with database metrics (shared 30s cache entry)"""
+        return await self._run_sync(MarketDataAPI.get_status, bypass_cache)
+
+    async def get_summary(self, bypass_cache: bool = False) -> Dict:
+        """Get ALL latest data from ALL tables in one call (shared 60s cache entry)"""
+        return await self._run_sync(MarketDataAPI.get_summary, bypass_cache)
+
+    async def is_healthy(self) -> bool:
+        """True if API server is responding"""
+        try:
+            result = await self.health_check()
+            return result.get('status') == 'ok'
+        except Exception:
+            return False
+
+    # ==================== ETF Data ====================
+
+    async def get_latest_all_etf(self) -> Dict:
+        """Get latest data for all ETF symbols (SPY, QQQ)"""
+        return await self._make_request('GET', '/api/latest')
+
+    async def get_latest_symbol(self, symbol: str) -> Dict:
+        """Get latest data for specific symbol"""
+        return await self._make_request('GET', f'/api/latest/{symbol.upper()}')
+
+    async def get_spy_data(self) -> Dict:
+        """Get latest SPY data"""
+        return await self.get_latest_symbol('SPY')
+
+    async def get_qqq_data(self) -> Dict:
+        """Get latest QQQ data"""
+        return await self.get_latest_symbol('QQQ')
+
+    async def get_vix_data(self) -> Dict:
+        """Get latest VIX data"""
+        return await self.get_latest_symbol('VIX')
+
+    async def get_historical(self, symbol: str, start_date: Optional[str] = None,
+                             end_date: Optional[str] = None, use_cache: bool = True) -> Dict:
+        """Get historical data for a symbol (served through the response cache)"""
+        return await self._run_sync(MarketDataAPI.get_historical, symbol, start_date, end_date, use_cache)
+
+    # ==================== Max Pain Data ====================
+
+    async def get_maxpain(self, symbol: str) -> Dict:
+        """Get latest max pain data for ALL expirations"""
+        return await self._make_request('GET', f'/api/maxpain/{symbol.upper()}')
+
+    async def get_maxpain_weekly(self, symbol: str) -> Dict:
+        """Get max pain for weekly expirations only"""
+        return await self._make_request('GET', f'/api/maxpain/{symbol.upper()}/weekly')
+
+    async def get_maxpain_monthly(self, symbol: str) -> Dict:
+        """Get max pain for monthly expirations only"""
+        return await self._make_request('GET', f'/api/maxpain/{symbol.upper()}/monthly')
+
+    async def get_maxpain_history(self, symbol: str, days: int = 7) -> Dict:
+        """Get max pain history for last N days"""
+        return await self._make_request('GET', f'/api/maxpain/{symbol.upper()}/history', params={'days': days})
+
+    async def track_expiration(self, symbol: str, expiration_date: str) -> Dict:
+        """Track specific expiration over time"""
+        from urllib.parse import quote
+        encoded_date = quote(expiration_date)
+        return await self._make_request('GET', f'/api/maxpain/{symbol.upper()}/expiration/{encoded_date}')
+
+    # ==================== Chat Messages ====================
+
+    async def get_chat_latest(self) -> Dict:
+        """Get all chat messages from most recent scrape"""
+        return await self._make_request('GET', '/api/chat/latest')
+
+    async def get_chat_by_user(self, username: str, latest_only: bool = False) -> Dict:
+        """Get chat messages from specific user"""
+        endpoint = f'/api/chat/user/{username}'
+        if latest_only:
+            endpoint += '/latest'
+        return await self._make_request('GET', endpoint)
+
+    async def get_chat_history(self, days: int = 7) -> Dict:
+        """Get chat messages from last N days"""
+        return await self._make_request('GET', '/api/chat/history', params={'days': days})
+
+    # ==================== RSS Feed Data ====================
+
+    async def get_rss_latest(self, limit: int = 100) -> Dict:
+        """Get latest RSS articles from all providers"""
+        return await self._make_request('GET', '/api/rss/latest', params={'limit': limit})
+
+    async def get_rss_by_provider(self, provider: str) -> Dict:
+        """Get articles from specific RSS provider"""
+        return await self._make_request('GET', f'/api/rss/provider/{provider}')
+
+    async def get_rss_stats(self) -> Dict:
+        """Get RSS feed statistics"""
+        return await self._make_request('GET', '/api/rss/stats')
+
+    # ==================== YouTube Transcript Data ====================
+
+    async def get_youtube_latest(self, limit: int = 100) -> Dict:
+        """Get latest YouTube video transcripts with Ollama summaries"""
+        return await self._make_request('GET', '/api/youtube/latest', params={'limit': limit})
+
+    async def get_youtube_by_channel(self, channel_handle: str) -> Dict:
+        """Get transcripts from specific YouTube channel"""
+        return await self._make_request('GET', f'/api/youtube/channel/{channel_handle}')
+
+    async def get_youtube_stats(self) -> Dict:
+        """Get YouTube transcript statistics"""
+        return await self._make_request('GET', '/api/youtube/stats')
+
+    # ==================== Scrape History ====================
+
+    async def get_scrape_history(self, limit: int = 10) -> Dict:
+        """Get recent scrape metadata showing execution history"""
+        return await self._make_request('GET', '/api/history', params={'limit': limit})
+
+    # ==================== Export & Backup ====================
+
+    async def export_json(self, include_metadata: bool = True) -> bytes:
+        """Export all data as JSON file"""
+        return await self._run_sync(MarketDataAPI.export_json, include_metadata)
+
+    async def export_csv(self, table_name: str) -> bytes:
+        """Export specific table as CSV"""
+        return await self._run_sync(MarketDataAPI.export_csv, table_name)
+
+    async def create_backup(self) -> Dict:
+        """Create timestamped database backup on server"""
+        return await self._make_request('POST', '/api/backup')
+
+    # ==================== Helper Methods ====================
+
+    async def is_data_fresh(self, max_age_hours: int = 1) -> bool:
+        """True if latest data is less than max_age_hours old"""
+        try:
+            status = await self.get_status()
+            if not status.get('success'):
+                return False
+            age = scrape_age(status)
+            return age is not None and age < timedelta(hours=max_age_hours)
+        except Exception as e:
+            print(f"Error checking data freshness: {e}")
+            return False
+
+    async def get_data_age_minutes(self) -> Optional[float]:
+        """Age of latest data in minutes, or None if unavailable"""
+        try:
+            age = scrape_age(await self.get_status())
+            return age.total_seconds() / 60 if age is not None else None
+        except Exception:
+            return None
+
+    async def close(self):
+        """Close connection pools"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._blocking_session.close()
+            self._executor = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        self._open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+
+def run_async(fn: Callable[[AsyncMarketDataAPI], Awaitable[T]], **client_kwargs) -> T:
+    """
+    Run coroutine(s) against a fresh async client from synchronous code
+
+    Args:
+        fn: Receives the client and returns an awaitable (e.g. a gather_many call)
+        **client_kwargs: AsyncMarketDataAPI arguments
+
+    Returns:
+        The awaitable's result
+    """
+    async def main():
+        async with AsyncMarketDataAPI(**client_kwargs) as api:
+            return await fn(api)
+
+    return asyncio.run(main())
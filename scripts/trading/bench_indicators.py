@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Indicator Micro-Benchmark: per-bar Python loops vs vectorized kernels
+
+Compares the original DataCollector formulas (kept here as reference
+implementations) against indicators.py on 100-bar and 5,000-bar series,
+checks that outputs match within tolerance, and times a whole-watchlist
+2-D call against one call per ticker.
+
+Usage:
+    python bench_indicators.py
+    python bench_indicators.py --tickers 60 --repeat 50
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+import numpy as np
+
+import indicators as ta
+
+
+# ==================== Reference implementations (pre-vectorization) ====================
+
+def legacy_rsi(prices: np.ndarray, period: int = 14) -> np.ndarray:
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.convolve(gains, np.ones(period)/period, mode='valid')
+    avg_loss = np.convolve(losses, np.ones(period)/period, mode='valid')
+    rs = avg_gain / (avg_loss + 1e-10)
+    return 100 - (100 / (1 + rs))
+
+
+def legacy_macd(prices: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict:
+    ema_fast = np.convolve(prices, np.ones(fast)/fast, mode='valid')
+    ema_slow = np.convolve(prices, np.ones(slow)/slow, mode='valid')
+    min_len = min(len(ema_fast), len(ema_slow))
+    macd_line = ema_fast[-min_len:] - ema_slow[-min_len:]
+    signal_line = np.convolve(macd_line, np.ones(signal)/signal, mode='valid')
+    histogram = macd_line[-len(signal_line):] - signal_line
+    return {'line': macd_line, 'signal': signal_line, 'histogram': histogram}
+
+
+def legacy_obv(prices: np.ndarray, volumes: np.ndarray) -> np.ndarray:
+    obv = np.zeros(len(prices))
+    obv[0] = volumes[0]
+    for i in range(1, len(prices)):
+        if prices[i] > prices[i-1]:
+            obv[i] = obv[i-1] + volumes[i]
+        elif prices[i] < prices[i-1]:
+            obv[i] = obv[i-1] - volumes[i]
+        else:
+            obv[i] = obv[i-1]
+    return obv
+
+
+def legacy_ema(prices: np.ndarray, period: int) -> np.ndarray:
+    multiplier = 2 / (period + 1)
+    ema = np.zeros(len(prices))
+    ema[0] = np.mean(prices[:period])
+    for i in range(1, len(prices)):
+        ema[i] = (prices[i] * multiplier) + (ema[i-1] * (1 - multiplier))
+    return ema
+
+
+def legacy_all(close: np.ndarray, volume: np.ndarray) -> None:
+    legacy_rsi(close)
+    legacy_macd(close)
+    legacy_obv(close, volume)
+    for period in (20, 50, 200):
+        legacy_ema(close, period)
+
+
+def vectorized_all(close: np.ndarray, volume: np.ndarray) -> None:
+    ta.rsi(close)
+    ta.macd(close)
+    ta.obv(close, volume)
+    for period in (20, 50, 200):
+        ta.ema(close, period)
+
+
+# ==================== Helpers ====================
+
+def random_walk(rows: int, bars: int, seed: int = 7):
+    """Synthetic close/volume data (rows x bars)"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, size=(rows, bars)), axis=1))
+    close = np.round(close, 2)  # exact ties exercise the flat-bar OBV branch
+    volume = rng.integers(1_000_000, 50_000_000, size=(rows, bars)).astype(np.float64)
+    return close, volume
+
+
+def best_time(fn: Callable, repeat: int) -> float:
+    """Best-of-N wall time in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def check_accuracy(close: np.ndarray, volume: np.ndarray, rtol: float = 1e-9) -> None:
+    """Assert vectorized kernels match the reference implementations"""
+    np.testing.assert_allclose(ta.rsi(close), legacy_rsi(close), rtol=rtol, atol=1e-7)
+    ref = legacy_macd(close)
+    new = ta.macd(close)
+    for key in ('line', 'signal', 'histogram'):
+        np.testing.assert_allclose(new[key], ref[key], rtol=rtol, atol=1e-7)
+    np.testing.assert_allclose(ta.obv(close, volume), legacy_obv(close, volume), rtol=rtol)
+    for period in (20, 50, 200):
+        if len(close) >= period:
+            np.testing.assert_allclose(ta.ema(close, period), legacy_ema(close, period), rtol=rtol)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indicator kernels")
+    parser.add_argument('--tickers', type=int, default=60, help="Rows for the 2-D watchlist case")
+    parser.add_argument('--repeat', type=int, default=20, help="Timing repetitions (best of N)")
+    args = parser.parse_args()
+
+    print("Indicator Micro-Benchmark")
+    print("=" * 60)
+
+    for bars in (100, 5000):
+        close, volume = random_walk(args.tickers, bars)
+        check_accuracy(close[0], volume[0])
+
+        legacy = best_time(lambda: legacy_all(close[0], volume[0]), args.repeat)
+        vector = best_time(lambda: vectorized_all(close[0], volume[0]), args.repeat)
+
+        per_ticker = best_time(
+            lambda: [vectorized_all(close[i], volume[i]) for i in range(args.tickers)],
+            args.repeat
+        )
+        matrix = best_time(lambda: vectorized_all(close, volume), args.repeat)
+
+        print(f"\n{bars} bars")
+        print(f"  Single series: loops {legacy * 1e3:8.3f} ms | vectorized {vector * 1e3:8.3f} ms "
+              f"| {legacy / vector:6.1f}x")
+        print(f"  Watchlist ({args.tickers}): per-ticker {per_ticker * 1e3:8.3f} ms "
+              f"| 2-D matrix {matrix * 1e3:8.3f} ms | {per_ticker / matrix:6.1f}x")
+        print("  Outputs match reference: OK")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
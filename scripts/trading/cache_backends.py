@@ -0,0 +1,321 @@
+"""
+Cache Backends Module: Storage backends for CacheManager
+- JSONFileBackend: one JSON file per ticker (data/cache/[TICKER].json), atomic replace on write
+- SQLiteBackend: one row per ticker in a WAL-mode database (data/cache/cache.db),
+  safe for concurrent readers/writers across threads and processes
+
+Every backend exposes a cheap per-ticker version token so CacheManager's
+in-memory layer can revalidate entries without reading the payload.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/cache_backends.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    """
+    Storage interface used by CacheManager
+
+    Entries are dicts with 'ticker', 'timestamp' (ISO string) and 'data'.
+    Methods raise on I/O errors; CacheManager handles logging/fallbacks.
+    """
+
+    name = 'base'
+
+    @abstractmethod
+    def version(self, ticker: str) -> Optional[Hashable]:
+        """Cheap change token for ticker's entry, or None if absent"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def read(self, ticker: str) -> Optional[Tuple[Hashable, Dict]]:
+        """(version, entry) for ticker, or None if absent"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def write(self, ticker: str, entry: Dict) -> Optional[Hashable]:
+        """Store entry and return its new version"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, ticker: str = None) -> int:
+        """Delete one ticker (or all when None); returns entries removed"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_tickers(self) -> List[str]:
+        """All tickers with an entry"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def status(self, resolve_time: Callable[[str], Optional[datetime]]) -> Dict:
+        """
+        Aggregate statistics
+
+        Args:
+            resolve_time: Returns an entry's timestamp (used by backends that
+                          cannot query timestamps directly)
+
+        Returns:
+            Dict with: entries, total_size_bytes, oldest_entry, newest_entry
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release resources"""
+
+
+class JSONFileBackend(CacheBackend):
+    """
+    One pretty-printed JSON file per ticker
+    """
+
+    name = 'json'
+
+    def __init__(self, cache_dir: str = 'data/cache'):
+        """
+        Initialize JSON file backend
+
+        Args:
+            cache_dir: Directory to store cache files
+        """
+        self.cache_dir = cache_dir
+        Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_file(self, ticker: str) -> str:
+        """Full path to cache file for ticker"""
+        return os.path.join(self.cache_dir, f"{ticker.upper()}.json")
+
+    def version(self, ticker: str) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the cache file, or None if missing"""
+        try:
+            stat = os.stat(self._get_cache_file(ticker))
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def read(self, ticker: str) -> Optional[Tuple[Tuple[int, int], Dict]]:
+        cache_file = self._get_cache_file(ticker)
+        try:
+            with open(cache_file, 'r') as f:
+                # Version of the file actually opened (a concurrent replace swaps the path, not this fd)
+                stat = os.fstat(f.fileno())
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size), entry
+
+    def write(self, ticker: str, entry: Dict) -> Tuple[int, int]:
+        # Write to a temp file and swap it in so readers never see a partial file
+        cache_file = self._get_cache_file(ticker)
+        tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(entry, f, indent=2)
+                f.flush()
+                # Version of the file we wrote (a stat after the replace may see another writer's file)
+                stat = os.fstat(f.fileno())
+            os.replace(tmp_file, cache_file)
+        finally:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        return stat.st_mtime_ns, stat.st_size
+
+    def delete(self, ticker: str = None) -> int:
+        if ticker is not None:
+            cache_file = self._get_cache_file(ticker)
+            if os.path.exists(cache_file):
+                os.remove(cache_file)
+                logger.info(f"Cleared cache for {ticker}")
+                return 1
+            return 0
+
+        cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
+        for cache_file in cache_files:
+            os.remove(os.path.join(self.cache_dir, cache_file))
+            logger.info(f"Cleared cache file: {cache_file}")
+        return len(cache_files)
+
+    def list_tickers(self) -> List[str]:
+        cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
+        return sorted(f.replace('.json', '') for f in cache_files)
+
+    def status(self, resolve_time: Callable[[str], Optional[datetime]]) -> Dict:
+        tickers = self.list_tickers()
+        total_size = 0
+        oldest_time = None
+        newest_time = None
+
+        for ticker in tickers:
+            version = self.version(ticker)
+            if version is None:
+                continue
+            total_size += version[1]
+
+            cache_time = resolve_time(ticker)
+            if cache_time:
+                if oldest_time is None or cache_time < oldest_time:
+                    oldest_time = cache_time
+                if newest_time is None or cache_time > newest_time:
+                    newest_time = cache_time
+
+        return {
+            'entries': len(tickers),
+            'total_size_bytes': total_size,
+            'oldest_entry': oldest_time.isoformat() if oldest_time else None,
+            'newest_entry': newest_time.isoformat() if newest_time else None,
+        }
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    SQLite database in WAL mode: one row per ticker, indexed timestamp
+
+    WAL lets the collector thread write while other threads/processes (e.g.
+    the Flask analysis API) read a consistent snapshot without blocking.
+    """
+
+    name = 'sqlite'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            ticker     TEXT PRIMARY KEY,
+            timestamp  TEXT NOT NULL,
+            payload    TEXT NOT NULL,
+            size       INTEGER NOT NULL,
+            updated_ns INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_cache_entries_timestamp ON cache_entries(timestamp);
+    """
+
+    def __init__(self, db_path: str = 'data/cache/cache.db', busy_timeout: float = 5.0):
+        """
+        Initialize SQLite backend
+
+        Args:
+            db_path: Database file path
+            busy_timeout: Seconds to wait on a locked database before failing
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        Path(os.path.dirname(db_path) or '.').mkdir(parents=True, exist_ok=True)
+
+        conn = self._connect()
+        with conn:
+            conn.executescript(self.SCHEMA)
+        logger.info(f"SQLite cache backend ready: {db_path}")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection (sqlite3 connections are not shared across threads)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def version(self, ticker: str) -> Optional[int]:
+        row = self._connect().execute(
+            'SELECT updated_ns FROM cache_entries WHERE ticker = ?', (ticker.upper(),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def read(self, ticker: str) -> Optional[Tuple[int, Dict]]:
+        row = self._connect().execute(
+            'SELECT updated_ns, payload FROM cache_entries WHERE ticker = ?', (ticker.upper(),)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def write(self, ticker: str, entry: Dict) -> int:
+        payload = json.dumps(entry, separators=(',', ':'))
+        updated_ns = time.time_ns()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                """
+                INSERT INTO cache_entries (ticker, timestamp, payload, size, updated_ns)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    timestamp = excluded.timestamp,
+                    payload = excluded.payload,
+                    size = excluded.size,
+                    updated_ns = excluded.updated_ns
+                """,
+                (ticker.upper(), entry.get('timestamp', ''), payload, len(payload), updated_ns)
+            )
+        return updated_ns
+
+    def delete(self, ticker: str = None) -> int:
+        conn = self._connect()
+        with conn:
+            if ticker is None:
+                cursor = conn.execute('DELETE FROM cache_entries')
+            else:
+                cursor = conn.execute('DELETE FROM cache_entries WHERE ticker = ?', (ticker.upper(),))
+        return cursor.rowcount
+
+    def list_tickers(self) -> List[str]:
+        rows = self._connect().execute('SELECT ticker FROM cache_entries ORDER BY ticker').fetchall()
+        return [row[0] for row in rows]
+
+    def status(self, resolve_time: Callable[[str], Optional[datetime]] = None) -> Dict:
+        entries, total_size, oldest, newest = self._connect().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0), MIN(timestamp), MAX(timestamp) FROM cache_entries'
+        ).fetchone()
+        return {
+            'entries': entries,
+            'total_size_bytes': total_size,
+            'oldest_entry': oldest,
+            'newest_entry': newest,
+        }
+
+    def close(self) -> None:
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def create_backend(kind: str, cache_dir: str = 'data/cache') -> CacheBackend:
+    """
+    Build a backend by name
+
+    Args:
+        kind: 'json' or 'sqlite'
+        cache_dir: Cache directory (SQLite database lives inside it as cache.db)
+
+    Returns:
+        CacheBackend instance
+
+    Raises:
+        ValueError: If kind is unknown
+    """
+    kind = (kind or 'json').lower()
+    if kind == 'json':
+        return JSONFileBackend(cache_dir)
+    if kind == 'sqlite':
+        return SQLiteBackend(os.path.join(cache_dir, 'cache.db'))
+    raise ValueError(f"Unknown cache backend: {kind}")
@@ -1,16 +1,26 @@
 """
-Cache Manager Module: Handles JSON caching of market data
-TTL: 5 minutes (300 seconds)
-Location: data/cache/[TICKER].json
+Cache Manager Module: Handles caching of market data
+TTL: 5 minutes (300 seconds); indicators: 30 minutes, checked against their own
+indicators_timestamp (merge() refreshes the entry timestamp on every quote write)
+Storage backends (see cache_backends.py):
+- json (default): data/cache/[TICKER].json
+- sqlite: data/cache/cache.db (WAL mode, safe for concurrent processes)
+Select with the backend argument or the CACHE_BACKEND environment variable.
+In-process layer: parsed entries kept in a bounded LRU, revalidated by backend version
 """
 
+import copy
 import json
 import os
 import logging
-from typing import Dict, Optional, List
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, List, Tuple, Union
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from cache_backends import CacheBackend, create_backend
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,34 +35,123 @@ logger = logging.getLogger(__name__)
 
 class CacheManager:
     """
-    Manages JSON-based caching with TTL (Time To Live)
+    Manages caching with TTL (Time To Live) on a pluggable storage backend
     """
 
-    def __init__(self, cache_dir: str = 'data/cache'):
+    def __init__(self, cache_dir: str = 'data/cache', max_memory_entries: int = 256,
+                 backend: Union[str, CacheBackend, None] = None, indicators_ttl: int = 1800):
         """
         Initialize cache manager
 
         Args:
             cache_dir: Directory to store cache files
+            max_memory_entries: Max parsed entries kept in memory (LRU eviction)
+            backend: 'json', 'sqlite' or a CacheBackend instance
+                     (default: CACHE_BACKEND env var, else 'json')
+            indicators_ttl: Max age in seconds of the indicators part of an entry
+                            (default: 1800 = two 15-minute candle refreshes)
         """
         self.cache_dir = cache_dir
         self.default_ttl = 300  # 5 minutes in seconds
+        self.indicators_ttl = indicators_ttl
+
+        # In-memory layer: ticker -> (backend version, cache entry, cache time)
+        self.max_memory_entries = max(1, max_memory_entries)
+        self._memory = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self.memory_hits = 0
+        self.memory_misses = 0
+
+        # Serializes read-modify-write in merge()
+        self._merge_lock = threading.Lock()
 
         # Create cache directory if it doesn't exist
         Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
-        logger.info(f"Cache manager initialized with directory: {self.cache_dir}")
 
-    def _get_cache_file(self, ticker: str) -> str:
+        if backend is None:
+            backend = os.getenv('CACHE_BACKEND', 'json')
+        self.backend = backend if isinstance(backend, CacheBackend) else create_backend(backend, self.cache_dir)
+        logger.info(f"Cache manager initialized with directory: {self.cache_dir} (backend: {self.backend.name})")
+
+    @staticmethod
+    def _parse_time(cache_entry: Dict) -> Optional[datetime]:
+        """Parse the entry timestamp, or None if missing"""
+        timestamp_str = cache_entry.get('timestamp')
+        return datetime.fromisoformat(timestamp_str) if timestamp_str else None
+
+    def _remember(self, ticker: str, version: Hashable, cache_entry: Dict) -> Tuple[Dict, Optional[datetime]]:
+        """Store a parsed entry in the in-memory layer (caller holds the lock)"""
+        record = (version, cache_entry, self._parse_time(cache_entry))
+        self._memory[ticker] = record
+        self._memory.move_to_end(ticker)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+        return record[1], record[2]
+
+    def _forget(self, ticker: str = None) -> None:
+        """Drop one ticker (or everything) from the in-memory layer"""
+        with self._memory_lock:
+            if ticker is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(ticker.upper(), None)
+
+    def _load_entry(self, ticker: str) -> Optional[Tuple[Dict, Optional[datetime]]]:
         """
-        Get full path to cache file for ticker
+        Get the parsed cache entry and its timestamp with at most one payload read
+
+        Served from memory while the backend version (file mtime/size, or row
+        update time) is unchanged.
 
         Args:
             ticker: Stock ticker symbol
 
         Returns:
-            Full file path
+            (cache_entry, cache_time) or None if not found/unreadable
         """
-        return os.path.join(self.cache_dir, f"{ticker.upper()}.json")
+        key = ticker.upper()
+        try:
+            version = self.backend.version(key)
+        except Exception as e:
+            logger.error(f"Error checking cache version for {ticker}: {e}")
+            return None
+
+        with self._memory_lock:
+            if version is None:
+                self._memory.pop(key, None)
+                return None
+
+            record = self._memory.get(key)
+            if record is not None and record[0] == version:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return record[1], record[2]
+
+            self.memory_misses += 1
+
+        try:
+            loaded = self.backend.read(key)
+        except json.JSONDecodeError as e:
+            logger.error(f"JSON decode error reading cache for {ticker}: {e}")
+            return None
+        except IOError as e:
+            logger.error(f"IO error reading cache for {ticker}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error reading cache for {ticker}: {e}")
+            return None
+
+        if loaded is None:
+            self._forget(key)
+            return None
+
+        version, cache_entry = loaded
+        try:
+            with self._memory_lock:
+                return self._remember(key, version, cache_entry)
+        except ValueError as e:
+            logger.error(f"Invalid timestamp in cache for {ticker}: {e}")
+            return cache_entry, None
 
     def save(self, ticker: str, data: Dict) -> bool:
         """
@@ -77,10 +176,13 @@ class CacheManager:
                 'data': data
             }
 
-            # Write to JSON file
-            cache_file = self._get_cache_file(ticker)
-            with open(cache_file, 'w') as f:
-                json.dump(cache_entry, f, indent=2)
+            # Write to backend
+            version = self.backend.write(ticker.upper(), cache_entry)
+
+            # Keep the just-written entry in memory (no re-read on next get)
+            with self._memory_lock:
+                if version is not None:
+                    self._remember(ticker.upper(), version, cache_entry)
 
             logger.info(f"Saved cache for {ticker}")
             return True
@@ -92,6 +194,35 @@ class CacheManager:
             logger.error(f"Error saving cache for {ticker}: {e}")
             return False
 
+    def merge(self, ticker: str, fields: Dict) -> bool:
+        """
+        Update some fields of a ticker's cached data, keeping the rest
+
+        Used when parts of an entry are refreshed on different schedules
+        (e.g. quote every 30s, indicators every 15 min). Stale entries are
+        still merged into; the entry timestamp becomes the time of this write,
+        so parts refreshed less often carry their own timestamp (see
+        _indicators_expired).
+
+        Args:
+            ticker: Stock ticker symbol
+            fields: Keys to set in the cached data dict
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not ticker or not fields:
+            logger.error(f"Invalid ticker or fields for cache merge")
+            return False
+
+        with self._merge_lock:
+            loaded = self._load_entry(ticker)
+            data = copy.deepcopy(loaded[0].get('data') or {}) if loaded else {}
+            data.update(fields)
+            data['ticker'] = ticker.upper()
+            data['timestamp'] = datetime.now().isoformat()
+            return self.save(ticker, data)
+
     def get(self, ticker: str) -> Optional[Dict]:
         """
         Retrieve ticker data from cache
@@ -106,42 +237,35 @@ class CacheManager:
             logger.error("Invalid ticker for cache get")
             return None
 
-        cache_file = self._get_cache_file(ticker)
-
-        # Check if file exists
-        if not os.path.exists(cache_file):
-            logger.debug(f"Cache miss for {ticker} (file not found)")
-            return None
-
         try:
-            with open(cache_file, 'r') as f:
-                cache_entry = json.load(f)
+            loaded = self._load_entry(ticker)
+            if loaded is None:
+                logger.debug(f"Cache miss for {ticker} (file not found)")
+                return None
+
+            cache_entry, cache_time = loaded
 
             # Check if stale
-            if self.is_stale(ticker):
+            if self._is_expired(ticker, cache_time, self.default_ttl) or \
+                    self._indicators_expired(ticker, cache_entry, self.indicators_ttl):
                 logger.debug(f"Cache stale for {ticker}")
                 return None
 
             logger.info(f"Cache hit for {ticker}")
-            return cache_entry.get('data')
+            # Copy so callers cannot mutate the shared in-memory entry
+            return copy.deepcopy(cache_entry.get('data'))
 
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error reading cache for {ticker}: {e}")
-            return None
-        except IOError as e:
-            logger.error(f"IO error reading cache for {ticker}: {e}")
-            return None
         except Exception as e:
             logger.error(f"Error reading cache for {ticker}: {e}")
             return None
 
     def is_stale(self, ticker: str, ttl: int = None) -> bool:
         """
-        Check if cached data is older than TTL
+        Check if cached data (or its indicators part) is older than TTL
 
         Args:
             ticker: Stock ticker symbol
-            ttl: TTL in seconds (default: 300 = 5 minutes)
+            ttl: TTL in seconds (default: 300 = 5 minutes); indicators use indicators_ttl
 
         Returns:
             True if stale or not found, False if fresh
@@ -149,39 +273,72 @@ class CacheManager:
         if ttl is None:
             ttl = self.default_ttl
 
-        cache_file = self._get_cache_file(ticker)
+        try:
+            loaded = self._load_entry(ticker)
+
+            # Not found = stale
+            if loaded is None:
+                return True
+
+            return self._is_expired(ticker, loaded[1], ttl) or \
+                self._indicators_expired(ticker, loaded[0], self.indicators_ttl)
 
-        # Not found = stale
-        if not os.path.exists(cache_file):
+        except Exception as e:
+            logger.error(f"Error checking staleness for {ticker}: {e}")
             return True
 
-        try:
-            with open(cache_file, 'r') as f:
-                cache_entry = json.load(f)
+    @staticmethod
+    def _is_expired(ticker: str, cache_time: Optional[datetime], ttl: int) -> bool:
+        """
+        Compare an entry's timestamp against TTL (no file I/O)
 
-            timestamp_str = cache_entry.get('timestamp')
-            if not timestamp_str:
-                logger.warning(f"No timestamp in cache for {ticker}")
-                return True
+        Args:
+            ticker: Stock ticker symbol (for logging)
+            cache_time: Entry timestamp (None = stale)
+            ttl: TTL in seconds
 
-            # Parse timestamp
-            cache_time = datetime.fromisoformat(timestamp_str)
-            current_time = datetime.now()
+        Returns:
+            True if stale
+        """
+        if cache_time is None:
+            logger.warning(f"No timestamp in cache for {ticker}")
+            return True
 
-            # Check age
-            age = (current_time - cache_time).total_seconds()
-            is_stale = age > ttl
+        # Check age
+        age = (datetime.now() - cache_time).total_seconds()
+        is_stale = age > ttl
 
-            if is_stale:
-                logger.debug(f"Cache for {ticker} is {age:.0f}s old (TTL: {ttl}s)")
-            else:
-                logger.debug(f"Cache for {ticker} is fresh ({age:.0f}s old)")
+        if is_stale:
+            logger.debug(f"Cache for {ticker} is {age:.0f}s old (TTL: {ttl}s)")
+        else:
+            logger.debug(f"Cache for {ticker} is fresh ({age:.0f}s old)")
 
-            return is_stale
+        return is_stale
 
-        except Exception as e:
-            logger.error(f"Error checking staleness for {ticker}: {e}")
+    def _indicators_expired(self, ticker: str, cache_entry: Dict, ttl: int) -> bool:
+        """
+        Check the entry's indicators_timestamp (written with the indicators) against TTL
+
+        Entries without one (no indicators yet, or saved whole) are judged by
+        the entry timestamp alone.
+
+        Args:
+            ticker: Stock ticker symbol (for logging)
+            cache_entry: Cache entry
+            ttl: TTL in seconds
+
+        Returns:
+            True if the indicators are stale
+        """
+        timestamp_str = (cache_entry.get('data') or {}).get('indicators_timestamp')
+        if not timestamp_str:
+            return False
+        try:
+            indicators_time = datetime.fromisoformat(timestamp_str)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid indicators timestamp in cache for {ticker}")
             return True
+        return self._is_expired(ticker, indicators_time, ttl)
 
     def clear(self, ticker: str = None) -> bool:
         """
@@ -195,20 +352,15 @@ class CacheManager:
         """
         try:
             if ticker is None:
-                # Clear all cache files
-                cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
-                for cache_file in cache_files:
-                    file_path = os.path.join(self.cache_dir, cache_file)
-                    os.remove(file_path)
-                    logger.info(f"Cleared cache file: {cache_file}")
-                logger.info(f"Cleared all cache ({len(cache_files)} files)")
+                # Clear all entries
+                removed = self.backend.delete()
+                self._forget()
+                logger.info(f"Cleared all cache ({removed} entries)")
                 return True
             else:
                 # Clear specific ticker
-                cache_file = self._get_cache_file(ticker)
-                if os.path.exists(cache_file):
-                    os.remove(cache_file)
-                    logger.info(f"Cleared cache for {ticker}")
+                self.backend.delete(ticker.upper())
+                self._forget(ticker)
                 return True
 
         except OSError as e:
@@ -228,11 +380,7 @@ class CacheManager:
         all_data = {}
 
         try:
-            cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
-
-            for cache_file in cache_files:
-                ticker = cache_file.replace('.json', '')
-
+            for ticker in self.backend.list_tickers():
                 # Get non-stale data only
                 data = self.get(ticker)
                 if data is not None:
@@ -256,45 +404,32 @@ class CacheManager:
             Dict with: entries (count), total_size (bytes), oldest (datetime), newest (datetime)
         """
         try:
-            cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
+            def resolve_time(ticker: str) -> Optional[datetime]:
+                # Timestamps from memory when the entry is unchanged
+                loaded = self._load_entry(ticker)
+                return loaded[1] if loaded else None
 
-            if not cache_files:
+            backend_status = self.backend.status(resolve_time)
+
+            if not backend_status['entries']:
                 return {
                     'entries': 0,
                     'total_size': 0,
                     'oldest': None,
                     'newest': None,
+                    'backend': self.backend.name,
+                    'memory_cache': self._memory_stats(),
                     'timestamp': datetime.now().isoformat()
                 }
 
-            total_size = 0
-            oldest_time = None
-            newest_time = None
-
-            for cache_file in cache_files:
-                file_path = os.path.join(self.cache_dir, cache_file)
-                total_size += os.path.getsize(file_path)
-
-                # Get timestamps
-                with open(file_path, 'r') as f:
-                    cache_entry = json.load(f)
-                    timestamp_str = cache_entry.get('timestamp')
-                    if timestamp_str:
-                        cache_time = datetime.fromisoformat(timestamp_str)
-                        if oldest_time is None or cache_time < oldest_time:
-                            oldest_time = cache_time
-                        if newest_time is None or cache_time > newest_time:
-                            newest_time = cache_time
-
             status = {
-                'entries': len(cache_files),
-                'total_size_bytes': total_size,
-                'oldest_entry': oldest_time.isoformat() if oldest_time else None,
-                'newest_entry': newest_time.isoformat() if newest_time else None,
+                **backend_status,
+                'backend': self.backend.name,
+                'memory_cache': self._memory_stats(),
                 'timestamp': datetime.now().isoformat()
             }
 
-            logger.info(f"Cache status: {status['entries']} entries, {total_size} bytes")
+            logger.info(f"Cache status: {status['entries']} entries, {status['total_size_bytes']} bytes")
             return status
 
         except Exception as e:
@@ -304,6 +439,23 @@ class CacheManager:
                 'timestamp': datetime.now().isoformat()
             }
 
+    def _memory_stats(self) -> Dict:
+        """
+        In-memory layer statistics
+
+        Returns:
+            Dict with: entries, max_entries, hits, misses, hit_rate
+        """
+        with self._memory_lock:
+            lookups = self.memory_hits + self.memory_misses
+            return {
+                'entries': len(self._memory),
+                'max_entries': self.max_memory_entries,
+                'hits': self.memory_hits,
+                'misses': self.memory_misses,
+                'hit_rate': round(self.memory_hits / lookups, 3) if lookups else None
+            }
+
     def get_tickers_in_cache(self) -> List[str]:
         """
         Get list of all tickers currently in cache
@@ -312,10 +464,8 @@ class CacheManager:
             List of ticker symbols
         """
         try:
-            cache_files = [f for f in os.listdir(self.cache_dir) if f.endswith('.json')]
-            tickers = [f.replace('.json', '') for f in cache_files]
-            return sorted(tickers)
+            return sorted(self.backend.list_tickers())
 
-        except OSError as e:
+        except Exception as e:
             logger.error(f"Error listing tickers in cache: {e}")
             return []
@@ -0,0 +1,379 @@
+"""
+Candle History Module: Columnar, memory-mapped OHLCV storage
+- One directory per (ticker, resolution): data/candles/[TICKER]_[RESOLUTION]/
+- One fixed-width little-endian file per column, named after the file set
+  (segment) they belong to: t.<segment>.i64, open.<segment>.f64, ...
+- header.json holds the row count, first/last timestamp and the current segment;
+  it is replaced atomically after column writes, so it is the single publish point
+- Appends extend the current segment's files past the published count; revised
+  tail bars (same timestamps, new values) are overwritten in place, so a refresh
+  costs O(changed bars). A reader mapping the tail during that write can see a
+  mix of old and new values for a bar being revised, never misaligned rows
+- Anything that shifts rows (out-of-order inserts) or drops them (reset) writes
+  a new segment and publishes it with the header swap, so readers see either the
+  old or the new column set as a whole. The previous segment is kept for readers
+  still holding the old header; older ones are removed on the next publish (files
+  Windows reports as mapped elsewhere are retried later)
+- Readers open columns with np.memmap and get zero-copy slices of the last N bars
+
+Usage:
+    history = CandleHistory('data/candles', 'SPY', 'D')
+    history.upsert(timestamps, {'open': [...], 'high': [...], ...})
+    bars = history.tail(500)          # dict of read-only memmap slices
+    closes = bars['close']
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/candle_history.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# Column name -> (file name, dtype)
+COLUMNS = {
+    't': ('t.i64', np.dtype('<i8')),
+    'open': ('open.f64', np.dtype('<f8')),
+    'high': ('high.f64', np.dtype('<f8')),
+    'low': ('low.f64', np.dtype('<f8')),
+    'close': ('close.f64', np.dtype('<f8')),
+    'volume': ('volume.f64', np.dtype('<f8')),
+}
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+HEADER_FILE = 'header.json'
+FORMAT_VERSION = 1
+
+
+class CandleHistory:
+    """
+    Append-mostly columnar OHLCV history for one (ticker, resolution)
+    """
+
+    def __init__(self, root_dir: str, ticker: str, resolution: str = 'D'):
+        """
+        Open (or create) a history directory
+
+        Args:
+            root_dir: Parent directory for all histories
+            ticker: Stock ticker symbol
+            resolution: Candle resolution ('D', '60', ...)
+        """
+        self.ticker = ticker.upper()
+        self.resolution = resolution
+        self.path = os.path.join(root_dir, f"{self.ticker}_{resolution}")
+        Path(self.path).mkdir(parents=True, exist_ok=True)
+
+    # ==================== Header ====================
+
+    def _header_path(self) -> str:
+        return os.path.join(self.path, HEADER_FILE)
+
+    def _column_path(self, column: str, segment: str) -> str:
+        stem, ext = os.path.splitext(COLUMNS[column][0])
+        return os.path.join(self.path, f"{stem}.{segment}{ext}")
+
+    def header(self) -> Dict:
+        """
+        Read the header index
+
+        Returns:
+            Dict with count, first_ts, last_ts, covered_from, full_fetch_at,
+            segment (column file set), generation (bumped by reset) and updated
+        """
+        try:
+            with open(self._header_path(), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'version': FORMAT_VERSION, 'ticker': self.ticker, 'resolution': self.resolution,
+                    'count': 0, 'first_ts': None, 'last_ts': None, 'covered_from': None,
+                    'segment': self._new_segment()}
+
+    @staticmethod
+    def _new_segment() -> str:
+        """Unique column file set id (collector and analyzer write the same directories)"""
+        return uuid.uuid4().hex[:12]
+
+    def _temp_path(self, name: str) -> str:
+        """Unique temp file next to name (collector and analyzer write the same directories)"""
+        fd, tmp_file = tempfile.mkstemp(dir=self.path, prefix=f"{name}.", suffix='.tmp')
+        os.close(fd)
+        return tmp_file
+
+    @staticmethod
+    def _replace(tmp_file: str, target: str, attempts: int = 5) -> None:
+        """os.replace, retrying briefly while Windows reports the target as open elsewhere"""
+        for attempt in range(attempts):
+            try:
+                os.replace(tmp_file, target)
+                return
+            except PermissionError:
+                if attempt == attempts - 1:
+                    os.remove(tmp_file)
+                    raise
+                time.sleep(0.05 * (attempt + 1))
+
+    def _write_header(self, header: Dict) -> None:
+        """Atomically replace the header (publishes new rows to readers)"""
+        header['updated'] = datetime.now().isoformat()
+        tmp_file = self._temp_path(HEADER_FILE)
+        with open(tmp_file, 'w') as f:
+            json.dump(header, f)
+        self._replace(tmp_file, self._header_path())
+
+    @property
+    def count(self) -> int:
+        """Number of published bars"""
+        return self.header()['count']
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Timestamp (epoch seconds) of the newest bar"""
+        return self.header()['last_ts']
+
+    # ==================== Reading ====================
+
+    def columns(self, header: Optional[Dict] = None, attempts: int = 3) -> Dict[str, np.ndarray]:
+        """
+        Memory-map every column (read-only, zero-copy)
+
+        Args:
+            header: Header whose rows to map (default: the published header)
+            attempts: Header re-reads if its segment was removed between
+                reading the header and mapping the files
+
+        Returns:
+            Dict column -> array of length header['count']
+        """
+        if header is not None:
+            return self._map(header)
+
+        for attempt in range(attempts):
+            try:
+                return self._map(self.header())
+            except (FileNotFoundError, ValueError):
+                if attempt == attempts - 1:
+                    raise
+
+    def _map(self, header: Dict) -> Dict[str, np.ndarray]:
+        """Memory-map the first header['count'] rows of the header's segment"""
+        count = header['count']
+        result = {}
+        for column, (_, dtype) in COLUMNS.items():
+            if count == 0:
+                result[column] = np.empty(0, dtype=dtype)
+            else:
+                result[column] = np.memmap(self._column_path(column, header['segment']), dtype=dtype,
+                                           mode='r', shape=(count,))
+        return result
+
+    def tail(self, n: int) -> Dict[str, np.ndarray]:
+        """
+        Last n bars as zero-copy slices
+
+        Args:
+            n: Number of bars
+
+        Returns:
+            Dict column -> array (length <= n)
+        """
+        return {column: values[-n:] if n > 0 else values[:0] for column, values in self.columns().items()}
+
+    def between(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """
+        Bars with start_ts <= t <= end_ts (binary search on the mapped time column)
+
+        Args:
+            start_ts: Inclusive start (epoch seconds), None = from the beginning
+            end_ts: Inclusive end (epoch seconds), None = to the end
+
+        Returns:
+            Dict column -> array slice
+        """
+        cols = self.columns()
+        times = cols['t']
+        lo = 0 if start_ts is None else int(np.searchsorted(times, start_ts, side='left'))
+        hi = len(times) if end_ts is None else int(np.searchsorted(times, end_ts, side='right'))
+        return {column: values[lo:hi] for column, values in cols.items()}
+
+    # ==================== Writing ====================
+
+    def _write_rows(self, segment: str, offset: int, rows: Dict[str, np.ndarray]) -> None:
+        """
+        Write rows in place into a segment's column files starting at row offset
+
+        Only call this for rows past the published count or rows whose
+        timestamps stay the same; anything that shifts rows goes to a new
+        segment via _publish_segment.
+
+        Args:
+            segment: Column file set to write
+            offset: First row to write
+            rows: Dict column -> values
+        """
+        for column, (_, dtype) in COLUMNS.items():
+            data = np.ascontiguousarray(rows[column], dtype=dtype)
+            path = self._column_path(column, segment)
+            mode = 'r+b' if os.path.exists(path) else 'w+b'
+            with open(path, mode) as f:
+                f.seek(offset * dtype.itemsize)
+                f.write(data.tobytes())
+
+    def _publish_segment(self, header: Dict, rows: Dict[str, np.ndarray]) -> None:
+        """
+        Write rows to a new segment and publish it with the header swap
+
+        Readers map whichever segment the header they read names, so they see
+        either all old or all new columns. The previous segment stays on disk
+        for readers that read the old header; older ones are removed.
+
+        Args:
+            header: Header to publish (count, first/last timestamp already set)
+            rows: Dict column -> values, header['count'] rows
+        """
+        previous = header.get('segment')
+        header['segment'] = self._new_segment()
+        if header['count']:
+            self._write_rows(header['segment'], 0, rows)
+        self._write_header(header)
+        self._remove_segments(keep={header['segment'], previous})
+
+    def _remove_segments(self, keep: set) -> None:
+        """Best-effort removal of column files from segments not in keep"""
+        stems = {os.path.splitext(file_name)[0] for file_name, _ in COLUMNS.values()}
+        for name in os.listdir(self.path):
+            parts = name.split('.')
+            if len(parts) != 3 or parts[0] not in stems or parts[1] in keep:
+                continue
+            try:
+                os.remove(os.path.join(self.path, name))
+            except OSError:
+                # Windows refuses while another process has it mapped; retried on the next publish
+                pass
+
+    def append(self, timestamps: Sequence[int], columns: Dict[str, Sequence[float]]) -> int:
+        """
+        Append bars newer than the last stored bar
+
+        Args:
+            timestamps: Epoch seconds, ascending, all > last_timestamp
+            columns: Dict with open/high/low/close/volume sequences
+
+        Returns:
+            New bar count
+
+        Raises:
+            ValueError: If timestamps are not strictly newer than stored bars
+        """
+        header = self.header()
+        times = np.asarray(timestamps, dtype=np.int64)
+        if len(times) == 0:
+            return header['count']
+        if np.any(np.diff(times) <= 0) or (header['last_ts'] is not None and times[0] <= header['last_ts']):
+            raise ValueError("append() requires strictly increasing timestamps after the last bar")
+
+        rows = {'t': times, **{column: np.asarray(columns[column], dtype=np.float64) for column in PRICE_COLUMNS}}
+        self._write_rows(header['segment'], header['count'], rows)
+
+        header['count'] += len(times)
+        header['first_ts'] = header['first_ts'] if header['first_ts'] is not None else int(times[0])
+        header['last_ts'] = int(times[-1])
+        self._write_header(header)
+        return header['count']
+
+    def upsert(self, timestamps: Sequence[int], columns: Dict[str, Sequence[float]],
+               covered_from: Optional[int] = None) -> int:
+        """
+        Merge bars: existing timestamps are overwritten, newer ones appended
+
+        The common case (revise the last bar(s) and append new ones) overwrites
+        the revised bars in place and appends the rest. Bars that would shift
+        stored rows (out-of-order inserts) are merged into a new segment that
+        the header swap publishes.
+
+        Args:
+            timestamps: Epoch seconds
+            columns: Dict with open/high/low/close/volume sequences
+            covered_from: Start of a full-window fetch that produced these bars
+
+        Returns:
+            New bar count
+        """
+        header = self.header()
+        if covered_from is not None:
+            previous = header.get('covered_from')
+            header['covered_from'] = min(covered_from, previous) if previous is not None else covered_from
+            header['full_fetch_at'] = int(time.time())
+
+        times = np.asarray(timestamps, dtype=np.int64)
+        if len(times) == 0:
+            self._write_header(header)
+            return header['count']
+
+        order = np.argsort(times, kind='stable')
+        times = times[order]
+        new = {column: np.asarray(columns[column], dtype=np.float64)[order] for column in PRICE_COLUMNS}
+        # Last occurrence wins for duplicate timestamps in the input
+        keep = np.append(times[1:] != times[:-1], True)
+        times = times[keep]
+        new = {column: values[keep] for column, values in new.items()}
+
+        count = header['count']
+        stored_times = self.columns(header)['t']
+        start = int(np.searchsorted(stored_times, times[0], side='left'))
+
+        # In place only if the stored rows from `start` keep their timestamps (values revised, rows not shifted)
+        tail_times = stored_times[start:]
+        if len(tail_times) <= len(times) and np.array_equal(tail_times, times[:len(tail_times)]):
+            del stored_times, tail_times
+            self._write_rows(header['segment'], start, {'t': times, **new})
+            header['count'] = start + len(times)
+            header['first_ts'] = header['first_ts'] if count else int(times[0])
+            header['last_ts'] = int(times[-1])
+            self._write_header(header)
+            return header['count']
+
+        stored = self.columns(header)
+        all_times = np.concatenate([stored['t'], times])
+        all_cols = {column: np.concatenate([stored[column], new[column]]) for column in PRICE_COLUMNS}
+        del stored, stored_times, tail_times
+        order = np.argsort(all_times, kind='stable')
+        all_times = all_times[order]
+        keep = np.append(all_times[1:] != all_times[:-1], True)
+        rows = {'t': all_times[keep], **{column: values[order][keep] for column, values in all_cols.items()}}
+        logger.info(f"{self.ticker} ({self.resolution}): out-of-order bars, writing a new segment")
+
+        header['count'] = len(rows['t'])
+        header['first_ts'] = int(rows['t'][0])
+        header['last_ts'] = int(rows['t'][-1])
+        self._publish_segment(header, rows)
+        return header['count']
+
+    def reset(self) -> None:
+        """
+        Drop all bars (e.g. after a corporate-action adjustment)
+
+        Publishes an empty new segment, so readers holding the old header
+        still map the old (intact) files. Bumps the header generation, so
+        state derived from the old bars (IndicatorState) can tell the history
+        was replaced.
+        """
+        header = self.header()
+        header.update({'count': 0, 'first_ts': None, 'last_ts': None, 'covered_from': None,
+                       'full_fetch_at': None, 'generation': header.get('generation', 0) + 1})
+        self._publish_segment(header, {})
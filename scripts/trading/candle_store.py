@@ -0,0 +1,210 @@
+"""
+Candle Store Module: Local OHLCV history keyed by (ticker, resolution)
+- APISourceManager reads the store first and fetches only bars after the
+  last stored timestamp (the last stored bar is re-fetched and overwritten)
+- Steady-state fetches are 1-2 bars instead of 100 days; the overlapping closed bar
+  is compared with the stored one, and a mismatch (split/dividend adjustment) clears
+  the store for a full refetch - as does a weekly full refresh (see APISourceManager)
+Location: data/candles/[TICKER]_[RESOLUTION]/ (columnar memmap format, see candle_history.py)
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+from candle_history import CandleHistory
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/candle_store.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def to_epoch_seconds(index: pd.DatetimeIndex) -> list:
+    """
+    Convert a (naive UTC) DatetimeIndex to a list of epoch seconds
+
+    Args:
+        index: DatetimeIndex of any resolution
+
+    Returns:
+        List of ints
+    """
+    return ((index - pd.Timestamp(0)) // pd.Timedelta(seconds=1)).tolist()
+
+
+def frame_from_arrays(timestamps, columns: Dict[str, list]) -> pd.DataFrame:
+    """
+    Build an OHLCV DataFrame indexed by timestamp (same layout as FinnhubAPI.get_candles)
+
+    Args:
+        timestamps: Epoch seconds
+        columns: Dict with open/high/low/close/volume lists
+
+    Returns:
+        DataFrame indexed by timestamp
+    """
+    df = pd.DataFrame({column: columns[column] for column in OHLCV_COLUMNS})
+    df['timestamp'] = pd.to_datetime(list(timestamps), unit='s')
+    df.set_index('timestamp', inplace=True)
+    return df
+
+
+class CandleStore:
+    """
+    Persistent OHLCV store with merge-on-write, backed by CandleHistory
+    """
+
+    def __init__(self, store_dir: str = 'data/candles'):
+        """
+        Initialize candle store
+
+        Args:
+            store_dir: Directory to store candle histories
+        """
+        self.store_dir = store_dir
+        self._lock = threading.Lock()
+        Path(self.store_dir).mkdir(parents=True, exist_ok=True)
+
+    def history(self, ticker: str, resolution: str = 'D') -> CandleHistory:
+        """
+        Direct columnar access (zero-copy memmap reads) for backtests and recomputes
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution ('D', '60', ...)
+
+        Returns:
+            CandleHistory instance
+        """
+        return CandleHistory(self.store_dir, ticker, resolution)
+
+    @staticmethod
+    def _to_frame(bars: Dict) -> Optional[pd.DataFrame]:
+        """DataFrame copy of mapped columns, or None if empty"""
+        if len(bars['t']) == 0:
+            return None
+        return frame_from_arrays(bars['t'].tolist(), {column: bars[column].tolist() for column in OHLCV_COLUMNS})
+
+    def load(self, ticker: str, resolution: str = 'D', last_n: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """
+        Load stored candles
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution ('D', '60', ...)
+            last_n: Only the newest N bars (default: all)
+
+        Returns:
+            DataFrame indexed by timestamp, or None if nothing is stored
+        """
+        try:
+            history = self.history(ticker, resolution)
+            bars = history.tail(last_n) if last_n else history.columns()
+            return self._to_frame(bars)
+        except (IOError, OSError, ValueError) as e:
+            logger.error(f"Error reading candle store for {ticker} ({resolution}): {e}")
+            return None
+
+    def get_coverage(self, ticker: str, resolution: str = 'D') -> Optional[int]:
+        """
+        Earliest requested start (epoch seconds) the store is complete from
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+
+        Returns:
+            Epoch seconds, or None if nothing is stored
+        """
+        header = self.history(ticker, resolution).header()
+        return header.get('covered_from') if header['count'] else None
+
+    def get_full_fetch_time(self, ticker: str, resolution: str = 'D') -> Optional[int]:
+        """
+        When the stored range was last fetched in full
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+
+        Returns:
+            Epoch seconds, or None if never (or cleared since)
+        """
+        return self.history(ticker, resolution).header().get('full_fetch_at')
+
+    def generation(self, ticker: str, resolution: str = 'D') -> int:
+        """
+        Store generation - changes whenever stored history is cleared and replaced
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+
+        Returns:
+            Generation counter (0 until the first clear)
+        """
+        return self.history(ticker, resolution).header().get('generation', 0)
+
+    def merge(self, ticker: str, resolution: str, candles: pd.DataFrame,
+              covered_from: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """
+        Merge fetched candles into the store (fetched bars overwrite stored bars)
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+            candles: Fetched DataFrame indexed by timestamp (may be empty)
+            covered_from: Start of the fetched range, if it was a full-window fetch
+
+        Returns:
+            Merged DataFrame, or None on error
+        """
+        with self._lock:
+            try:
+                history = self.history(ticker, resolution)
+
+                if candles is not None and not candles.empty:
+                    fetched = candles[OHLCV_COLUMNS]
+                    history.upsert(
+                        to_epoch_seconds(fetched.index),
+                        {column: fetched[column].to_numpy(dtype=float) for column in OHLCV_COLUMNS},
+                        covered_from=covered_from
+                    )
+                elif covered_from is not None:
+                    history.upsert([], {}, covered_from=covered_from)
+
+                return self._to_frame(history.columns())
+
+            except (IOError, OSError, ValueError) as e:
+                logger.error(f"IO error merging candles for {ticker} ({resolution}): {e}")
+                return None
+
+    def clear(self, ticker: str, resolution: str = 'D') -> bool:
+        """
+        Delete stored candles (next fetch downloads the full window); bumps the generation
+
+        Args:
+            ticker: Stock ticker symbol
+            resolution: Candle resolution
+
+        Returns:
+            True if successful
+        """
+        try:
+            self.history(ticker, resolution).reset()
+            return True
+        except OSError as e:
+            logger.error(f"Error clearing candle store for {ticker}: {e}")
+            return False
@@ -2,6 +2,7 @@
 Collector API: Flask endpoints for controlling the data collector from Command Center
 Provides REST API endpoints for:
 - Starting/stopping the collector
+- Requesting an immediate refresh
 - Adding/removing tickers
 - Getting collector status
 """
@@ -93,6 +94,32 @@ def get_status() -> Tuple[Dict, int]:
         return {'success': False, 'message': str(e)}, 500
 
 
+@collector_bp.route('/refresh', methods=['POST'])
+def refresh() -> Tuple[Dict, int]:
+    """Refresh one ticker (or all tickers) immediately"""
+    if not collector_instance:
+        return {'success': False, 'message': 'Collector not initialized'}, 500
+
+    if not collector_instance.is_running():
+        return {'success': False, 'message': 'Collector not running'}, 400
+
+    try:
+        data = request.get_json(silent=True) or {}
+        ticker = data.get('ticker', '').upper() or None
+
+        if ticker and not collector_instance.ticker_manager.is_tracked(ticker):
+            return {'success': False, 'message': f'{ticker} is not in the watchlist'}, 400
+
+        collector_instance.refresh_now(ticker)
+        return {
+            'success': True,
+            'message': f'Refresh requested for {ticker or "all tickers"}'
+        }, 200
+    except Exception as e:
+        logger.error(f"Error requesting refresh: {e}")
+        return {'success': False, 'message': str(e)}, 500
+
+
 @collector_bp.route('/ticker/add', methods=['POST'])
 def add_ticker() -> Tuple[Dict, int]:
     """Add ticker to watchlist"""
@@ -110,6 +137,9 @@ def add_ticker() -> Tuple[Dict, int]:
         success = collector_instance.ticker_manager.add_ticker(ticker)
 
         if success:
+            # Fetch the new ticker now instead of waiting for the next scheduled run
+            if collector_instance.is_running():
+                collector_instance.refresh_now(ticker)
             return {
                 'success': True,
                 'message': f'Added {ticker} to watchlist',
@@ -1,6 +1,8 @@
 """
 Data Collector Module: Background daemon for continuous market data collection
-- Runs independently every 5 minutes
+- Quote loop refreshes prices on a per-ticker schedule (protected tickers every
+  30s during regular hours, custom tickers every 2.5 minutes, everything hourly off-hours)
+- Candle loop refreshes candles/indicators/levels every 15 minutes
 - Fetches data from Finnhub API
 - Calculates technical indicators
 - Caches results for decision engine
@@ -11,15 +13,21 @@ import threading
 import time
 import json
 import logging
-from typing import Dict, Optional, List
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Optional, List
+from datetime import datetime
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import os
 
+import indicators as ta
 from api_sources import APISourceManager, FinnhubAPI, YahooFinanceScraper
 from cache_manager import CacheManager
+from candle_store import to_epoch_seconds
+from indicator_state import IndicatorState, IndicatorStateStore, reference_series
+from market_calendar import MarketCalendar
+from refresh_scheduler import RefreshScheduler, RefreshTier
 from ticker_manager import TickerManager
 
 # Configure logging
@@ -37,39 +45,95 @@ logger = logging.getLogger(__name__)
 class DataCollector:
     """
     Background service that continuously collects and processes market data
+
+    Two cooperating loops share the watchlist:
+    - quote loop: refreshes price/change at high frequency (cheap, one call)
+    - candle loop: refreshes candles, indicators and levels on a longer interval
+    Both merge their fields into the same cache entry.
     """
 
-    def __init__(self, api_key: str, update_interval: int = 300):
+    # Re-check the watchlist at least this often while idle (seconds)
+    WATCHLIST_CHECK_INTERVAL = 60
+
+    def __init__(self, api_key: str, update_interval: int = 150, max_workers: int = 8,
+                 priority_interval: int = 30, off_hours_interval: int = 3600,
+                 candle_interval: int = 900):
         """
         Initialize data collector
 
         Args:
             api_key: Finnhub API key
-            update_interval: Update interval in seconds (default: 300 = 5 minutes)
+            update_interval: Quote refresh interval for custom tickers in seconds (default: 150)
+            max_workers: Max tickers fetched concurrently per loop (default: 8)
+            priority_interval: Quote refresh interval for protected tickers during regular hours (default: 30)
+            off_hours_interval: Refresh interval for every ticker while the market is closed (default: 3600)
+            candle_interval: Candle/indicator refresh interval in seconds (default: 900 = 15 minutes)
         """
         self.api_key = api_key
         self.update_interval = update_interval
+        self.priority_interval = priority_interval
+        self.off_hours_interval = off_hours_interval
+        self.candle_interval = candle_interval
+        self.max_workers = max(1, max_workers)
         self.running = False
-        self.thread = None
+        self.threads = []
         self.last_run = None
+        self.last_quote_run = None
         self.next_run = None
         self.error_count = 0
         self.success_count = 0
 
+        # Cycle timing (seconds)
+        self.last_cycle_duration = None
+        self.last_quote_cycle_duration = None
+        self.ticker_latency = {}
+        self.quote_latency = {}
+        # Counters and latency maps are written by both loops and read for status
+        self._stats_lock = threading.Lock()
+
         # Initialize components
         self.api_manager = APISourceManager(api_key)
-        self.cache = CacheManager()
+        # Indicators count as stale once two candle refreshes were missed
+        self.cache = CacheManager(indicators_ttl=2 * candle_interval)
         self.ticker_manager = TickerManager()
 
+        # Per-ticker refresh schedules (quotes: priority tier for protected tickers)
+        self.calendar = MarketCalendar()
+        self.quote_scheduler = RefreshScheduler(
+            tiers={
+                'priority': RefreshTier('priority', priority_interval, update_interval, off_hours_interval),
+                'standard': RefreshTier('standard', update_interval, update_interval, off_hours_interval),
+            },
+            default_tier='standard',
+            calendar=self.calendar
+        )
+        for ticker in self.ticker_manager.get_protected_tickers():
+            self.quote_scheduler.set_tier(ticker, 'priority')
+
+        self.candle_scheduler = RefreshScheduler(
+            tiers={'candles': RefreshTier('candles', candle_interval, candle_interval, off_hours_interval)},
+            default_tier='candles',
+            calendar=self.calendar
+        )
+
+        # Streaming indicator state per ticker (loaded lazily, persisted each cycle)
+        self.indicator_store = IndicatorStateStore()
+        self._indicator_states = {}
+        self._state_lock = threading.Lock()
+
         # Status file
         self.status_file = 'data/collector_status.json'
+        self._status_lock = threading.Lock()
         Path(os.path.dirname(self.status_file)).mkdir(parents=True, exist_ok=True)
 
-        logger.info(f"Data collector initialized (interval: {update_interval}s)")
+        logger.info(
+            f"Data collector initialized (quotes: {priority_interval}s/{update_interval}s, "
+            f"candles: {candle_interval}s, workers: {self.max_workers})"
+        )
 
     def start(self) -> bool:
         """
-        Begin background collection loop
+        Begin background collection loops
 
         Returns:
             True if started successfully
@@ -79,8 +143,20 @@ class DataCollector:
             return False
 
         self.running = True
-        self.thread = threading.Thread(target=self._collection_loop, daemon=True)
-        self.thread.start()
+        self.threads = [
+            threading.Thread(
+                target=self._collection_loop,
+                args=('quotes', self.quote_scheduler, self._refresh_quotes),
+                name='collector-quotes', daemon=True
+            ),
+            threading.Thread(
+                target=self._collection_loop,
+                args=('candles', self.candle_scheduler, self._fetch_and_process_all),
+                name='collector-candles', daemon=True
+            ),
+        ]
+        for thread in self.threads:
+            thread.start()
 
         logger.info("Data collector started")
         self._update_status_file()
@@ -98,10 +174,13 @@ class DataCollector:
             return False
 
         self.running = False
+        self.quote_scheduler.wake()
+        self.candle_scheduler.wake()
 
-        # Wait for thread to finish (max 10 seconds)
-        if self.thread:
-            self.thread.join(timeout=10)
+        # Wait for threads to finish (max 10 seconds)
+        deadline = time.monotonic() + 10
+        for thread in self.threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
 
         logger.info("Data collector stopped")
         self._update_status_file()
@@ -116,79 +195,220 @@ class DataCollector:
         """
         return self.running
 
-    def _collection_loop(self) -> None:
+    def _collection_loop(self, name: str, scheduler: RefreshScheduler,
+                         process: Callable[[List[str]], None]) -> None:
         """
-        Main collection loop: runs continuously every update_interval seconds
+        Collection loop: refreshes tickers as they come due, then sleeps
+        until the next due time (or until stop/refresh wakes it)
+
+        Args:
+            name: Loop name for logging
+            scheduler: Schedule this loop follows
+            process: Handles a batch of due tickers
         """
-        logger.info("Collection loop started")
+        logger.info(f"Collection loop started ({name})")
 
         while self.running:
             try:
-                self._fetch_and_process_all()
-                self.success_count += 1
-                self._update_status_file()
-
-                # Calculate next run time
-                self.next_run = datetime.now() + timedelta(seconds=self.update_interval)
-                logger.info(f"Collection complete. Next run at {self.next_run.isoformat()}")
-
-                # Sleep until next interval
-                time.sleep(self.update_interval)
+                scheduler.sync(self.ticker_manager.get_watchlist())
+                due = scheduler.pop_due()
+
+                if due:
+                    try:
+                        process(due)
+                    finally:
+                        for ticker in due:
+                            scheduler.mark_refreshed(ticker)
+                    with self._stats_lock:
+                        self.success_count += 1
+
+                self._update_next_run()
+                if due:
+                    self._update_status_file()
+                    logger.info(
+                        f"Refreshed {name} for {len(due)} tickers. "
+                        f"Next run at {self.next_run.isoformat() if self.next_run else 'n/a'}"
+                    )
+
+                # Sleep until the next ticker is due
+                scheduler.wait(max_wait=self.WATCHLIST_CHECK_INTERVAL)
 
             except Exception as e:
-                logger.error(f"Error in collection loop: {e}", exc_info=True)
-                self.error_count += 1
+                logger.error(f"Error in {name} loop: {e}", exc_info=True)
+                with self._stats_lock:
+                    self.error_count += 1
                 # Continue running on error, retry after short delay
-                time.sleep(5)
+                scheduler.sleep(5)
 
-        logger.info("Collection loop ended")
+        logger.info(f"Collection loop ended ({name})")
 
-    def _fetch_and_process_all(self) -> None:
+    def refresh_now(self, ticker: Optional[str] = None) -> None:
         """
-        Fetch and process data for all tickers in watchlist
+        Refresh one ticker (or the whole watchlist) as soon as possible
+
+        Args:
+            ticker: Stock ticker symbol, or None for all tickers
         """
-        self.last_run = datetime.now()
         watchlist = self.ticker_manager.get_watchlist()
+        for scheduler in (self.quote_scheduler, self.candle_scheduler):
+            scheduler.sync(watchlist)
+            scheduler.request_refresh(ticker.upper() if ticker else None)
+        logger.info(f"Refresh requested for {ticker.upper() if ticker else 'all tickers'}")
+
+    def _update_next_run(self) -> None:
+        """Set next_run from the earliest scheduled refresh of either loop"""
+        due_times = [due for due in (self.quote_scheduler.next_due(), self.candle_scheduler.next_due())
+                     if due is not None]
+        self.next_run = datetime.fromtimestamp(min(due_times)) if due_times else None
+
+    def _run_batch(self, tickers: List[str], process: Callable[[str], object]) -> Dict[str, float]:
+        """
+        Run process(ticker) for each ticker on a bounded worker pool
 
-        logger.info(f"Processing {len(watchlist)} tickers")
+        All workers share the same APISourceManager, so the Finnhub rate
+        limit still holds across the batch.
 
-        for ticker in watchlist:
-            try:
-                self._fetch_and_process(ticker)
-            except Exception as e:
-                logger.error(f"Error processing {ticker}: {e}")
-                # Continue with next ticker
+        Args:
+            tickers: Tickers to process
+            process: Per-ticker work function
 
-    def _fetch_and_process(self, ticker: str) -> Optional[Dict]:
+        Returns:
+            Dict ticker -> wall time in seconds (failed tickers omitted)
         """
-        Fetch and process single ticker:
-        1. Fetch from API (price, candles)
-        2. Calculate indicators (RSI, MACD, OBV, MAs)
-        3. Detect support/resistance levels
-        4. Cache result
+        workers = min(self.max_workers, len(tickers))
+        latencies = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='collector') as executor:
+            futures = {
+                executor.submit(self._timed, process, ticker): ticker
+                for ticker in tickers
+            }
+
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    latencies[ticker] = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing {ticker}: {e}")
+                    # Continue with next ticker
+
+        return latencies
+
+    @staticmethod
+    def _timed(process: Callable[[str], object], ticker: str) -> float:
+        """
+        Run process(ticker) and measure its latency
 
         Args:
+            process: Per-ticker work function
             ticker: Stock ticker symbol
 
         Returns:
-            Processed data dict or None on error
+            Wall time in seconds spent on the ticker
         """
-        logger.debug(f"Processing {ticker}")
+        start = time.perf_counter()
+        try:
+            process(ticker)
+        finally:
+            latency = time.perf_counter() - start
+            logger.debug(f"{ticker} processed in {latency:.2f}s")
+        return latency
+
+    def _refresh_quotes(self, tickers: Optional[List[str]] = None) -> None:
+        """
+        Fetch quotes for the given tickers (default: whole watchlist) and merge them into the cache
+
+        Args:
+            tickers: Tickers to refresh
+        """
+        self.last_quote_run = datetime.now()
+        watchlist = tickers if tickers is not None else self.ticker_manager.get_watchlist()
+        if not watchlist:
+            return
+
+        cycle_start = time.perf_counter()
+        latencies = self._run_batch(watchlist, self._refresh_quote)
+        with self._stats_lock:
+            self.last_quote_cycle_duration = time.perf_counter() - cycle_start
+            self.quote_latency.update(latencies)
 
-        # Fetch quote
+        logger.info(f"Quotes refreshed for {len(latencies)}/{len(watchlist)} tickers "
+                    f"in {self.last_quote_cycle_duration:.2f}s")
+
+    def _refresh_quote(self, ticker: str) -> Optional[Dict]:
+        """
+        Fetch one quote and merge it into the ticker's cache entry
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Quote dict or None on error
+        """
         quote = self.api_manager.get_quote(ticker)
         if quote is None:
             logger.error(f"Failed to fetch quote for {ticker}")
             return None
 
+        if not self.cache.merge(ticker, {'quote': quote, 'quote_timestamp': datetime.now().isoformat()}):
+            logger.error(f"Failed to cache quote for {ticker}")
+
+        return quote
+
+    def _fetch_and_process_all(self, tickers: Optional[List[str]] = None) -> None:
+        """
+        Refresh candles, indicators and levels for the given tickers (default: whole watchlist)
+
+        Args:
+            tickers: Tickers to refresh (default: all tickers in watchlist)
+        """
+        self.last_run = datetime.now()
+        watchlist = tickers if tickers is not None else self.ticker_manager.get_watchlist()
+
+        if not watchlist:
+            logger.info("Watchlist empty, nothing to process")
+            return
+
+        logger.info(f"Processing {len(watchlist)} tickers ({min(self.max_workers, len(watchlist))} workers)")
+
+        cycle_start = time.perf_counter()
+        latencies = self._run_batch(watchlist, self._fetch_and_process)
+        with self._stats_lock:
+            self.last_cycle_duration = time.perf_counter() - cycle_start
+            self.ticker_latency.update(latencies)
+
+        if latencies:
+            avg_latency = sum(latencies.values()) / len(latencies)
+            slowest = max(latencies, key=latencies.get)
+            logger.info(
+                f"Cycle finished in {self.last_cycle_duration:.2f}s "
+                f"(avg {avg_latency:.2f}s/ticker, slowest {slowest} {latencies[slowest]:.2f}s)"
+            )
+
+    def _fetch_and_process(self, ticker: str) -> Optional[Dict]:
+        """
+        Fetch and process single ticker (quotes are handled by the quote loop):
+        1. Fetch candles
+        2. Calculate indicators (RSI, MACD, OBV, MAs)
+        3. Detect support/resistance levels
+        4. Merge into cache entry
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Processed fields dict or None on error
+        """
+        logger.debug(f"Processing {ticker}")
+
         # Fetch candles
         candles = self.api_manager.get_candles(ticker, days=100)
         if candles is None or candles.empty:
             logger.error(f"Failed to fetch candles for {ticker}")
             return None
 
-        # Calculate indicators
-        indicators = self._calculate_indicators(candles)
+        # Calculate indicators (incremental when the stored state still lines up)
+        indicators = self._update_indicators(ticker, candles)
         if indicators is None:
             logger.warning(f"Failed to calculate indicators for {ticker}")
             indicators = {}
@@ -201,22 +421,120 @@ class DataCollector:
 
         # Build result
         result = {
-            'ticker': ticker,
-            'timestamp': datetime.now().isoformat(),
-            'quote': quote,
             'indicators': indicators,
             'levels': levels,
-            'candle_count': len(candles)
+            'candle_count': len(candles),
+            'indicators_timestamp': datetime.now().isoformat()
         }
 
-        # Cache result
-        if self.cache.save(ticker, result):
+        # Merge into cache (keeps the quote written by the quote loop)
+        if self.cache.merge(ticker, result):
             logger.info(f"Cached data for {ticker}")
         else:
             logger.error(f"Failed to cache data for {ticker}")
 
         return result
 
+    def _get_indicator_state(self, ticker: str) -> IndicatorState:
+        """
+        Get the in-memory indicator state for ticker, loading it on first use
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            IndicatorState instance
+        """
+        with self._state_lock:
+            state = self._indicator_states.get(ticker)
+            if state is None:
+                state = self.indicator_store.load(ticker)
+                self._indicator_states[ticker] = state
+            return state
+
+    def reset_indicator_state(self, ticker: str) -> None:
+        """
+        Force a full indicator recompute for ticker on its next update
+        (e.g. after a split or other corporate action)
+
+        Args:
+            ticker: Stock ticker symbol
+        """
+        with self._state_lock:
+            self._indicator_states.pop(ticker, None)
+        self.indicator_store.delete(ticker)
+        logger.info(f"Indicator state reset for {ticker}")
+
+    def _stored_history(self, ticker: str):
+        """
+        Reader for the ticker's stored daily bars (see indicator_state.HistoryReader)
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Callable (start_ts, end_ts) -> (timestamps, closes, volumes) for start_ts <= t < end_ts
+        """
+        store = self.api_manager.candle_store
+
+        def read(start_ts: Optional[int], end_ts: int):
+            bars = store.history(ticker, 'D').between(start_ts, end_ts - 1)
+            # tolist() copies out of the memmaps so a concurrent rewrite can replace the files
+            return bars['t'].tolist(), bars['close'].tolist(), bars['volume'].tolist()
+
+        return read
+
+    def _update_indicators(self, ticker: str, candles: pd.DataFrame) -> Optional[Dict]:
+        """
+        Update the ticker's streaming indicator state from the latest candles
+
+        Only bars at or after the last processed bar are applied (O(1) per bar).
+        Falls back to a full recompute over the stored history on gaps or when
+        the candle store replaced restated history, and to _calculate_indicators
+        when candles carry no timestamp index.
+
+        Args:
+            ticker: Stock ticker symbol
+            candles: DataFrame with OHLCV data indexed by timestamp
+
+        Returns:
+            Dict with indicator values
+        """
+        if candles is None or candles.empty or len(candles) < 14:
+            return None
+
+        if not isinstance(candles.index, pd.DatetimeIndex):
+            return self._calculate_indicators(candles)
+
+        close = candles['close'].tolist()
+        volume = candles['volume'].tolist()
+        history = self._stored_history(ticker)
+        timestamps = None
+
+        try:
+            timestamps = to_epoch_seconds(candles.index)
+            generation = self.api_manager.candle_store.generation(ticker, 'D')
+            state = self._get_indicator_state(ticker)
+            incremental = state.sync(timestamps, close, volume, history=history, generation=generation)
+            indicators = state.values()
+            self.indicator_store.save(state)
+
+            logger.debug(f"{ticker} indicators {'updated incrementally' if incremental else 'recomputed'}")
+            return indicators
+
+        except Exception as e:
+            logger.error(f"Error updating indicator state for {ticker}: {e}")
+            self.reset_indicator_state(ticker)
+            if timestamps is None:
+                return self._calculate_indicators(candles)
+            try:
+                # Same series a fresh state would be built from, so the values match the streaming path
+                _, ref_close, ref_volume = reference_series(timestamps, close, volume, history)
+                return ta.latest_values(ref_close, ref_volume)
+            except Exception as e:
+                logger.error(f"Error recomputing indicators for {ticker} from stored history: {e}")
+                return self._calculate_indicators(candles)
+
     def _calculate_indicators(self, candles: pd.DataFrame) -> Optional[Dict]:
         """
         Calculate technical indicators from OHLCV data
@@ -234,44 +552,8 @@ class DataCollector:
             close = candles['close'].values
             volume = candles['volume'].values
 
-            indicators = {}
-
-            # RSI (14-period)
-            rsi = self._calculate_rsi(close, period=14)
-            if rsi is not None:
-                indicators['rsi'] = float(rsi[-1]) if len(rsi) > 0 else None
-                indicators['rsi_period'] = 14
-
-            # MACD (12/26/9)
-            macd_result = self._calculate_macd(close, fast=12, slow=26, signal=9)
-            if macd_result is not None:
-                indicators['macd_line'] = float(macd_result['line'][-1]) if len(macd_result['line']) > 0 else None
-                indicators['macd_signal'] = float(macd_result['signal'][-1]) if len(macd_result['signal']) > 0 else None
-                indicators['macd_histogram'] = float(macd_result['histogram'][-1]) if len(macd_result['histogram']) > 0 else None
-
-            # OBV (On-Balance Volume)
-            obv = self._calculate_obv(close, volume)
-            if obv is not None:
-                indicators['obv'] = float(obv[-1]) if len(obv) > 0 else None
-
-            # Moving Averages (EMA 20, 50, 200)
-            ema20 = self._calculate_ema(close, period=20)
-            if ema20 is not None:
-                indicators['ema_20'] = float(ema20[-1]) if len(ema20) > 0 else None
-
-            ema50 = self._calculate_ema(close, period=50)
-            if ema50 is not None:
-                indicators['ema_50'] = float(ema50[-1]) if len(ema50) > 0 else None
-
-            ema200 = self._calculate_ema(close, period=200)
-            if ema200 is not None:
-                indicators['ema_200'] = float(ema200[-1]) if len(ema200) > 0 else None
-
-            # Trend direction
-            if ema20 is not None and ema50 is not None and ema200 is not None:
-                current_price = close[-1]
-                indicators['trend'] = 'UPTREND' if ema20[-1] > ema50[-1] > ema200[-1] else 'DOWNTREND'
-                indicators['price'] = float(current_price)
+            # RSI (14), MACD (12/26/9), OBV, EMA 20/50/200 and trend in one vectorized pass
+            indicators = ta.latest_values(close, volume)
 
             logger.debug(f"Calculated {len(indicators)} indicators")
             return indicators
@@ -345,76 +627,47 @@ class DataCollector:
     @staticmethod
     def _calculate_rsi(prices: np.ndarray, period: int = 14) -> Optional[np.ndarray]:
         """Calculate RSI indicator"""
-        if len(prices) < period:
-            return None
-
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.convolve(gains, np.ones(period)/period, mode='valid')
-        avg_loss = np.convolve(losses, np.ones(period)/period, mode='valid')
-
-        rs = avg_gain / (avg_loss + 1e-10)
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi
+        return ta.rsi(prices, period=period)
 
     @staticmethod
     def _calculate_macd(prices: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> Optional[Dict]:
         """Calculate MACD indicator"""
-        if len(prices) < slow:
-            return None
-
-        ema_fast = np.convolve(prices, np.ones(fast)/fast, mode='valid')
-        ema_slow = np.convolve(prices, np.ones(slow)/slow, mode='valid')
-
-        # Align arrays
-        min_len = min(len(ema_fast), len(ema_slow))
-        macd_line = ema_fast[-min_len:] - ema_slow[-min_len:]
-
-        signal_line = np.convolve(macd_line, np.ones(signal)/signal, mode='valid')
-        histogram = macd_line[-len(signal_line):] - signal_line
-
-        return {
-            'line': macd_line,
-            'signal': signal_line,
-            'histogram': histogram
-        }
+        return ta.macd(prices, fast=fast, slow=slow, signal=signal)
 
     @staticmethod
     def _calculate_obv(prices: np.ndarray, volumes: np.ndarray) -> Optional[np.ndarray]:
         """Calculate OBV indicator"""
-        if len(prices) != len(volumes):
-            return None
-
-        obv = np.zeros(len(prices))
-        obv[0] = volumes[0]
-
-        for i in range(1, len(prices)):
-            if prices[i] > prices[i-1]:
-                obv[i] = obv[i-1] + volumes[i]
-            elif prices[i] < prices[i-1]:
-                obv[i] = obv[i-1] - volumes[i]
-            else:
-                obv[i] = obv[i-1]
-
-        return obv
+        return ta.obv(prices, volumes)
 
     @staticmethod
     def _calculate_ema(prices: np.ndarray, period: int) -> Optional[np.ndarray]:
         """Calculate EMA (Exponential Moving Average)"""
-        if len(prices) < period:
-            return None
-
-        multiplier = 2 / (period + 1)
-        ema = np.zeros(len(prices))
-        ema[0] = np.mean(prices[:period])
+        return ta.ema(prices, period=period)
 
-        for i in range(1, len(prices)):
-            ema[i] = (prices[i] * multiplier) + (ema[i-1] * (1 - multiplier))
-
-        return ema
+    @staticmethod
+    def _round_seconds(value: Optional[float]) -> Optional[float]:
+        """Round a duration for status output"""
+        return round(value, 3) if value is not None else None
+
+    def _latency_summary(self, latencies: Dict[str, float]) -> Dict[str, float]:
+        """Per-ticker latency (seconds) from each ticker's latest refresh"""
+        watchlist = set(self.ticker_manager.get_watchlist())
+        with self._stats_lock:
+            latencies = dict(latencies)
+        return {ticker: round(latency, 3) for ticker, latency in sorted(latencies.items())
+                if ticker in watchlist}
+
+    def _counters(self) -> Dict[str, int]:
+        """Consistent snapshot of the success/error counters"""
+        with self._stats_lock:
+            return {'success_count': self.success_count, 'error_count': self.error_count}
+
+    def _schedule_status(self) -> Dict:
+        """Refresh schedules of both loops"""
+        return {
+            'quotes': self.quote_scheduler.get_status(),
+            'candles': self.candle_scheduler.get_status()
+        }
 
     def _update_status_file(self) -> None:
         """Update status JSON file for frontend"""
@@ -423,18 +676,27 @@ class DataCollector:
                 'running': self.running,
                 'last_run': self.last_run.isoformat() if self.last_run else None,
                 'next_run': self.next_run.isoformat() if self.next_run else None,
+                'last_quote_run': self.last_quote_run.isoformat() if self.last_quote_run else None,
                 'update_interval': self.update_interval,
+                'candle_interval': self.candle_interval,
+                'max_workers': self.max_workers,
+                'last_cycle_seconds': self._round_seconds(self.last_cycle_duration),
+                'last_quote_cycle_seconds': self._round_seconds(self.last_quote_cycle_duration),
+                'ticker_latency': self._latency_summary(self.ticker_latency),
+                'quote_latency': self._latency_summary(self.quote_latency),
+                'schedule': self._schedule_status(),
                 'tickers_tracked': len(self.ticker_manager.get_watchlist()),
                 'cache_entries': len(self.cache.get_tickers_in_cache()),
-                'success_count': self.success_count,
-                'error_count': self.error_count,
+                **self._counters(),
                 'timestamp': datetime.now().isoformat(),
                 'watchlist': self.ticker_manager.get_watchlist(),
                 'api_status': self.api_manager.get_api_status()
             }
 
-            with open(self.status_file, 'w') as f:
-                json.dump(status, f, indent=2)
+            # Both loops write the status file
+            with self._status_lock:
+                with open(self.status_file, 'w') as f:
+                    json.dump(status, f, indent=2)
 
         except Exception as e:
             logger.error(f"Error updating status file: {e}")
@@ -452,11 +714,19 @@ class DataCollector:
             'running': self.running,
             'last_run': self.last_run.isoformat() if self.last_run else None,
             'next_run': self.next_run.isoformat() if self.next_run else None,
+            'last_quote_run': self.last_quote_run.isoformat() if self.last_quote_run else None,
             'update_interval': self.update_interval,
+            'candle_interval': self.candle_interval,
+            'max_workers': self.max_workers,
+            'last_cycle_seconds': self._round_seconds(self.last_cycle_duration),
+            'last_quote_cycle_seconds': self._round_seconds(self.last_quote_cycle_duration),
+            'ticker_latency': self._latency_summary(self.ticker_latency),
+            'quote_latency': self._latency_summary(self.quote_latency),
+            'schedule': self._schedule_status(),
+            'market': self.calendar.get_status(),
             'tickers_tracked': len(self.ticker_manager.get_watchlist()),
             'cache_entries': cache_status.get('entries', 0),
-            'success_count': self.success_count,
-            'error_count': self.error_count,
+            **self._counters(),
             'watchlist': self.ticker_manager.get_watchlist(),
             'timestamp': datetime.now().isoformat()
         }
@@ -0,0 +1,205 @@
+"""
+Feed Store Module: Incremental pulls of API feeds (RSS articles, YouTube transcripts)
+- Persisted high-water mark per feed (newest scraped_at seen), so each run only
+  downloads items newer than the last run
+- Incremental pulls start with a small page and grow the limit until they reach
+  known items; only an empty store backfills the whole retention window
+- Rolling local store pruned to the retention window; the 1-day / 7-day views
+  are assembled locally
+- Items already stored are replaced when the API returns a changed copy
+  (e.g. a YouTube video whose Ollama summary was generated after it was first
+  pulled)
+
+The API returns newest items first and has no cursor parameter, so "paging" is
+re-requesting with a doubled limit; steady-state runs fit in the first page.
+Timestamps ('2025-11-13T10:20:00.000Z') are parsed with fromisoformat before
+comparing, so offsets and missing fractions order correctly.
+
+Imported by the scout collector, so it only logs through its module logger.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def iso_utc(moment: datetime) -> str:
+    """Timestamp in the API's scraped_at format"""
+    return moment.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.') + \
+        f"{moment.microsecond // 1000:03d}Z"
+
+
+def parse_iso(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse an API timestamp to an aware UTC datetime
+
+    Args:
+        value: ISO-8601 string ('Z' or offset suffix; naive = UTC)
+
+    Returns:
+        datetime, or None if missing or unparseable
+    """
+    if not value:
+        return None
+    try:
+        moment = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+class FeedStore:
+    """Rolling local copy of one feed with a persisted high-water mark"""
+
+    def __init__(self, name: str, path: Path, fetch: Callable[[int], Dict],
+                 retention: timedelta = timedelta(days=7), page_size: int = 25,
+                 backfill_limit: int = 200, max_limit: int = 1000,
+                 id_field: str = 'id', time_field: str = 'scraped_at'):
+        """
+        Initialize feed store
+
+        Args:
+            name: Feed name (for logs)
+            path: JSON file holding the store
+            fetch: Called with a limit; returns the API response ({"success", "data"})
+            retention: How long items are kept locally
+            page_size: Limit of the first request of an incremental pull
+            backfill_limit: Limit of the first request when the store is empty
+            max_limit: Largest limit a pull will request
+            id_field: Unique item key
+            time_field: Item timestamp the high-water mark tracks
+        """
+        self.name = name
+        self.path = Path(path)
+        self.fetch = fetch
+        self.retention = retention
+        self.page_size = page_size
+        self.backfill_limit = backfill_limit
+        self.max_limit = max_limit
+        self.id_field = id_field
+        self.time_field = time_field
+
+        self._lock = threading.Lock()
+        self._items = {}            # id -> item
+        self.high_water_mark = None
+        self._load()
+
+    def _load(self) -> None:
+        """Read the store from disk (missing or corrupt file = empty store)"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.high_water_mark = data.get('high_water_mark')
+            self._items = {str(item[self.id_field]): item for item in data.get('items', [])}
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Feed store {self.name}: could not read {self.path} ({e}), starting empty")
+            self._items = {}
+            self.high_water_mark = None
+
+    def _save(self) -> None:
+        """Write the store atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'feed': self.name,
+                'high_water_mark': self.high_water_mark,
+                'updated': iso_utc(datetime.now(timezone.utc)),
+                'items': self.items(),
+            }, f)
+        os.replace(tmp, self.path)
+
+    def pull(self, now: Optional[datetime] = None) -> Dict:
+        """
+        Fetch items newer than the high-water mark and merge them into the store
+
+        Args:
+            now: Current time (default: now)
+
+        Returns:
+            {"success": bool, "error": str or None, "new": int, "updated": int,
+             "requests": int, "limit": int}
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - self.retention
+        stats = {'success': False, 'error': None, 'new': 0, 'updated': 0, 'requests': 0, 'limit': 0}
+
+        with self._lock:
+            # First run (or store expired): fill the whole retention window
+            mark = parse_iso(self.high_water_mark)
+            incremental = mark is not None and mark > cutoff
+            floor = mark if incremental else cutoff
+
+            limit = self.page_size if incremental else self.backfill_limit
+            while True:
+                response = self.fetch(limit)
+                stats['requests'] += 1
+                stats['limit'] = limit
+                if not response.get('success'):
+                    stats['error'] = response.get('error', 'Unknown')
+                    return stats
+
+                page = response.get('data', [])
+                stamps = [parse_iso(item.get(self.time_field)) for item in page]
+                # Unparseable stamps count as old, so a bad item ends the paging
+                oldest = min((stamp or floor for stamp in stamps), default=floor)
+                # Done once the page reaches known/expired items or the feed has nothing older
+                if len(page) < limit or oldest <= floor or limit >= self.max_limit:
+                    break
+                limit = min(limit * 2, self.max_limit)
+
+            for item, stamp in zip(page, stamps):
+                if stamp is None or stamp < cutoff:
+                    continue
+                key = str(item.get(self.id_field))
+                stored = self._items.get(key)
+                if stored == item:
+                    continue
+                self._items[key] = item
+                stats['updated' if stored is not None else 'new'] += 1
+                if mark is None or stamp > mark:
+                    mark = stamp
+                    self.high_water_mark = item.get(self.time_field)
+
+            # Drop items that left the retention window
+            kept = {}
+            for key, item in self._items.items():
+                stamp = parse_iso(item.get(self.time_field))
+                if stamp is not None and stamp >= cutoff:
+                    kept[key] = item
+            self._items = kept
+            self._save()
+
+        stats['success'] = True
+        logger.info(f"Feed {self.name}: {stats['new']} new and {stats['updated']} updated items in "
+                    f"{stats['requests']} request(s), {len(self._items)} stored")
+        return stats
+
+    def items(self, max_age: Optional[timedelta] = None, now: Optional[datetime] = None) -> List[Dict]:
+        """
+        Stored items, newest first
+
+        Args:
+            max_age: Only items scraped within this window (None = all stored)
+            now: Current time (default: now)
+
+        Returns:
+            List of items
+        """
+        stamped = [(parse_iso(item.get(self.time_field)), item) for item in self._items.values()]
+        if max_age:
+            cutoff = (now or datetime.now(timezone.utc)) - max_age
+            stamped = [(stamp, item) for stamp, item in stamped if stamp is not None and stamp > cutoff]
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        stamped.sort(key=lambda pair: pair[0] or oldest, reverse=True)
+        return [item for _, item in stamped]
+
+    def __len__(self) -> int:
+        return len(self._items)
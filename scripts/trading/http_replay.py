@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+HTTP Record/Replay: Offline, reproducible runs of the data layer
+- Hooks requests.Session.send, so every client is covered without changes:
+  FinnhubAPI, YahooFinanceScraper, MarketDataAPI and the Polygon/yfinance
+  options fetcher (yfinance builds that are not on requests are not captured)
+- Record mode passes requests through and captures the final responses (after
+  adapter retries) to a gzip-compressed JSON cassette
+- Replay mode answers from the cassette with no network: at full speed,
+  with the recorded latency, or with a fixed synthetic latency
+- API keys (token / apiKey query params) are never written to the cassette
+
+Time-dependent query params (Finnhub candle from/to, date ranges) change between
+runs, so a request that has no exact match is matched again without them.
+
+Usage:
+    python http_replay.py record data/cassettes/collector.json.gz data_collector.py
+    python http_replay.py replay data/cassettes/collector.json.gz data_collector.py
+    python http_replay.py replay data/cassettes/collector.json.gz --latency recorded analyze_ticker_v2.py NVDA
+    python http_replay.py info data/cassettes/collector.json.gz
+
+In code:
+    with replaying('data/cassettes/collector.json.gz', latency=0.05):
+        collector.run_cycle()
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import runpy
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# No basicConfig here: the CLI runs other scripts, whose own logging setup must win
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Never written to a cassette
+SECRET_PARAMS = ('token', 'apiKey', 'apikey', 'api_key', 'key')
+
+# Dropped for the second, looser match pass
+VOLATILE_PARAMS = ('from', 'to', 'start', 'end', 'period1', 'period2', '_')
+
+# Describe the encoded body on the wire; replayed bodies are already decoded
+_TRANSPORT_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection')
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """Replay found no recorded response (raised like a network failure)"""
+    pass
+
+
+def request_key(request: requests.PreparedRequest, ignore: Tuple[str, ...] = ()) -> str:
+    """
+    Match key for a request: method, URL without secrets, sorted query, body hash
+
+    Args:
+        request: Prepared request
+        ignore: Extra query params to leave out
+
+    Returns:
+        Key string
+    """
+    parts = urlsplit(request.url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k not in SECRET_PARAMS and k not in ignore
+    )
+    body = request.body or b''
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    digest = hashlib.sha1(body).hexdigest()[:12] if body else '-'
+    return f"{request.method} {parts.scheme}://{parts.netloc}{parts.path}?{urlencode(query)} {digest}"
+
+
+def _redact_url(url: str) -> str:
+    """URL with secret query params removed"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in SECRET_PARAMS]
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+class Cassette:
+    """Recorded interactions, saved as gzip-compressed JSON"""
+
+    def __init__(self, path: str):
+        """
+        Initialize cassette
+
+        Args:
+            path: Cassette file (e.g. data/cassettes/collector.json.gz)
+        """
+        self.path = path
+        self.interactions = []
+        self.recorded_at = None
+        self._lock = threading.Lock()
+
+    def load(self) -> 'Cassette':
+        """Read interactions from disk"""
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+        self.interactions = data['interactions']
+        self.recorded_at = data.get('recorded_at')
+        return self
+
+    def save(self) -> None:
+        """Write interactions to disk"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with self._lock:
+            data = {
+                'version': CASSETTE_VERSION,
+                'recorded_at': self.recorded_at or datetime.now().isoformat(),
+                'interactions': list(self.interactions),
+            }
+        with gzip.open(self.path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            json.dump(data, f, separators=(',', ':'))
+        logger.info(f"Saved {len(data['interactions'])} interactions to {self.path}")
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response, latency: float) -> None:
+        """
+        Capture one interaction
+
+        Args:
+            request: Request as sent
+            response: Final response (its body is read here)
+            latency: Seconds from send to response
+        """
+        interaction = {
+            'key': request_key(request),
+            'loose_key': request_key(request, ignore=VOLATILE_PARAMS),
+            'method': request.method,
+            'url': _redact_url(request.url),
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in _TRANSPORT_HEADERS},
+            'body': base64.b64encode(response.content or b'').decode('ascii'),
+            'latency': round(latency, 4),
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def summary(self) -> Dict:
+        """
+        Interaction counts and latency by host
+
+        Returns:
+            Dict with totals and per-host stats
+        """
+        hosts = defaultdict(lambda: {'requests': 0, 'bytes': 0, 'latency': 0.0})
+        for interaction in self.interactions:
+            host = hosts[urlsplit(interaction['url']).netloc]
+            host['requests'] += 1
+            host['bytes'] += len(interaction['body']) * 3 // 4
+            host['latency'] += interaction['latency']
+        return {
+            'path': self.path,
+            'recorded_at': self.recorded_at,
+            'interactions': len(self.interactions),
+            'hosts': {
+                name: {**stats, 'avg_latency': round(stats['latency'] / stats['requests'], 4)}
+                for name, stats in sorted(hosts.items())
+            },
+        }
+
+
+class _Player:
+    """Serves recorded responses: same-key repeats replay in recorded order, the last one repeats"""
+
+    def __init__(self, cassette: Cassette, latency: Union[str, float], latency_scale: float, strict: bool):
+        self.latency = latency
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._exact = defaultdict(deque)
+        self._loose = defaultdict(deque)
+        self._last = {}
+        for interaction in cassette.interactions:
+            self._exact[interaction['key']].append(interaction)
+            self._loose[interaction['loose_key']].append(interaction)
+        self.stats = {'served': 0, 'loose_matches': 0, 'misses': 0}
+
+    def _next(self, queues: Dict[str, deque], key: str) -> Optional[Dict]:
+        """Next interaction for a key (caller holds the lock)"""
+        queue = queues.get(key)
+        if queue:
+            interaction = queue.popleft()
+            self._last[key] = interaction
+            return interaction
+        return self._last.get(key)
+
+    def respond(self, request: requests.PreparedRequest) -> requests.Response:
+        """Build the recorded response for a request"""
+        with self._lock:
+            interaction = self._next(self._exact, request_key(request))
+            if interaction is None:
+                interaction = self._next(self._loose, request_key(request, ignore=VOLATILE_PARAMS))
+                if interaction is not None:
+                    self.stats['loose_matches'] += 1
+            if interaction is None:
+                self.stats['misses'] += 1
+            else:
+                self.stats['served'] += 1
+
+        if interaction is None:
+            message = f"No recorded response for {request.method} {_redact_url(request.url)}"
+            if self.strict:
+                raise CassetteMiss(message, request=request)
+            logger.warning(message)
+            return _build_response(request, {'status': 404, 'reason': 'Not Recorded', 'headers': {},
+                                             'body': '', 'latency': 0.0}, 0.0)
+
+        if self.latency == 'recorded':
+            delay = interaction['latency'] * self.latency_scale
+        elif self.latency == 'none':
+            delay = 0.0
+        else:
+            delay = float(self.latency) * self.latency_scale
+        if delay > 0:
+            time.sleep(delay)
+        return _build_response(request, interaction, delay)
+
+
+def _build_response(request: requests.PreparedRequest, interaction: Dict, elapsed: float) -> requests.Response:
+    """requests.Response from a recorded interaction"""
+    response = requests.Response()
+    response.status_code = interaction['status']
+    response.reason = interaction['reason']
+    response.headers = CaseInsensitiveDict(interaction['headers'])
+    body = base64.b64decode(interaction['body'])
+    response._content = body
+    # Body already read: iter_content() serves _content; raw readers and close() get a stream
+    response._content_consumed = True
+    response.raw = io.BytesIO(body)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response.elapsed = timedelta(seconds=elapsed)
+    return response
+
+
+# Active hook (one per process)
+_original_send = None
+_hook_lock = threading.Lock()
+
+
+def _install(send) -> None:
+    """Replace requests.Session.send"""
+    global _original_send
+    with _hook_lock:
+        if _original_send is not None:
+            raise RuntimeError("An HTTP record/replay hook is already active")
+        _original_send = requests.Session.send
+        requests.Session.send = send
+
+
+def _uninstall() -> None:
+    """Restore requests.Session.send"""
+    global _original_send
+    with _hook_lock:
+        if _original_send is not None:
+            requests.Session.send = _original_send
+            _original_send = None
+
+
+@contextmanager
+def recording(path: str) -> Iterator[Cassette]:
+    """
+    Record every HTTP response made through requests to a cassette
+
+    Args:
+        path: Cassette file (overwritten on exit)
+
+    Yields:
+        Cassette being recorded
+    """
+    cassette = Cassette(path)
+    cassette.recorded_at = datetime.now().isoformat()
+    original = requests.Session.send
+
+    def send(session, request, **kwargs):
+        start = time.perf_counter()
+        response = original(session, request, **kwargs)
+        # Read the body now so streamed responses are captured too, then give
+        # callers that read response.raw directly (e.g. iter_csv_rows) the same bytes
+        body = response.content
+        response.raw = io.BytesIO(body)
+        cassette.record(request, response, time.perf_counter() - start)
+        return response
+
+    _install(send)
+    try:
+        yield cassette
+    finally:
+        _uninstall()
+        cassette.save()
+
+
+@contextmanager
+def replaying(path: str, latency: Union[str, float] = 'none', latency_scale: float = 1.0,
+              strict: bool = True) -> Iterator[Dict]:
+    """
+    Answer every HTTP request made through requests from a cassette
+
+    Args:
+        path: Cassette file
+        latency: 'none' (full speed), 'recorded', or fixed seconds per response
+        latency_scale: Multiplier for the delay (e.g. 0.5 = twice as fast)
+        strict: Raise CassetteMiss for unrecorded requests (else return a 404)
+
+    Yields:
+        Replay stats dict (served, loose_matches, misses), updated live
+    """
+    if latency not in ('none', 'recorded'):
+        latency = float(latency)
+    player = _Player(Cassette(path).load(), latency, latency_scale, strict)
+
+    def send(session, request, **kwargs):
+        return player.respond(request)
+
+    _install(send)
+    try:
+        yield player.stats
+    finally:
+        _uninstall()
+        logger.info(f"Replay of {path}: {player.stats}")
+
+
+def _run_script(script: str, args: List[str]) -> float:
+    """Run a script as __main__ and return wall time in seconds"""
+    sys.argv = [script] + args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    start = time.perf_counter()
+    try:
+        runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"Script exited with code {e.code}")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record/replay HTTP traffic for offline benchmarking")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    record = sub.add_parser('record', help="Run a script and record its HTTP responses")
+    record.add_argument('cassette')
+    record.add_argument('script')
+    record.add_argument('args', nargs=argparse.REMAINDER)
+
+    replay = sub.add_parser('replay', help="Run a script against a cassette (no network)")
+    replay.add_argument('cassette')
+    replay.add_argument('--latency', default='none',
+                        help="'none' (default), 'recorded', or fixed seconds per response")
+    replay.add_argument('--latency-scale', type=float, default=1.0, help="Multiplier for replayed latency")
+    replay.add_argument('--lenient', action='store_true', help="Answer unrecorded requests with 404")
+    replay.add_argument('script')
+    replay.add_argument('args', nargs=argparse.REMAINDER)
+
+    info = sub.add_parser('info', help="Summarize a cassette")
+    info.add_argument('cassette')
+
+    args = parser.parse_args()
+
+    if args.command == 'info':
+        print(json.dumps(Cassette(args.cassette).load().summary(), indent=2))
+        return
+
+    if args.command == 'record':
+        with recording(args.cassette) as cassette:
+            elapsed = _run_script(args.script, args.args)
+        print(f"\nRecorded {len(cassette.interactions)} responses to {args.cassette} in {elapsed:.2f}s")
+        return
+
+    with replaying(args.cassette, latency=args.latency, latency_scale=args.latency_scale,
+                   strict=not args.lenient) as stats:
+        elapsed = _run_script(args.script, args.args)
+    print(f"\nReplayed {args.script} in {elapsed:.2f}s "
+          f"(served {stats['served']}, loose matches {stats['loose_matches']}, misses {stats['misses']})")
+
+
+if __name__ == "__main__":
+    main()
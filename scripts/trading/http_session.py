@@ -0,0 +1,133 @@
+"""
+HTTP Session Module: Shared keep-alive sessions for API clients
+- One requests.Session per provider per process, so repeated calls reuse
+  TCP/TLS connections instead of handshaking on every request
+- Per-host connection pools sized to worker concurrency
+- urllib3 Retry with exponential backoff and jitter for transient failures
+- gzip/deflate responses
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/http_session.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def build_retry(retries: int = 2, backoff_factor: float = 0.5, backoff_jitter: float = 0.25,
+                status_forcelist: Iterable[int] = RETRY_STATUSES, read_retries: int = 0) -> Retry:
+    """
+    Retry policy for transient failures
+
+    Read retries default to 0: a read timeout already cost the full timeout,
+    and the provider router / circuit breaker handle slow providers.
+
+    Args:
+        retries: Max retries for connection errors and retryable statuses
+        backoff_factor: Backoff base in seconds (0.5 -> 0.5s, 1s, 2s, ...)
+        backoff_jitter: Random extra delay (seconds) added to each backoff
+        status_forcelist: HTTP statuses to retry
+        read_retries: Retries after the server accepted the request
+
+    Returns:
+        urllib3 Retry
+    """
+    kwargs = dict(
+        total=retries,
+        connect=retries,
+        read=read_retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=tuple(status_forcelist),
+        allowed_methods=frozenset(['GET', 'HEAD', 'OPTIONS']),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(backoff_jitter=backoff_jitter, **kwargs)
+    except TypeError:
+        # urllib3 < 2.0 has no jitter option
+        return Retry(**kwargs)
+
+
+def create_session(pool_size: int = 16, pool_hosts: int = 4, retry: Optional[Retry] = None,
+                   headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """
+    Build a pooled session
+
+    Args:
+        pool_size: Connections kept per host (match the number of threads using the session)
+        pool_hosts: Number of distinct hosts with a cached pool
+        retry: Retry policy (default: build_retry())
+        headers: Extra default headers
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_hosts,
+        pool_maxsize=pool_size,
+        max_retries=retry if retry is not None else build_retry()
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': DEFAULT_USER_AGENT,
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+# Process-wide sessions by name
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(name: str, **kwargs) -> requests.Session:
+    """
+    Get or create the shared session for a provider
+
+    The first call for a name fixes its configuration.
+
+    Args:
+        name: Provider name (e.g. 'finnhub', 'yahoo')
+        **kwargs: create_session() arguments
+
+    Returns:
+        requests.Session
+    """
+    with _sessions_lock:
+        session = _sessions.get(name)
+        if session is None:
+            session = create_session(**kwargs)
+            _sessions[name] = session
+            logger.info(f"HTTP session '{name}' created (pool size {kwargs.get('pool_size', 16)})")
+        return session
+
+
+def close_sessions() -> None:
+    """Close all shared sessions (releases pooled connections)"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
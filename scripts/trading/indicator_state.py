@@ -0,0 +1,475 @@
+"""
+Indicator State Module: Incremental (streaming) indicators per ticker
+- Keeps running EMA values, RSI/MACD rolling windows and the OBV accumulator
+- O(1) update when a new bar arrives or the current bar is revised
+- Full recompute only on gaps or when the candle store replaced its history
+- Persisted as JSON: data/indicator_state/[TICKER].json
+
+The collector's RSI and MACD are built from simple moving averages (see
+indicators.py), so the state keeps the last N gains/losses/closes/MACD values
+instead of Wilder averages.
+
+Reference values: OBV and the EMAs depend on every bar since the state was
+anchored, not just the fetched 100-bar window, so a recompute over the window
+alone would not match the streaming values. The streaming values are the
+reference; reference_series() returns the bars they are defined over (stored
+history from the anchor up to the window, then the window), and every full
+recompute - rebuild() and the collector's indicators.latest_values fallback -
+runs over that series. The anchor moves only when the store generation
+changes (history cleared after a split/dividend restatement, see
+APISourceManager._history_restated).
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/indicator_state.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+RSI_PERIOD = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+EMA_PERIODS = (20, 50, 200)
+
+# history(start_ts, end_ts) -> (timestamps, closes, volumes) of stored bars with start_ts <= t < end_ts
+HistoryReader = Callable[[Optional[int], int], Tuple[List[int], List[float], List[float]]]
+
+
+def reference_series(timestamps: Sequence[int], closes: Sequence[float], volumes: Sequence[float],
+                     history: Optional[HistoryReader] = None,
+                     anchor: Optional[int] = None) -> Tuple[List[int], List[float], List[float]]:
+    """
+    Bars the streaming indicator values are defined over
+
+    Args:
+        timestamps: Fetched window bar times (epoch seconds), ascending
+        closes: Closes aligned with timestamps
+        volumes: Volumes aligned with timestamps
+        history: Reader for stored bars before the window (None = window only)
+        anchor: First bar of the series (None = from the start of stored history)
+
+    Returns:
+        (timestamps, closes, volumes): stored bars from anchor up to the window, then the window
+    """
+    timestamps = [int(t) for t in timestamps]
+    closes = [float(c) for c in closes]
+    volumes = [float(v) for v in volumes]
+    if history is None or not timestamps:
+        return timestamps, closes, volumes
+
+    stored_t, stored_c, stored_v = history(anchor, timestamps[0])
+    return ([int(t) for t in stored_t] + timestamps,
+            [float(c) for c in stored_c] + closes,
+            [float(v) for v in stored_v] + volumes)
+
+
+class _Accumulators:
+    """Running indicator accumulators for a contiguous run of closed bars"""
+
+    def __init__(self):
+        self.count = 0
+        self.prev_close = None
+        self.obv = 0.0
+        self.closes = deque(maxlen=MACD_SLOW)
+        self.gains = deque(maxlen=RSI_PERIOD)
+        self.losses = deque(maxlen=RSI_PERIOD)
+        self.macd_line = deque(maxlen=MACD_SIGNAL)
+        # Per-period EMA: seed_sum/decay_pow/acc until the seed window is full, then value
+        self.ema = {
+            period: {'seed_sum': 0.0, 'decay_pow': 1.0, 'acc': 0.0, 'value': None}
+            for period in EMA_PERIODS
+        }
+
+    def copy(self) -> '_Accumulators':
+        """Independent copy (windows are bounded, so this is O(1))"""
+        other = _Accumulators.__new__(_Accumulators)
+        other.count = self.count
+        other.prev_close = self.prev_close
+        other.obv = self.obv
+        other.closes = deque(self.closes, maxlen=MACD_SLOW)
+        other.gains = deque(self.gains, maxlen=RSI_PERIOD)
+        other.losses = deque(self.losses, maxlen=RSI_PERIOD)
+        other.macd_line = deque(self.macd_line, maxlen=MACD_SIGNAL)
+        other.ema = {period: dict(state) for period, state in self.ema.items()}
+        return other
+
+    def push(self, close: float, volume: float) -> '_Accumulators':
+        """
+        Apply one bar in place
+
+        Args:
+            close: Bar close
+            volume: Bar volume
+
+        Returns:
+            self (for chaining)
+        """
+        # OBV
+        if self.prev_close is None:
+            self.obv = volume
+        elif close > self.prev_close:
+            self.obv += volume
+        elif close < self.prev_close:
+            self.obv -= volume
+
+        # RSI gains/losses
+        if self.prev_close is not None:
+            delta = close - self.prev_close
+            self.gains.append(delta if delta > 0 else 0.0)
+            self.losses.append(-delta if delta < 0 else 0.0)
+
+        # EMA: ema[0] = mean(first period closes), ema[i] = a*p[i] + (1-a)*ema[i-1]
+        for period, state in self.ema.items():
+            alpha = 2 / (period + 1)
+            decay = 1 - alpha
+            if state['value'] is not None:
+                state['value'] = alpha * close + decay * state['value']
+                continue
+            if self.count < period:
+                state['seed_sum'] += close
+            if self.count > 0:
+                state['decay_pow'] *= decay
+                state['acc'] = decay * state['acc'] + alpha * close
+            if self.count + 1 >= period:
+                seed = state['seed_sum'] / period
+                state['value'] = state['decay_pow'] * seed + state['acc']
+
+        self.closes.append(close)
+        self.count += 1
+        self.prev_close = close
+
+        # MACD line from simple averages of the last fast/slow closes
+        if self.count >= MACD_SLOW:
+            closes = list(self.closes)
+            fast = sum(closes[-MACD_FAST:]) / MACD_FAST
+            slow = sum(closes) / MACD_SLOW
+            self.macd_line.append(fast - slow)
+
+        return self
+
+    def values(self) -> Dict:
+        """Indicator snapshot (same keys as indicators.latest_values)"""
+        indicators = {}
+
+        if len(self.gains) == RSI_PERIOD and self.count > RSI_PERIOD:
+            avg_gain = sum(self.gains) / RSI_PERIOD
+            avg_loss = sum(self.losses) / RSI_PERIOD
+            rs = avg_gain / (avg_loss + 1e-10)
+            indicators['rsi'] = float(100 - (100 / (1 + rs)))
+            indicators['rsi_period'] = RSI_PERIOD
+
+        if self.count >= MACD_SLOW:
+            line = self.macd_line[-1]
+            indicators['macd_line'] = float(line)
+            if len(self.macd_line) == MACD_SIGNAL:
+                signal = sum(self.macd_line) / MACD_SIGNAL
+                indicators['macd_signal'] = float(signal)
+                indicators['macd_histogram'] = float(line - signal)
+            else:
+                indicators['macd_signal'] = None
+                indicators['macd_histogram'] = None
+
+        if self.count > 0:
+            indicators['obv'] = float(self.obv)
+
+        emas = {period: state['value'] for period, state in self.ema.items()}
+        for period, value in emas.items():
+            if value is not None:
+                indicators[f'ema_{period}'] = float(value)
+
+        if all(value is not None for value in emas.values()):
+            indicators['trend'] = 'UPTREND' if emas[20] > emas[50] > emas[200] else 'DOWNTREND'
+            indicators['price'] = float(self.prev_close)
+
+        return indicators
+
+    def to_dict(self) -> Dict:
+        """Serialize to JSON-compatible dict"""
+        return {
+            'count': self.count,
+            'prev_close': self.prev_close,
+            'obv': self.obv,
+            'closes': list(self.closes),
+            'gains': list(self.gains),
+            'losses': list(self.losses),
+            'macd_line': list(self.macd_line),
+            'ema': {str(period): state for period, state in self.ema.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> '_Accumulators':
+        """Deserialize from to_dict() output"""
+        acc = cls()
+        acc.count = data['count']
+        acc.prev_close = data['prev_close']
+        acc.obv = data['obv']
+        acc.closes.extend(data['closes'])
+        acc.gains.extend(data['gains'])
+        acc.losses.extend(data['losses'])
+        acc.macd_line.extend(data['macd_line'])
+        for period in EMA_PERIODS:
+            acc.ema[period].update(data['ema'][str(period)])
+        return acc
+
+
+class IndicatorState:
+    """
+    Streaming indicator state for one ticker
+
+    Closed bars are folded into running accumulators; the most recent bar is
+    held separately so a revised current bar replaces it without replaying
+    history.
+    """
+
+    def __init__(self, ticker: str):
+        """
+        Initialize empty state
+
+        Args:
+            ticker: Stock ticker symbol
+        """
+        self.ticker = ticker.upper()
+        self.committed = _Accumulators()
+        self.last_bar = None  # (timestamp, close, volume) of the current bar
+        self.anchor = None  # timestamp of the first bar folded in since the last rebuild
+        self.generation = None  # candle store generation the state was built from
+        self.full_recomputes = 0
+        self.incremental_updates = 0
+
+    @property
+    def bar_count(self) -> int:
+        """Number of bars folded into the state (including the current bar)"""
+        return self.committed.count + (1 if self.last_bar else 0)
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Timestamp (epoch seconds) of the current bar"""
+        return self.last_bar[0] if self.last_bar else None
+
+    def reset(self) -> None:
+        """Drop all accumulated state (e.g. after a split or dividend adjustment)"""
+        self.committed = _Accumulators()
+        self.last_bar = None
+        self.anchor = None
+
+    def update(self, timestamp: int, close: float, volume: float) -> bool:
+        """
+        Apply one bar in O(1)
+
+        Args:
+            timestamp: Bar open time (epoch seconds)
+            close: Bar close
+            volume: Bar volume
+
+        Returns:
+            True if applied, False if the bar is older than the current bar
+        """
+        timestamp = int(timestamp)
+        close = float(close)
+        volume = float(volume)
+
+        if self.last_bar is not None:
+            if timestamp < self.last_bar[0]:
+                return False
+            if timestamp > self.last_bar[0]:
+                self.committed.push(self.last_bar[1], self.last_bar[2])
+
+        self.last_bar = (timestamp, close, volume)
+        return True
+
+    def rebuild(self, timestamps: Sequence[int], closes: Sequence[float], volumes: Sequence[float]) -> None:
+        """
+        Full recompute from a complete bar history
+
+        Args:
+            timestamps: Bar times (epoch seconds), ascending
+            closes: Closes aligned with timestamps
+            volumes: Volumes aligned with timestamps
+        """
+        self.reset()
+        for timestamp, close, volume in zip(timestamps, closes, volumes):
+            self.update(timestamp, close, volume)
+        self.anchor = int(timestamps[0]) if len(timestamps) else None
+        self.full_recomputes += 1
+
+    def sync(self, timestamps: Sequence[int], closes: Sequence[float], volumes: Sequence[float],
+             history: Optional[HistoryReader] = None, generation: Optional[int] = None) -> bool:
+        """
+        Bring the state up to date with a freshly fetched candle window
+
+        Only bars at or after the current bar are applied. Falls back to a full
+        recompute over reference_series() when the window no longer contains
+        the current bar (gap), and resets the anchor first when the candle
+        store generation changed (stored history was cleared and refetched
+        because closed bars were restated).
+
+        Args:
+            timestamps: Bar times (epoch seconds), ascending
+            closes: Closes aligned with timestamps
+            volumes: Volumes aligned with timestamps
+            history: Reader for stored bars before the window (None = window only)
+            generation: Candle store generation the window was read from
+
+        Returns:
+            True if updated incrementally, False if fully recomputed
+        """
+        timestamps = [int(t) for t in timestamps]
+
+        if generation != self.generation:
+            if self.last_bar is not None:
+                logger.info(f"{self.ticker}: stored history replaced (generation {self.generation} -> "
+                            f"{generation}), recomputing")
+            self.reset()
+            self.generation = generation
+
+        index = self._locate(timestamps)
+
+        if index is None:
+            self.rebuild(*reference_series(timestamps, closes, volumes, history, self.anchor))
+            return False
+
+        for i in range(index, len(timestamps)):
+            self.update(timestamps[i], closes[i], volumes[i])
+        self.incremental_updates += 1
+        return True
+
+    def _locate(self, timestamps: Sequence[int]) -> Optional[int]:
+        """Position of the current bar in the window, or None if a recompute is required"""
+        if self.last_bar is None or not timestamps:
+            return None
+
+        try:
+            return timestamps.index(self.last_bar[0])
+        except ValueError:
+            logger.info(f"{self.ticker}: current bar not in window, recomputing")
+            return None
+
+    def values(self) -> Dict:
+        """
+        Current indicator snapshot
+
+        Returns:
+            Dict with rsi, macd_*, obv, ema_* and trend/price when available
+        """
+        acc = self.committed.copy()
+        if self.last_bar is not None:
+            acc.push(self.last_bar[1], self.last_bar[2])
+        return acc.values()
+
+    def to_dict(self) -> Dict:
+        """Serialize to JSON-compatible dict"""
+        return {
+            'ticker': self.ticker,
+            'committed': self.committed.to_dict(),
+            'last_bar': list(self.last_bar) if self.last_bar else None,
+            'anchor': self.anchor,
+            'generation': self.generation,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'IndicatorState':
+        """Deserialize from to_dict() output"""
+        state = cls(data['ticker'])
+        state.committed = _Accumulators.from_dict(data['committed'])
+        state.last_bar = tuple(data['last_bar']) if data.get('last_bar') else None
+        state.anchor = data.get('anchor')
+        # States saved before generations were tracked load as None and are rebuilt once
+        state.generation = data.get('generation')
+        return state
+
+
+class IndicatorStateStore:
+    """
+    Persists IndicatorState objects as one JSON file per ticker
+    """
+
+    def __init__(self, state_dir: str = 'data/indicator_state'):
+        """
+        Initialize state store
+
+        Args:
+            state_dir: Directory to store state files
+        """
+        self.state_dir = state_dir
+        Path(self.state_dir).mkdir(parents=True, exist_ok=True)
+
+    def _get_state_file(self, ticker: str) -> str:
+        """Full path to state file for ticker"""
+        return os.path.join(self.state_dir, f"{ticker.upper()}.json")
+
+    def load(self, ticker: str) -> IndicatorState:
+        """
+        Load state for ticker (empty state if missing or unreadable)
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            IndicatorState instance
+        """
+        state_file = self._get_state_file(ticker)
+        if not os.path.exists(state_file):
+            return IndicatorState(ticker)
+
+        try:
+            with open(state_file, 'r') as f:
+                return IndicatorState.from_dict(json.load(f))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable indicator state for {ticker}: {e}")
+            return IndicatorState(ticker)
+        except IOError as e:
+            logger.error(f"IO error reading indicator state for {ticker}: {e}")
+            return IndicatorState(ticker)
+
+    def save(self, state: IndicatorState) -> bool:
+        """
+        Save state atomically
+
+        Args:
+            state: IndicatorState to persist
+
+        Returns:
+            True if successful
+        """
+        state_file = self._get_state_file(state.ticker)
+        tmp_file = f"{state_file}.tmp"
+        try:
+            with open(tmp_file, 'w') as f:
+                json.dump(state.to_dict(), f)
+            os.replace(tmp_file, state_file)
+            return True
+        except IOError as e:
+            logger.error(f"IO error saving indicator state for {state.ticker}: {e}")
+            return False
+
+    def delete(self, ticker: str) -> bool:
+        """
+        Remove persisted state (forces a full recompute next cycle)
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            True if successful
+        """
+        state_file = self._get_state_file(ticker)
+        try:
+            if os.path.exists(state_file):
+                os.remove(state_file)
+            return True
+        except OSError as e:
+            logger.error(f"Error deleting indicator state for {ticker}: {e}")
+            return False
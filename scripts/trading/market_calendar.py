@@ -0,0 +1,263 @@
+"""
+Market Calendar Module: NYSE/Nasdaq session hours and holidays
+- Regular session 09:30-16:00 America/New_York (13:00 on early-close days)
+- Extended hours: pre-market 04:00-09:30, after-hours 16:00-20:00
+- Weekends and exchange holidays are closed all day
+- Holidays are computed from the exchange rules (no network lookups)
+
+Imported by response_cache (and through it api_client in scout), so it only
+logs through its module logger.
+"""
+
+import logging
+from datetime import date, datetime, time as dtime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+EXCHANGE_TZ = ZoneInfo('America/New_York')
+
+PRE_MARKET_OPEN = dtime(4, 0)
+REGULAR_OPEN = dtime(9, 30)
+REGULAR_CLOSE = dtime(16, 0)
+EARLY_CLOSE = dtime(13, 0)
+AFTER_HOURS_CLOSE = dtime(20, 0)
+
+# Session names
+REGULAR = 'regular'
+PRE_MARKET = 'pre_market'
+AFTER_HOURS = 'after_hours'
+CLOSED = 'closed'
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th weekday (Mon=0) of a month; n=-1 for the last one"""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + (month // 12), month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Western Easter Sunday (anonymous Gregorian algorithm)"""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays are observed Friday, Sunday holidays Monday"""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=16)
+def exchange_holidays(year: int) -> Dict[date, str]:
+    """
+    Full-day exchange holidays for a year
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Dict date -> holiday name
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3): "Martin Luther King Jr. Day",
+        _nth_weekday(year, 2, 0, 3): "Presidents' Day",
+        _easter(year) - timedelta(days=2): "Good Friday",
+        _nth_weekday(year, 5, 0, -1): "Memorial Day",
+        _observed(date(year, 7, 4)): "Independence Day",
+        _nth_weekday(year, 9, 0, 1): "Labor Day",
+        _nth_weekday(year, 11, 3, 4): "Thanksgiving Day",
+        _observed(date(year, 12, 25)): "Christmas Day",
+    }
+
+    # New Year's Day on a Saturday is not observed on the prior Friday (Dec 31)
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays[_observed(new_year)] = "New Year's Day"
+
+    if year >= 2022:
+        holidays[_observed(date(year, 6, 19))] = "Juneteenth"
+
+    return holidays
+
+
+@lru_cache(maxsize=16)
+def early_closes(year: int) -> Dict[date, str]:
+    """
+    13:00 early-close days for a year
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Dict date -> reason
+    """
+    closes = {}
+    holidays = exchange_holidays(year)
+
+    july_3 = date(year, 7, 3)
+    if july_3.weekday() < 5 and july_3 not in holidays:
+        closes[july_3] = "Independence Day eve"
+
+    closes[_nth_weekday(year, 11, 3, 4) + timedelta(days=1)] = "Day after Thanksgiving"
+
+    christmas_eve = date(year, 12, 24)
+    if christmas_eve.weekday() < 5 and christmas_eve not in holidays:
+        closes[christmas_eve] = "Christmas Eve"
+
+    return closes
+
+
+class MarketCalendar:
+    """
+    US equity market session calendar
+    """
+
+    def __init__(self, tz: ZoneInfo = EXCHANGE_TZ):
+        """
+        Initialize market calendar
+
+        Args:
+            tz: Exchange timezone
+        """
+        self.tz = tz
+
+    def _local(self, when: Optional[datetime] = None) -> datetime:
+        """Exchange-local time (naive datetimes are treated as system local time)"""
+        if when is None:
+            return datetime.now(self.tz)
+        if when.tzinfo is None:
+            when = when.astimezone()
+        return when.astimezone(self.tz)
+
+    def is_trading_day(self, day: date) -> bool:
+        """
+        Check if the exchange is open at all on a date
+
+        Args:
+            day: Exchange-local date
+
+        Returns:
+            True on weekdays that are not holidays
+        """
+        return day.weekday() < 5 and day not in exchange_holidays(day.year)
+
+    def regular_hours(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        """
+        Regular session open/close for a date
+
+        Args:
+            day: Exchange-local date
+
+        Returns:
+            (open, close) timezone-aware datetimes, or None if closed
+        """
+        if not self.is_trading_day(day):
+            return None
+        close = EARLY_CLOSE if day in early_closes(day.year) else REGULAR_CLOSE
+        return (datetime.combine(day, REGULAR_OPEN, tzinfo=self.tz),
+                datetime.combine(day, close, tzinfo=self.tz))
+
+    def session(self, when: Optional[datetime] = None) -> str:
+        """
+        Market session at a point in time
+
+        Args:
+            when: Time to check (default: now)
+
+        Returns:
+            'regular', 'pre_market', 'after_hours' or 'closed'
+        """
+        local = self._local(when)
+        hours = self.regular_hours(local.date())
+        if hours is None:
+            return CLOSED
+
+        open_time, close_time = hours
+        if open_time <= local < close_time:
+            return REGULAR
+        if datetime.combine(local.date(), PRE_MARKET_OPEN, tzinfo=self.tz) <= local < open_time:
+            return PRE_MARKET
+        if close_time <= local < datetime.combine(local.date(), AFTER_HOURS_CLOSE, tzinfo=self.tz):
+            return AFTER_HOURS
+        return CLOSED
+
+    def is_open(self, when: Optional[datetime] = None) -> bool:
+        """
+        Check if the regular session is open
+
+        Args:
+            when: Time to check (default: now)
+
+        Returns:
+            True during regular trading hours
+        """
+        return self.session(when) == REGULAR
+
+    def next_session_change(self, when: Optional[datetime] = None) -> datetime:
+        """
+        Next time the session value changes (pre-market open, regular open/close, ...)
+
+        Args:
+            when: Reference time (default: now)
+
+        Returns:
+            Timezone-aware datetime
+        """
+        local = self._local(when)
+        day = local.date()
+
+        for _ in range(10):
+            hours = self.regular_hours(day)
+            if hours is not None:
+                boundaries = [
+                    datetime.combine(day, PRE_MARKET_OPEN, tzinfo=self.tz),
+                    hours[0],
+                    hours[1],
+                    datetime.combine(day, AFTER_HOURS_CLOSE, tzinfo=self.tz),
+                ]
+                for boundary in boundaries:
+                    if boundary > local:
+                        return boundary
+            day += timedelta(days=1)
+
+        # Unreachable with real calendars (never 10 closed days in a row)
+        return local + timedelta(days=1)
+
+    def get_status(self, when: Optional[datetime] = None) -> Dict:
+        """
+        Calendar status for display
+
+        Args:
+            when: Reference time (default: now)
+
+        Returns:
+            Dict with session, is_open, next_change, holiday
+        """
+        local = self._local(when)
+        day = local.date()
+        return {
+            'session': self.session(local),
+            'is_open': self.is_open(local),
+            'next_change': self.next_session_change(local).isoformat(),
+            'holiday': exchange_holidays(day.year).get(day),
+            'early_close': early_closes(day.year).get(day),
+            'exchange_time': local.isoformat()
+        }
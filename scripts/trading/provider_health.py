@@ -0,0 +1,468 @@
+"""
+Provider Health Module: Circuit breakers and latency-scored routing for data providers
+- CircuitBreaker: closed -> open after repeated failures (or a high error rate),
+  open -> half-open when a background probe starts, half-open -> closed on success
+- ProviderHealth: rolling latency (EWMA) and error rate per provider
+- ProviderRouter: tries healthy providers fastest-first and probes open ones
+  in a background thread once their cool-down has passed, so live requests
+  never wait on a dead provider and a recovered provider wins its traffic back
+  (closed providers are never probed - their stats come from live traffic)
+- Hedged calls: ask the next provider too when the best one is slower than
+  its own p90, first valid answer wins (for latency-sensitive callers)
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/provider_health.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Per-provider circuit breaker
+
+    Live traffic only flows while closed. An open breaker moves to half-open
+    when its cool-down has passed and a probe is started; the probe result
+    closes it again or re-opens it with a longer cool-down.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, error_rate_threshold: float = 0.5,
+                 min_samples: int = 10, open_seconds: float = 30.0, max_open_seconds: float = 300.0):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Provider name
+            failure_threshold: Consecutive failures that open the breaker
+            error_rate_threshold: Rolling error rate that opens the breaker
+            min_samples: Samples required before the error rate is considered
+            open_seconds: Initial cool-down before probing
+            max_open_seconds: Cool-down cap (doubles after each failed probe)
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_samples = min_samples
+        self.base_open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+
+        self.state = CLOSED
+        self.open_seconds = open_seconds
+        self.opened_at = None
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    def allows_traffic(self) -> bool:
+        """True if live requests may use this provider"""
+        return self.state == CLOSED
+
+    def start_probe(self) -> bool:
+        """
+        Move open -> half-open if the cool-down has passed
+
+        Returns:
+            True if the caller should run a probe now
+        """
+        with self._lock:
+            if self.state != OPEN or time.monotonic() - self.opened_at < self.open_seconds:
+                return False
+            self.state = HALF_OPEN
+            return True
+
+    def record(self, success: bool, error_rate: float, samples: int) -> None:
+        """
+        Record a call outcome
+
+        Args:
+            success: Whether the call succeeded
+            error_rate: Provider's rolling error rate (including this call)
+            samples: Calls in the rolling window
+        """
+        with self._lock:
+            if self.state == HALF_OPEN:
+                if success:
+                    self._close()
+                else:
+                    self.open_seconds = min(self.open_seconds * 2, self.max_open_seconds)
+                    self._open("probe failed")
+                return
+
+            if success:
+                self.consecutive_failures = 0
+                return
+
+            self.consecutive_failures += 1
+            if self.state == CLOSED:
+                if self.consecutive_failures >= self.failure_threshold:
+                    self._open(f"{self.consecutive_failures} consecutive failures")
+                elif samples >= self.min_samples and error_rate >= self.error_rate_threshold:
+                    self._open(f"error rate {error_rate:.0%}")
+
+    def _open(self, reason: str) -> None:
+        """Open the breaker (caller holds the lock)"""
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        logger.warning(f"Circuit OPEN for {self.name} ({reason}); probing in {self.open_seconds:.0f}s")
+
+    def _close(self) -> None:
+        """Close the breaker (caller holds the lock)"""
+        self.state = CLOSED
+        self.opened_at = None
+        self.consecutive_failures = 0
+        self.open_seconds = self.base_open_seconds
+        logger.info(f"Circuit CLOSED for {self.name} (probe succeeded)")
+
+    def get_status(self) -> Dict:
+        """Breaker state for status output"""
+        with self._lock:
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = round(max(0.0, self.open_seconds - (time.monotonic() - self.opened_at)), 1)
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'times_opened': self.times_opened,
+                'probe_in_seconds': retry_in
+            }
+
+
+class ProviderHealth:
+    """
+    Rolling latency and error statistics for one provider
+    """
+
+    def __init__(self, name: str, weight: float = 1.0, window: int = 50,
+                 default_latency: float = 1.0, breaker: Optional[CircuitBreaker] = None):
+        """
+        Initialize provider health
+
+        Args:
+            name: Provider name
+            weight: Score multiplier (>1 makes the provider less preferred)
+            window: Calls kept for the error rate
+            default_latency: Assumed latency (seconds) before any samples
+            breaker: Circuit breaker (default: CircuitBreaker(name))
+        """
+        self.name = name
+        self.weight = weight
+        self.default_latency = default_latency
+        self.breaker = breaker or CircuitBreaker(name)
+
+        self.ewma_latency = None
+        self.alpha = 0.2
+        self._outcomes = deque(maxlen=window)
+        self._latencies = deque(maxlen=window)    # successful calls only
+        self.calls = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def record(self, success: bool, latency: float) -> None:
+        """
+        Record a call
+
+        Args:
+            success: Whether the call returned usable data
+            latency: Call duration in seconds
+        """
+        with self._lock:
+            self.calls += 1
+            self._outcomes.append(success)
+            if success:
+                self._latencies.append(latency)
+                self.ewma_latency = latency if self.ewma_latency is None else \
+                    self.alpha * latency + (1 - self.alpha) * self.ewma_latency
+            else:
+                self.failures += 1
+            error_rate = self._error_rate()
+            samples = len(self._outcomes)
+
+        self.breaker.record(success, error_rate, samples)
+
+    def _error_rate(self) -> float:
+        """Failures / calls in the window (caller holds the lock)"""
+        if not self._outcomes:
+            return 0.0
+        return 1 - sum(self._outcomes) / len(self._outcomes)
+
+    def latency_percentile(self, q: float, min_samples: int = 5) -> Optional[float]:
+        """
+        Latency percentile over recent successful calls
+
+        Args:
+            q: Quantile in [0, 1] (e.g. 0.9)
+            min_samples: Samples required for a meaningful estimate
+
+        Returns:
+            Seconds, or None if there are too few samples
+        """
+        with self._lock:
+            if len(self._latencies) < min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def score(self) -> float:
+        """
+        Routing score in seconds (lower is better): latency inflated by weight and error rate
+
+        Returns:
+            Score
+        """
+        with self._lock:
+            latency = self.ewma_latency if self.ewma_latency is not None else self.default_latency
+            return latency * self.weight * (1 + 3 * self._error_rate())
+
+    def get_status(self) -> Dict:
+        """Provider statistics for status output"""
+        score = self.score()
+        with self._lock:
+            return {
+                'score': round(score, 3),
+                'latency_ms': round(self.ewma_latency * 1000, 1) if self.ewma_latency is not None else None,
+                'error_rate': round(self._error_rate(), 3),
+                'calls': self.calls,
+                'failures': self.failures,
+                'weight': self.weight,
+                **self.breaker.get_status()
+            }
+
+
+class ProviderRouter:
+    """
+    Routes one operation (e.g. quotes) across providers by health and speed
+    """
+
+    def __init__(self, operation: str, providers: List[ProviderHealth],
+                 probes: Dict[str, Callable[[], Any]],
+                 wait_time: Optional[Dict[str, Callable[[], float]]] = None,
+                 probe_is_valid: Callable[[Any], bool] = lambda result: result is not None):
+        """
+        Initialize router
+
+        Args:
+            operation: Operation name for logging
+            providers: Provider health trackers
+            probes: Provider name -> cheap call used to test a provider
+            wait_time: Provider name -> seconds the last call on this thread spent
+                       queued locally (e.g. rate limiter), cleared on read;
+                       excluded from latency
+            probe_is_valid: Whether a probe result counts as a recovery (e.g. a
+                            non-empty DataFrame)
+        """
+        self.operation = operation
+        self.probe_is_valid = probe_is_valid
+        self.providers = {provider.name: provider for provider in providers}
+        self.probes = probes
+        self.wait_time = wait_time or {}
+        self._probing = set()
+        self._lock = threading.Lock()
+
+        # Hedging metrics
+        self.hedged_calls = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+
+    def order(self) -> List[ProviderHealth]:
+        """
+        Providers to try, best first
+
+        Closed providers sorted by score; if every breaker is open, all
+        providers are returned so requests still have a chance.
+
+        Returns:
+            List of ProviderHealth
+        """
+        providers = sorted(self.providers.values(), key=lambda provider: provider.score())
+        healthy = [provider for provider in providers if provider.breaker.allows_traffic()]
+        return healthy or providers
+
+    def call(self, calls: Dict[str, Callable[[], Any]],
+             is_valid: Callable[[Any], bool] = lambda result: result is not None,
+             is_usable: Callable[[Any], bool] = lambda result: result is not None) -> Tuple[Optional[str], Any]:
+        """
+        Try providers in routing order until one returns a usable result
+
+        Args:
+            calls: Provider name -> zero-argument fetch
+            is_valid: Whether a result counts as a healthy response
+            is_usable: Whether a result ends the search (e.g. non-empty data)
+
+        Returns:
+            (provider name, result), or (None, None) if every provider failed
+        """
+        self._start_probes()
+
+        for provider in self.order():
+            fetch = calls.get(provider.name)
+            if fetch is None:
+                continue
+
+            result = self._timed_fetch(provider, fetch, is_valid)
+            if is_usable(result):
+                return provider.name, result
+
+            logger.warning(f"{provider.name} {self.operation} failed, trying next provider")
+
+        return None, None
+
+    def hedged_call(self, calls: Dict[str, Callable[[], Any]], executor: Executor,
+                    is_valid: Callable[[Any], bool] = lambda result: result is not None,
+                    is_usable: Optional[Callable[[Any], bool]] = None,
+                    hedge_quantile: float = 0.9,
+                    default_hedge_after: float = 1.0) -> Tuple[Optional[str], Any]:
+        """
+        Query the best provider; if it has not answered within its observed
+        latency quantile, also query the next one. First valid result wins,
+        the slower request finishes in the background and only updates stats.
+
+        Args:
+            calls: Provider name -> zero-argument fetch
+            executor: Pool that runs the fetches
+            is_valid: Whether a result counts as a healthy response
+            is_usable: Whether a result wins (default: is_valid)
+            hedge_quantile: Primary latency quantile that triggers the hedge (default: p90)
+            default_hedge_after: Hedge delay (seconds) until the primary has enough samples
+
+        Returns:
+            (provider name, result), or (None, None) if every provider failed
+        """
+        is_usable = is_usable or is_valid
+        self._start_probes()
+        candidates = [provider for provider in self.order() if provider.name in calls]
+        if len(candidates) < 2:
+            return self.call(calls, is_valid=is_valid, is_usable=is_usable)
+
+        primary, secondary = candidates[0], candidates[1]
+        hedge_after = primary.latency_percentile(hedge_quantile)
+        if hedge_after is None:
+            hedge_after = default_hedge_after
+
+        with self._lock:
+            self.hedged_calls += 1
+
+        pending = {executor.submit(self._timed_fetch, primary, calls[primary.name], is_valid): primary.name}
+        done, _ = wait(pending, timeout=hedge_after)
+        if done:
+            result = next(iter(done)).result()
+            if is_usable(result):
+                return primary.name, result
+            pending = {}
+
+        # Primary is slow (or failed fast): fire the hedge
+        with self._lock:
+            self.hedges_fired += 1
+        logger.info(f"Hedging {self.operation}: {primary.name} exceeded {hedge_after:.2f}s, asking {secondary.name}")
+        pending[executor.submit(self._timed_fetch, secondary, calls[secondary.name], is_valid)] = secondary.name
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                result = future.result()
+                if is_usable(result):
+                    if name == secondary.name:
+                        with self._lock:
+                            self.hedges_won += 1
+                    return name, result
+
+        # Both failed: fall back to the remaining providers in order
+        rest = {name: fetch for name, fetch in calls.items() if name not in (primary.name, secondary.name)}
+        return self.call(rest, is_valid=is_valid, is_usable=is_usable) if rest else (None, None)
+
+    def _timed_fetch(self, provider: ProviderHealth, fetch: Callable[[], Any],
+                     is_valid: Callable[[Any], bool]) -> Any:
+        """Run one fetch and record its outcome and latency (runs on the fetching thread)"""
+        self._clear_wait(provider.name)
+        start = time.perf_counter()
+        try:
+            result = fetch()
+        except Exception as e:
+            logger.error(f"{provider.name} {self.operation} raised: {e}")
+            result = None
+        latency = self._latency(provider.name, start)
+        provider.record(is_valid(result), latency)
+        return result
+
+    def _clear_wait(self, name: str) -> None:
+        """Drop a wait left on this thread by an earlier call (this fetch may never reach the limiter)"""
+        wait = self.wait_time.get(name)
+        if wait:
+            wait()
+
+    def _latency(self, name: str, start: float) -> float:
+        """Elapsed time minus local queueing (rate-limit waits are not the provider's fault)"""
+        elapsed = time.perf_counter() - start
+        wait = self.wait_time.get(name)
+        return max(0.0, elapsed - wait()) if wait else elapsed
+
+    def _start_probes(self) -> None:
+        """Launch background probes for open providers whose cool-down has passed"""
+        for name, provider in self.providers.items():
+            probe = self.probes.get(name)
+            if probe is None:
+                continue
+            with self._lock:
+                if name in self._probing:
+                    continue
+                if not provider.breaker.start_probe():
+                    continue
+                self._probing.add(name)
+            threading.Thread(target=self._run_probe, args=(provider, probe),
+                             name=f"probe-{name}-{self.operation}", daemon=True).start()
+
+    def _run_probe(self, provider: ProviderHealth, probe: Callable[[], Any]) -> None:
+        """Probe an open provider and feed the outcome to its breaker"""
+        logger.info(f"Probing {provider.name} ({self.operation})")
+        self._clear_wait(provider.name)
+        start = time.perf_counter()
+        try:
+            result = probe()
+        except Exception as e:
+            logger.error(f"Probe of {provider.name} raised: {e}")
+            result = None
+        finally:
+            with self._lock:
+                self._probing.discard(provider.name)
+        provider.record(self.probe_is_valid(result), self._latency(provider.name, start))
+
+    def get_status(self) -> Dict:
+        """
+        Routing status
+
+        Returns:
+            Dict with the current route order and per-provider health
+        """
+        with self._lock:
+            hedging = {
+                'hedged_calls': self.hedged_calls,
+                'hedges_fired': self.hedges_fired,
+                'hedges_won': self.hedges_won,
+                'fire_rate': round(self.hedges_fired / self.hedged_calls, 3) if self.hedged_calls else None,
+                'win_rate': round(self.hedges_won / self.hedges_fired, 3) if self.hedges_fired else None,
+            }
+        return {
+            'route': [provider.name for provider in self.order()],
+            'providers': {name: provider.get_status() for name, provider in self.providers.items()},
+            'hedging': hedging,
+            'timestamp': datetime.now().isoformat()
+        }
@@ -0,0 +1,333 @@
+"""
+Rate Limiter Module: Token-bucket rate limiting shared by all API consumers
+- One limiter per provider name per process (get_limiter), so the collector and
+  TickerAnalyzer draw from the same Finnhub budget
+- Optional cross-process mode: bucket state in SQLite (set RATE_LIMIT_DB, e.g.
+  data/rate_limits.db) when the collector and API server run as separate processes
+- Priority lanes: 'interactive' callers (e.g. /analyze) are served before
+  'background' callers (the collector) whenever both are waiting
+- Metrics: queue depth per lane, wait counts and wait times
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Optional
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/rate_limiter.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 'interactive'
+BACKGROUND = 'background'
+PRIORITIES = {INTERACTIVE: 0, BACKGROUND: 1}
+
+
+class _LocalBucket:
+    """Token bucket held in process memory"""
+
+    name = 'memory'
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    def try_take(self) -> float:
+        """Take one token; returns 0 on success, else seconds until one is available"""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.refill_per_second
+
+    def available(self) -> float:
+        self._refill()
+        return self.tokens
+
+
+class _SQLiteBucket:
+    """Token bucket stored in SQLite so several processes share one budget"""
+
+    name = 'sqlite'
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS token_buckets (
+            name    TEXT PRIMARY KEY,
+            tokens  REAL NOT NULL,
+            updated REAL NOT NULL
+        )
+    """
+
+    def __init__(self, db_path: str, bucket_name: str, capacity: float, refill_per_second: float):
+        self.db_path = db_path
+        self.bucket_name = bucket_name
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._local = threading.local()
+        Path(os.path.dirname(db_path) or '.').mkdir(parents=True, exist_ok=True)
+        self._connect().execute(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection in autocommit mode (transactions are explicit)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def _update(self, take: bool) -> float:
+        """Refill (wall clock, shared across processes) and optionally take a token"""
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            now = time.time()
+            row = conn.execute(
+                'SELECT tokens, updated FROM token_buckets WHERE name = ?', (self.bucket_name,)
+            ).fetchone()
+            tokens = self.capacity if row is None else min(
+                self.capacity, row[0] + max(0.0, now - row[1]) * self.refill_per_second
+            )
+
+            result = tokens
+            if take:
+                if tokens >= 1:
+                    tokens -= 1
+                    result = 0.0
+                else:
+                    result = (1 - tokens) / self.refill_per_second
+
+            conn.execute(
+                'INSERT OR REPLACE INTO token_buckets (name, tokens, updated) VALUES (?, ?, ?)',
+                (self.bucket_name, tokens, now)
+            )
+            conn.execute('COMMIT')
+            return result
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+    def try_take(self) -> float:
+        return self._update(take=True)
+
+    def available(self) -> float:
+        return self._update(take=False)
+
+
+class RateLimiter:
+    """
+    Blocking token bucket with priority lanes
+
+    Admits at most `rate` calls in any `per`-second window: the bucket holds
+    `burst` tokens and refills at (rate - burst) / per tokens per second.
+    """
+
+    def __init__(self, name: str, rate: int = 60, per: float = 60.0, burst: int = 5,
+                 db_path: Optional[str] = None):
+        """
+        Initialize rate limiter
+
+        Args:
+            name: Limiter name (bucket key in cross-process mode)
+            rate: Max calls per window
+            per: Window length in seconds
+            burst: Calls that may go out back-to-back after an idle period
+            db_path: SQLite file for cross-process sharing (None = this process only)
+        """
+        if not 0 < burst < rate:
+            raise ValueError(f"burst must be between 1 and rate - 1 (got {burst})")
+
+        self.name = name
+        self.rate = rate
+        self.per = per
+        self.burst = burst
+
+        refill = (rate - burst) / per
+        if db_path:
+            self._bucket = _SQLiteBucket(db_path, name, burst, refill)
+        else:
+            self._bucket = _LocalBucket(burst, refill)
+
+        self._cond = threading.Condition()
+        self._waiters = []              # heap of (priority rank, seq)
+        self._seq = itertools.count()
+        self._queue_depth = {lane: 0 for lane in PRIORITIES}
+        self._stats = {lane: {'acquired': 0, 'waited': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+                       for lane in PRIORITIES}
+        self._calls = deque()           # monotonic times of recent acquisitions (this process)
+
+        logger.info(f"Rate limiter '{name}': {rate}/{per:.0f}s, burst {burst} ({self._bucket.name})")
+
+    def acquire(self, priority: str = BACKGROUND, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Block until a call may be made
+
+        Args:
+            priority: 'interactive' or 'background'
+            timeout: Max seconds to wait (None = wait as long as needed)
+
+        Returns:
+            Seconds spent waiting, or None if timeout expired
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        start = time.monotonic()
+        deadline = start + timeout if timeout is not None else None
+        ticket = (PRIORITIES[priority], next(self._seq))
+
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            self._queue_depth[priority] += 1
+            try:
+                while True:
+                    # Only the head of the queue (highest priority, then FIFO) may take a token
+                    wait = None
+                    if self._waiters[0] == ticket:
+                        wait = self._bucket.try_take()
+                        if wait == 0:
+                            heapq.heappop(self._waiters)
+                            break
+
+                    if deadline is not None:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._waiters.remove(ticket)
+                            heapq.heapify(self._waiters)
+                            logger.warning(f"Rate limiter '{self.name}': {priority} call timed out")
+                            return None
+                        wait = remaining if wait is None else min(wait, remaining)
+
+                    self._cond.wait(wait)
+            finally:
+                self._queue_depth[priority] -= 1
+                # Let the next head re-check
+                self._cond.notify_all()
+
+            waited = time.monotonic() - start
+            self._record(priority, waited)
+            return waited
+
+    def _record(self, priority: str, waited: float) -> None:
+        """Update metrics after an acquisition (caller holds the lock)"""
+        stats = self._stats[priority]
+        stats['acquired'] += 1
+        if waited > 0.001:
+            stats['waited'] += 1
+            stats['total_wait'] += waited
+            stats['max_wait'] = max(stats['max_wait'], waited)
+
+        now = time.monotonic()
+        self._calls.append(now)
+        while self._calls and now - self._calls[0] >= self.per:
+            self._calls.popleft()
+
+        if len(self._calls) >= self.rate - self.burst:
+            logger.warning(f"Rate limiter '{self.name}': {len(self._calls)}/{self.rate} calls in the last "
+                           f"{self.per:.0f}s - approaching rate limit")
+
+        if waited >= 1:
+            logger.info(f"Rate limiter '{self.name}': {priority} call waited {waited:.1f}s")
+
+    def calls_in_window(self) -> int:
+        """
+        Calls made by this process in the last window
+
+        Returns:
+            Call count
+        """
+        with self._cond:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.per:
+                self._calls.popleft()
+            return len(self._calls)
+
+    def seconds_until_window_reset(self) -> float:
+        """
+        Seconds until the oldest call in the window drops out
+
+        Returns:
+            Seconds (0 if no calls in the window)
+        """
+        with self._cond:
+            if not self._calls:
+                return 0.0
+            return max(0.0, self.per - (time.monotonic() - self._calls[0]))
+
+    def get_metrics(self) -> Dict:
+        """
+        Limiter metrics for status output
+
+        Returns:
+            Dict with configuration, queue depth and per-lane wait statistics
+        """
+        calls = self.calls_in_window()
+        with self._cond:
+            lanes = {}
+            for lane, stats in self._stats.items():
+                lanes[lane] = {
+                    'acquired': stats['acquired'],
+                    'waited': stats['waited'],
+                    'avg_wait_seconds': round(stats['total_wait'] / stats['waited'], 3) if stats['waited'] else 0.0,
+                    'max_wait_seconds': round(stats['max_wait'], 3),
+                }
+            return {
+                'name': self.name,
+                'rate': self.rate,
+                'per_seconds': self.per,
+                'burst': self.burst,
+                'backend': self._bucket.name,
+                'tokens_available': round(self._bucket.available(), 2),
+                'calls_in_window': calls,
+                'queue_depth': dict(self._queue_depth),
+                'lanes': lanes,
+            }
+
+
+# Process-wide limiters by name
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str, rate: int = 60, per: float = 60.0, burst: int = 5) -> RateLimiter:
+    """
+    Get or create the shared limiter for an API provider
+
+    The first call for a name fixes its configuration. Set RATE_LIMIT_DB to
+    share the budget across processes.
+
+    Args:
+        name: Provider name (e.g. 'finnhub')
+        rate: Max calls per window
+        per: Window length in seconds
+        burst: Back-to-back calls allowed after an idle period
+
+    Returns:
+        RateLimiter instance
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(name, rate=rate, per=per, burst=burst, db_path=os.getenv('RATE_LIMIT_DB'))
+            _limiters[name] = limiter
+        return limiter
@@ -0,0 +1,277 @@
+"""
+Refresh Scheduler Module: Per-ticker refresh timing for the data collector
+- Priority queue of (next_due, ticker) instead of one fixed interval for everything
+- Refresh tiers set the interval per market session; the collector builds them
+  from its priority_interval / update_interval / off_hours_interval arguments
+  (defaults: SPY/QQQ every 30s and other tickers every 150s during regular
+  hours, everything hourly off-hours)
+- Event-based wakeup: stop() and refresh requests interrupt the wait immediately
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from market_calendar import AFTER_HOURS, PRE_MARKET, REGULAR, MarketCalendar
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.FileHandler('logs/refresh_scheduler.log'),
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RefreshTier:
+    """
+    Refresh intervals (seconds) for a group of tickers, per market session
+    """
+    name: str
+    regular: int
+    extended: int
+    closed: int
+
+    def interval(self, session: str) -> int:
+        """Interval for a market session"""
+        if session == REGULAR:
+            return self.regular
+        if session in (PRE_MARKET, AFTER_HOURS):
+            return self.extended
+        return self.closed
+
+
+class RefreshScheduler:
+    """
+    Decides which tickers are due and sleeps until the next one is
+    """
+
+    def __init__(self, tiers: Dict[str, RefreshTier], default_tier: str,
+                 calendar: Optional[MarketCalendar] = None):
+        """
+        Initialize scheduler
+
+        Args:
+            tiers: Tier name -> RefreshTier
+            default_tier: Tier for tickers without an explicit assignment
+            calendar: Market calendar (default: NYSE hours)
+        """
+        if default_tier not in tiers:
+            raise ValueError(f"Unknown default tier: {default_tier}")
+
+        self.tiers = tiers
+        self.default_tier = default_tier
+        self.calendar = calendar or MarketCalendar()
+
+        self._heap = []                 # (due, seq, ticker); stale entries skipped lazily
+        self._due = {}                  # ticker -> current due time (epoch seconds)
+        self._assignments = {}          # ticker -> tier name
+        self._last_refresh = {}         # ticker -> epoch seconds
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+    # ==================== Membership ====================
+
+    def set_tier(self, ticker: str, tier: str) -> None:
+        """
+        Assign a ticker to a tier
+
+        Args:
+            ticker: Stock ticker symbol
+            tier: Tier name
+        """
+        if tier not in self.tiers:
+            raise ValueError(f"Unknown tier: {tier}")
+        with self._lock:
+            self._assignments[ticker] = tier
+
+    def sync(self, tickers: Iterable[str]) -> None:
+        """
+        Match the schedule to the watchlist: new tickers are due now,
+        removed tickers are dropped
+
+        Args:
+            tickers: Current watchlist
+        """
+        tickers = set(tickers)
+        now = time.time()
+        with self._lock:
+            for ticker in tickers - set(self._due):
+                self._push(ticker, now)
+                logger.info(f"Scheduled {ticker} ({self._assignments.get(ticker, self.default_tier)} tier)")
+            for ticker in set(self._due) - tickers:
+                del self._due[ticker]
+                self._last_refresh.pop(ticker, None)
+                logger.info(f"Unscheduled {ticker}")
+
+    def _push(self, ticker: str, due: float) -> None:
+        """Set ticker's due time (caller holds the lock)"""
+        self._due[ticker] = due
+        heapq.heappush(self._heap, (due, next(self._seq), ticker))
+
+    # ==================== Scheduling ====================
+
+    def interval(self, ticker: str, when: Optional[float] = None) -> int:
+        """
+        Current refresh interval for a ticker
+
+        Args:
+            ticker: Stock ticker symbol
+            when: Epoch seconds (default: now)
+
+        Returns:
+            Interval in seconds
+        """
+        session = self.calendar.session(datetime.fromtimestamp(when if when is not None else time.time()))
+        tier = self.tiers[self._assignments.get(ticker, self.default_tier)]
+        return tier.interval(session)
+
+    def pop_due(self, now: Optional[float] = None) -> List[str]:
+        """
+        Remove and return every ticker whose due time has passed
+
+        Popped tickers are not rescheduled until mark_refreshed() is called,
+        so a slow fetch never gets queued twice.
+
+        Args:
+            now: Epoch seconds (default: now)
+
+        Returns:
+            Due tickers, most overdue first
+        """
+        now = time.time() if now is None else now
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                when, _, ticker = heapq.heappop(self._heap)
+                if self._due.get(ticker) != when:
+                    continue  # superseded or removed
+                self._due[ticker] = None
+                due.append(ticker)
+        return due
+
+    def mark_refreshed(self, ticker: str, now: Optional[float] = None) -> None:
+        """
+        Record a refresh and schedule the next one
+
+        Off-hours refreshes are pulled forward to the next session change so
+        tickers switch to the faster tier as soon as the market opens.
+
+        Args:
+            ticker: Stock ticker symbol
+            now: Epoch seconds (default: now)
+        """
+        now = time.time() if now is None else now
+        next_due = now + self.interval(ticker, now)
+        boundary = self.calendar.next_session_change(datetime.fromtimestamp(now)).timestamp()
+        next_due = min(next_due, boundary)
+
+        with self._lock:
+            if ticker not in self._due:
+                return  # removed from the watchlist while it was being fetched
+            self._last_refresh[ticker] = now
+            self._push(ticker, next_due)
+
+    def request_refresh(self, ticker: Optional[str] = None) -> None:
+        """
+        Make one ticker (or all) due immediately and wake the loop
+
+        Args:
+            ticker: Stock ticker symbol, or None for the whole watchlist
+        """
+        now = time.time()
+        with self._lock:
+            tickers = [ticker] if ticker is not None else list(self._due)
+            for symbol in tickers:
+                # Unknown tickers wait for sync(); a ticker mid-fetch (due None) stays as is
+                if self._due.get(symbol) is not None:
+                    self._push(symbol, now)
+        self.wake()
+
+    def next_due(self) -> Optional[float]:
+        """
+        Earliest scheduled due time
+
+        Returns:
+            Epoch seconds, or None if nothing is scheduled
+        """
+        with self._lock:
+            while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            return self._heap[0][0] if self._heap else None
+
+    def wait(self, max_wait: Optional[float] = None) -> bool:
+        """
+        Sleep until the next ticker is due, a refresh is requested or wake() is called
+
+        Args:
+            max_wait: Upper bound in seconds (e.g. to re-check the watchlist)
+
+        Returns:
+            True if woken early by an event
+        """
+        next_due = self.next_due()
+        timeout = max(0.0, next_due - time.time()) if next_due is not None else max_wait
+        if max_wait is not None and timeout is not None:
+            timeout = min(timeout, max_wait)
+
+        woken = self._wakeup.wait(timeout)
+        self._wakeup.clear()
+        return woken
+
+    def sleep(self, seconds: float) -> bool:
+        """
+        Fixed-length sleep that wake() can interrupt (e.g. error back-off)
+
+        Args:
+            seconds: Sleep duration
+
+        Returns:
+            True if woken early by an event
+        """
+        woken = self._wakeup.wait(seconds)
+        self._wakeup.clear()
+        return woken
+
+    def wake(self) -> None:
+        """Interrupt wait() (used by stop and refresh requests)"""
+        self._wakeup.set()
+
+    # ==================== Status ====================
+
+    def get_status(self) -> Dict:
+        """
+        Schedule snapshot for status output
+
+        Returns:
+            Dict with session, tiers and per-ticker next/last refresh
+        """
+        now = time.time()
+        with self._lock:
+            tickers = {}
+            for ticker, due in sorted(self._due.items()):
+                last = self._last_refresh.get(ticker)
+                tickers[ticker] = {
+                    'tier': self._assignments.get(ticker, self.default_tier),
+                    'next_refresh': datetime.fromtimestamp(due).isoformat() if due is not None else 'in progress',
+                    'last_refresh': datetime.fromtimestamp(last).isoformat() if last else None,
+                }
+
+        session = self.calendar.session()
+        return {
+            'market_session': session,
+            'tiers': {name: tier.interval(session) for name, tier in self.tiers.items()},
+            'tickers': tickers,
+            'queued': sum(1 for entry in tickers.values() if entry['next_refresh'] != 'in progress'),
+            'timestamp': datetime.fromtimestamp(now).isoformat()
+        }
@@ -0,0 +1,401 @@
+"""
+Response Cache Module: Disk-backed cache for HTTP responses over immutable history
+- Date ranges split into sealed past days (stored one row per day, served from
+  cache until evicted) and the open current day (always fetched live)
+- Weekends and exchange holidays are sealed as empty; a trading day without
+  data is only sealed as empty once it is EMPTY_SEAL_LAG old, so a bar the
+  provider publishes late is still picked up
+- Conditional revalidation (ETag / If-Modified-Since) for live responses when the
+  server sends validators - an unchanged response costs a 304 instead of a body
+- SQLite storage with a byte budget and least-recently-used eviction
+
+Imported by api_client (scout), so it only logs through its module logger.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import requests
+
+from market_calendar import EXCHANGE_TZ, MarketCalendar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# How long a trading day without data stays unsealed (refetched) before it is sealed as empty
+EMPTY_SEAL_LAG = timedelta(days=2)
+
+_calendar = MarketCalendar()
+
+
+def first_unsealed_day(now: Optional[datetime] = None) -> date:
+    """
+    First day whose data may still change
+
+    Today in exchange time or in UTC, whichever is earlier: providers stamp
+    bars in either, and a day is only final once it is over in both.
+
+    Args:
+        now: Current time (default: now)
+
+    Returns:
+        date
+    """
+    now = now or datetime.now(timezone.utc)
+    return min(now.astimezone(EXCHANGE_TZ).date(), now.astimezone(timezone.utc).date())
+
+
+def iter_days(start: date, end: date) -> Iterable[date]:
+    """Days from start to end, inclusive"""
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+class ResponseCache:
+    """
+    SQLite-backed response cache shared by threads (and processes) using one file
+
+    Bodies are stored as JSON. Reads refresh an entry's access time; when the
+    stored bytes exceed max_bytes the least recently used entries are evicted
+    down to 90% of the budget.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key           TEXT PRIMARY KEY,
+            body          TEXT NOT NULL,
+            sealed        INTEGER NOT NULL,
+            etag          TEXT,
+            last_modified TEXT,
+            size          INTEGER NOT NULL,
+            stored_at     REAL NOT NULL,
+            accessed_at   REAL NOT NULL
+        )
+    """
+    INDEX = "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize response cache
+
+        Args:
+            db_path: SQLite file
+            max_bytes: Stored body budget in bytes
+        """
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {'day_hits': 0, 'day_misses': 0, 'revalidated': 0, 'stored': 0, 'evicted': 0}
+
+        Path(os.path.dirname(self.db_path) or '.').mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.execute(self.SCHEMA)
+        conn.execute(self.INDEX)
+        self._bytes = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def _connect(self) -> sqlite3.Connection:
+        """Per-thread connection in autocommit mode"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    # ==================== Entries ====================
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up an entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Dict with body, sealed, etag, last_modified - or None
+        """
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT body, sealed, etag, last_modified FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+        return {'body': json.loads(row[0]), 'sealed': bool(row[1]), 'etag': row[2], 'last_modified': row[3]}
+
+    def put(self, key: str, body: Any, sealed: bool = False, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """
+        Store an entry
+
+        Args:
+            key: Cache key
+            body: JSON-serializable body
+            sealed: True if the body can never change
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        self.put_many({key: body}, sealed=sealed, etag=etag, last_modified=last_modified)
+
+    def put_many(self, bodies: Dict[str, Any], sealed: bool = False, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None) -> None:
+        """Store several entries in one transaction"""
+        if not bodies:
+            return
+        now = time.time()
+        rows = []
+        for key, body in bodies.items():
+            text = json.dumps(body, separators=(',', ':'))
+            rows.append((key, text, int(sealed), etag, last_modified, len(text), now, now))
+
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            replaced = conn.execute(
+                f"SELECT COALESCE(SUM(size), 0) FROM responses WHERE key IN ({','.join('?' * len(rows))})",
+                [row[0] for row in rows]
+            ).fetchone()[0]
+            conn.executemany('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        with self._lock:
+            self._bytes += sum(row[5] for row in rows) - replaced
+            self._stats['stored'] += len(rows)
+            over_budget = self._bytes > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Drop least recently used entries until under 90% of the byte budget
+
+        Returns:
+            Number of entries evicted
+        """
+        conn = self._connect()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Recount: other processes may share the file
+            total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+            target = int(self.max_bytes * 0.9)
+            evicted = 0
+            if total > target:
+                cursor = conn.execute('SELECT key, size FROM responses ORDER BY accessed_at')
+                doomed = []
+                for key, size in cursor:
+                    if total <= target:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                cursor.close()
+                conn.executemany('DELETE FROM responses WHERE key = ?', doomed)
+                evicted = len(doomed)
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+
+        with self._lock:
+            self._bytes = total
+            self._stats['evicted'] += evicted
+        if evicted:
+            logger.info(f"Response cache: evicted {evicted} entries ({total / 1e6:.1f} MB kept)")
+        return evicted
+
+    # ==================== Sealed days ====================
+
+    @staticmethod
+    def day_key(namespace: str, day: date) -> str:
+        """Cache key for one day of a ranged resource"""
+        return f"{namespace}|{day.isoformat()}"
+
+    def plan_range(self, namespace: str, start: date, end: date,
+                   now: Optional[datetime] = None) -> Tuple[Dict[date, Any], Optional[date]]:
+        """
+        Split a date range into cached sealed days and the part to fetch
+
+        Args:
+            namespace: Resource identity (e.g. 'finnhub|stock/candle|AAPL|D')
+            start: First day of the range
+            end: Last day of the range (inclusive)
+            now: Current time (default: now)
+
+        Returns:
+            Tuple of (cached day bodies, first day to fetch through `end` or None
+            if every day in the range is sealed and cached)
+        """
+        unsealed = first_unsealed_day(now)
+        sealed_days = list(iter_days(start, min(end, unsealed - timedelta(days=1))))
+
+        cached = {}
+        if sealed_days:
+            keys = {self.day_key(namespace, day): day for day in sealed_days}
+            conn = self._connect()
+            placeholders = ','.join('?' * len(keys))
+            rows = conn.execute(
+                f"SELECT key, body FROM responses WHERE sealed = 1 AND key IN ({placeholders})", list(keys)
+            ).fetchall()
+            for key, body in rows:
+                cached[keys[key]] = json.loads(body)
+            if rows:
+                conn.execute(
+                    f"UPDATE responses SET accessed_at = ? WHERE key IN ({placeholders})",
+                    [time.time()] + list(keys)
+                )
+
+        missing = [day for day in sealed_days if day not in cached]
+        with self._lock:
+            self._stats['day_hits'] += len(cached)
+            self._stats['day_misses'] += len(missing)
+
+        if missing:
+            fetch_from = missing[0]
+        elif end >= unsealed:
+            fetch_from = max(start, unsealed)
+        else:
+            fetch_from = None
+        return cached, fetch_from
+
+    def seal_days(self, namespace: str, start: date, end: date, by_day: Dict[date, Any],
+                  empty: Any = None, now: Optional[datetime] = None) -> int:
+        """
+        Store fetched days that are sealed
+
+        Sealed days with data are stored as fetched. Days without data are
+        stored as `empty` when the exchange was closed (weekends, holidays) or
+        the day is at least EMPTY_SEAL_LAG old; a recent trading day without
+        data stays unsealed so a late bar is fetched on the next request.
+
+        Args:
+            namespace: Resource identity
+            start: First fetched day
+            end: Last fetched day (inclusive)
+            by_day: Fetched bodies by day
+            empty: Body for days without data
+            now: Current time (default: now)
+
+        Returns:
+            Number of days stored
+        """
+        unsealed = first_unsealed_day(now)
+        last_sealed = min(end, unsealed - timedelta(days=1))
+        bodies = {}
+        for day in iter_days(start, last_sealed):
+            if day in by_day:
+                bodies[self.day_key(namespace, day)] = by_day[day]
+            elif not _calendar.is_trading_day(day) or day <= unsealed - EMPTY_SEAL_LAG:
+                bodies[self.day_key(namespace, day)] = empty
+        self.put_many(bodies, sealed=True)
+        return len(bodies)
+
+    # ==================== Conditional requests ====================
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """
+        Validator headers for a live request
+
+        Args:
+            key: Cache key of the previous response
+
+        Returns:
+            If-None-Match / If-Modified-Since headers (empty if nothing cached)
+        """
+        entry = self.get(key)
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def resolve(self, key: str, response: requests.Response) -> Any:
+        """
+        Body for a response to a conditional request
+
+        A 304 returns the cached body; a new body is stored when the server
+        sent validators.
+
+        Args:
+            key: Cache key
+            response: Successful response
+
+        Returns:
+            Response body (parsed JSON)
+        """
+        if response.status_code == 304:
+            entry = self.get(key)
+            if entry is not None:
+                with self._lock:
+                    self._stats['revalidated'] += 1
+                return entry['body']
+            # Entry evicted between the request and now
+            raise requests.exceptions.HTTPError('304 Not Modified without a cached body', response=response)
+
+        body = response.json()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self.put(key, body, etag=etag, last_modified=last_modified)
+        return body
+
+    def get_stats(self) -> Dict:
+        """
+        Cache statistics for status output
+
+        Returns:
+            Dict with day hit/miss counts, revalidations, evictions and size
+        """
+        row = self._connect().execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses').fetchone()
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats['day_hits'] + stats['day_misses']
+        stats.update({
+            'db_path': self.db_path,
+            'entries': row[0],
+            'bytes': row[1],
+            'max_bytes': self.max_bytes,
+            'day_hit_pct': round(100.0 * stats['day_hits'] / lookups, 1) if lookups else 0.0,
+        })
+        return stats
+
+
+# Process-wide caches by name
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(name: str, db_path: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES) -> ResponseCache:
+    """
+    Get or create the shared response cache for a provider
+
+    The first call for a name fixes its configuration.
+
+    Args:
+        name: Provider name (e.g. 'finnhub')
+        db_path: SQLite file (default: data/http_cache_<name>.db)
+        max_bytes: Stored body budget in bytes
+
+    Returns:
+        ResponseCache instance
+    """
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = ResponseCache(db_path or f'data/http_cache_{name}.db', max_bytes=max_bytes)
+            _caches[name] = cache
+        return cache
@@ -0,0 +1,199 @@
+"""
+Singleflight Module: Coalesce duplicate in-flight requests
+- Concurrent callers asking for the same key wait on one request and share its result
+- Successful results are reused for a short memo window after completion, so a
+  burst that arrives just after a fetch finishes does not refetch
+- Failures are shared with callers already waiting but never memoized
+- One group per provider per process (get_group), so the collector and
+  TickerAnalyzer coalesce with each other
+
+Imported by api_client (scout), so it only logs through its module logger.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One in-flight call and its outcome"""
+
+    __slots__ = ('done', 'result', 'error', 'finished_at')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.finished_at = None
+
+
+class SingleFlight:
+    """
+    Request coalescing keyed by an arbitrary hashable key
+
+    Results are shared between callers, not copied: callers must treat them as
+    read-only.
+    """
+
+    def __init__(self, name: str, memo_seconds: float = 1.0, max_memo: int = 1024):
+        """
+        Initialize singleflight group
+
+        Args:
+            name: Group name (for logs and status)
+            memo_seconds: Default seconds a successful result is reused after completion
+            max_memo: Max memoized results kept (expired entries are pruned first)
+        """
+        self.name = name
+        self.memo_seconds = memo_seconds
+        self.max_memo = max_memo
+
+        self._lock = threading.Lock()
+        self._inflight = {}     # key -> _Flight
+        self._memo = {}         # key -> (expires_at monotonic, result)
+        self._stats = {'calls': 0, 'executed': 0, 'coalesced': 0, 'memo_hits': 0, 'errors': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], memo_seconds: Optional[float] = None,
+           is_valid: Callable[[Any], bool] = lambda result: result is not None) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers with the same key
+
+        Args:
+            key: Request identity (e.g. (endpoint, symbol, params))
+            fn: The actual request
+            memo_seconds: Override the group's memo window for this key (0 disables)
+            is_valid: Whether a result may be memoized
+
+        Returns:
+            Tuple of (result, shared) - shared is True if this caller did not run fn
+        """
+        memo_seconds = self.memo_seconds if memo_seconds is None else memo_seconds
+
+        with self._lock:
+            self._stats['calls'] += 1
+
+            memo = self._memo.get(key)
+            if memo is not None:
+                if memo[0] > time.monotonic():
+                    self._stats['memo_hits'] += 1
+                    return memo[1], True
+                del self._memo[key]
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+                self._stats['executed'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = fn()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            flight.finished_at = time.monotonic()
+            with self._lock:
+                del self._inflight[key]
+                if flight.error is not None or not is_valid(flight.result):
+                    self._stats['errors'] += 1
+                elif memo_seconds > 0:
+                    self._remember(key, flight.result, flight.finished_at + memo_seconds)
+            flight.done.set()
+
+        return flight.result, False
+
+    def _remember(self, key: Hashable, result: Any, expires_at: float) -> None:
+        """Store a memoized result (caller holds the lock)"""
+        if len(self._memo) >= self.max_memo:
+            now = time.monotonic()
+            for stale in [k for k, (expiry, _) in self._memo.items() if expiry <= now]:
+                del self._memo[stale]
+            if len(self._memo) >= self.max_memo:
+                # Still full: drop the entry closest to expiring
+                del self._memo[min(self._memo, key=lambda k: self._memo[k][0])]
+        self._memo[key] = (expires_at, result)
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Drop a memoized result so the next call refetches
+
+        Args:
+            key: Request identity
+        """
+        with self._lock:
+            self._memo.pop(key, None)
+
+    def clear(self, match: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """
+        Drop memoized results
+
+        Args:
+            match: Predicate selecting keys to drop (None = all)
+
+        Returns:
+            Number of results dropped
+        """
+        with self._lock:
+            doomed = [key for key in self._memo if match is None or match(key)]
+            for key in doomed:
+                del self._memo[key]
+            return len(doomed)
+
+    def get_stats(self) -> Dict:
+        """
+        Coalescing statistics for status output
+
+        Returns:
+            Dict with call counts, requests saved and current in-flight/memo sizes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            saved = stats['coalesced'] + stats['memo_hits']
+            stats.update({
+                'name': self.name,
+                'memo_seconds': self.memo_seconds,
+                'requests_saved': saved,
+                'saved_pct': round(100.0 * saved / stats['calls'], 1) if stats['calls'] else 0.0,
+                'in_flight': len(self._inflight),
+                'memoized': len(self._memo),
+            })
+            return stats
+
+
+# Process-wide groups by name
+_groups = {}
+_groups_lock = threading.Lock()
+
+
+def get_group(name: str, memo_seconds: float = 1.0) -> SingleFlight:
+    """
+    Get or create the shared singleflight group for a provider
+
+    The first call for a name fixes its configuration.
+
+    Args:
+        name: Provider name (e.g. 'finnhub')
+        memo_seconds: Default memo window in seconds
+
+    Returns:
+        SingleFlight instance
+    """
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = SingleFlight(name, memo_seconds=memo_seconds)
+            _groups[name] = group
+            logger.info(f"Singleflight group '{name}' created (memo {memo_seconds:.1f}s)")
+        return group